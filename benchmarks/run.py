@@ -0,0 +1,495 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import workloads  # noqa: E402
+from adn_v2.engine import ADNEngine, evaluate_defense  # noqa: E402
+from adn_v2.metrics import MetricsRegistry  # noqa: E402
+from adn_v2.models import PolicyDecision  # noqa: E402
+from adn_v3 import ADNv3  # noqa: E402
+from adn_v3.contracts.v3_hash import canonical_sha256  # noqa: E402
+from adn_v3.observability import LatencyHistogram  # noqa: E402
+from adn_v3.v4.binary_envelope import decode_binary_envelope, encode_binary_envelope  # noqa: E402
+from adn_v3.v4.crypto_verdict import validate_crypto_verdict_envelope  # noqa: E402
+from adn_v3.v4.merkle_batch import VerifiedRootCache, sign_verdict_batch, validate_batched_crypto_verdict_envelope  # noqa: E402
+from adn_v3.v4.oqs_mldsa_backend import OQS_ML_DSA_MECHANISM, OqsMlDsaBackend  # noqa: E402
+from adn_v3.v4.real_crypto_backend import encode_binary_signature_material  # noqa: E402
+from adn_v3.v4.signing import (  # noqa: E402
+    build_test_signature_entry,
+    parse_json_no_duplicate_keys,
+    to_canonical_json,
+    verify_signature_bundle,
+    verify_test_only_signature,
+)
+from adn_v3.v4.trust_profile import CLASSICAL_ED25519, ML_DSA, compile_trust_profile  # noqa: E402
+
+"""
+ADN benchmark suite – stdlib timeit / perf_counter_ns, no network.
+
+Usage:
+
+    python benchmarks/run.py                          # run everything, print JSON
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json --threshold 0.25
+    python benchmarks/run.py --save-baseline benchmarks/baseline.json
+
+Each case reports min and median nanoseconds per operation over several
+repeats. With --baseline, any case whose median exceeds the stored median
+by more than --threshold (fraction) is reported as a regression and the
+process exits with status 1.
+"""
+
+DEFAULT_THRESHOLD = 0.25
+SCHEMA = "adn.bench.v1"
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    name: str
+    setup: Callable[[], Callable[[], Any] | None]  # returns the timed callable, or None to skip
+    number: int
+
+
+BENCHMARKS: list[BenchCase] = []
+
+
+def bench(name: str, *, number: int) -> Callable[[Callable[[], Callable[[], Any] | None]], Callable[[], Callable[[], Any] | None]]:
+    def register(setup: Callable[[], Callable[[], Any] | None]) -> Callable[[], Callable[[], Any] | None]:
+        BENCHMARKS.append(BenchCase(name=name, setup=setup, number=number))
+        return setup
+
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Shield v3 gate
+# ---------------------------------------------------------------------------
+
+
+def _v3_case(size: str) -> Callable[[], Any]:
+    engine = ADNv3()
+    request = workloads.v3_request(size)
+    return lambda: engine.evaluate(request)
+
+
+@bench("v3_evaluate_small", number=2000)
+def bench_v3_evaluate_small() -> Callable[[], Any]:
+    return _v3_case("small")
+
+
+@bench("v3_evaluate_typical", number=500)
+def bench_v3_evaluate_typical() -> Callable[[], Any]:
+    return _v3_case("typical")
+
+
+@bench("v3_evaluate_small_with_histogram", number=2000)
+def bench_v3_evaluate_observed() -> Callable[[], Any]:
+    engine = ADNv3(observer=LatencyHistogram())
+    request = workloads.v3_request("small")
+    return lambda: engine.evaluate(request)
+
+
+@bench("v3_evaluate_max", number=20)
+def bench_v3_evaluate_max() -> Callable[[], Any]:
+    return _v3_case("max")
+
+
+@bench("v3_canonical_sha256_typical", number=2000)
+def bench_canonical_sha256() -> Callable[[], Any]:
+    payload = workloads.v3_request("typical")
+    return lambda: canonical_sha256(payload)
+
+
+# ---------------------------------------------------------------------------
+# v2 defense engine
+# ---------------------------------------------------------------------------
+
+
+@bench("v2_evaluate_defense_batch10_history100k", number=200)
+def bench_evaluate_defense_long_lived() -> Callable[[], Any]:
+    # The state grows by one batch per call; 100k history dominates that drift.
+    state = workloads.long_lived_defense_state(100_000)
+    batch = workloads.defense_events(10, seed=workloads.SEED + 1)
+    return lambda: evaluate_defense(batch, state=state)
+
+
+@bench("v2_evaluate_defense_fresh_batch50", number=2000)
+def bench_evaluate_defense_fresh() -> Callable[[], Any]:
+    batch = workloads.defense_events(50)
+    return lambda: evaluate_defense(batch)
+
+
+class _FirstSignalPolicy:
+    """Minimal policy stage so the stream benchmark measures the pipeline plumbing."""
+
+    def decide(self, signals: list[Any]) -> PolicyDecision:
+        first = signals[0]
+        return PolicyDecision(level=first.level, score=first.score, reason="bench", actions=[])
+
+
+@bench("v2_process_stream_1k_raw", number=20)
+def bench_process_stream() -> Callable[[], Any]:
+    engine = ADNEngine(node_id="bench", policy_engine=_FirstSignalPolicy())
+    feed = workloads.raw_telemetry(1000)
+
+    def drain() -> None:
+        for _ in engine.process_stream(feed):
+            pass
+
+    return drain
+
+
+@bench("v2_process_stream_1k_default_policy", number=20)
+def bench_process_stream_default_policy() -> Callable[[], Any]:
+    # Same feed through the real PolicyEngine (decision table + memoized signatures).
+    engine = ADNEngine(node_id="bench")
+    feed = workloads.raw_telemetry(1000)
+
+    def drain() -> None:
+        for _ in engine.process_stream(feed):
+            pass
+
+    return drain
+
+
+# ---------------------------------------------------------------------------
+# Metrics registry (target: < 1µs per recorded event)
+# ---------------------------------------------------------------------------
+
+
+@bench("metrics_counter_inc_labelled", number=100_000)
+def bench_metrics_counter() -> Callable[[], Any]:
+    counter = MetricsRegistry().counter("bench_total", "bench", ("decision",))
+    labels = ("ALLOW",)
+    return lambda: counter.inc(labels=labels)
+
+
+@bench("metrics_histogram_observe", number=100_000)
+def bench_metrics_histogram() -> Callable[[], Any]:
+    histogram = MetricsRegistry().histogram("bench_severity", "bench")
+    return lambda: histogram.observe(0.55)
+
+
+# ---------------------------------------------------------------------------
+# v4 signing / verification
+# ---------------------------------------------------------------------------
+
+
+@bench("v4_to_canonical_json", number=2000)
+def bench_to_canonical_json() -> Callable[[], Any]:
+    payload = workloads.unsigned_verdict_payload()
+    return lambda: to_canonical_json(payload)
+
+
+# Real-size envelope text (3309-byte ML-DSA-65 signature, ~6KB of JSON);
+# _plain is the json.loads floor the duplicate-key check is measured against.
+@bench("v4_parse_envelope_mldsa", number=5000)
+def bench_parse_envelope() -> Callable[[], Any]:
+    text = workloads.real_size_envelope_json()
+    return lambda: parse_json_no_duplicate_keys(text)
+
+
+@bench("v4_parse_envelope_mldsa_plain", number=5000)
+def bench_parse_envelope_plain() -> Callable[[], Any]:
+    text = workloads.real_size_envelope_json()
+    return lambda: json.loads(text)
+
+
+@bench("v4_binary_encode_envelope_mldsa", number=2000)
+def bench_binary_encode_envelope() -> Callable[[], Any]:
+    envelope = json.loads(workloads.real_size_envelope_json())
+    return lambda: encode_binary_envelope(envelope)
+
+
+@bench("v4_binary_decode_envelope_mldsa", number=2000)
+def bench_binary_decode_envelope() -> Callable[[], Any]:
+    data = encode_binary_envelope(json.loads(workloads.real_size_envelope_json()))
+    return lambda: decode_binary_envelope(data)
+
+
+@bench("v4_parse_trust_profile500", number=50)
+def bench_parse_trust_profile() -> Callable[[], Any]:
+    text = json.dumps(workloads.large_trust_profile(500))
+    return lambda: parse_json_no_duplicate_keys(text)
+
+
+def _bundle_case(extra_entries: int, *, compiled: bool = False) -> Callable[[], Any]:
+    envelope = workloads.signed_test_envelope()
+    profile: Any = workloads.large_trust_profile(extra_entries)
+    if compiled:
+        profile = compile_trust_profile(profile)
+    bundle = envelope["signature_bundle"]
+    digest = envelope["signed_payload_hash"]
+    return lambda: verify_signature_bundle(
+        bundle,
+        expected_signed_payload_hash=digest,
+        trust_profile=profile,
+        verification_time=workloads.VERIFY_AT,
+        artifact_not_before=workloads.NOT_BEFORE,
+        artifact_not_after=workloads.NOT_AFTER,
+        verifier=verify_test_only_signature,
+    )
+
+
+@bench("v4_verify_signature_bundle_profile3", number=1000)
+def bench_verify_bundle_small_profile() -> Callable[[], Any]:
+    return _bundle_case(0)
+
+
+@bench("v4_verify_signature_bundle_profile500", number=50)
+def bench_verify_bundle_large_profile() -> Callable[[], Any]:
+    return _bundle_case(500)
+
+
+@bench("v4_verify_signature_bundle_compiled500", number=2000)
+def bench_verify_bundle_compiled_profile() -> Callable[[], Any]:
+    # Same 500+-entry registry, validated once up front as `adn-v4 verify` does.
+    return _bundle_case(500, compiled=True)
+
+
+def _validate_case(envelope: dict[str, Any]) -> Callable[[], Any]:
+    profile = compile_trust_profile(workloads.large_trust_profile(0))
+
+    def run() -> Any:
+        try:
+            return validate_crypto_verdict_envelope(
+                envelope,
+                expected_context_hash=workloads.CONTEXT_HASH,
+                trust_profile=profile,
+                verification_time=workloads.VERIFY_AT,
+                verifier=verify_test_only_signature,
+            )
+        except ValueError as exc:
+            return exc
+
+    return run
+
+
+@bench("v4_validate_envelope", number=2000)
+def bench_validate_envelope() -> Callable[[], Any]:
+    return _validate_case(workloads.signed_test_envelope())
+
+
+# Rejected by the metadata budgets before any walk past them: time must not
+# grow with the size of the hostile input (10k vs 1M nodes). long1k is the
+# widest dict the default max_nodes admits, holding 4MB of strings.
+@bench("v4_validate_hostile_metadata_deep10k", number=2000)
+def bench_validate_deep10k() -> Callable[[], Any]:
+    return _validate_case(workloads.hostile_envelope("deep", 10_000))
+
+
+@bench("v4_validate_hostile_metadata_deep1m", number=2000)
+def bench_validate_deep1m() -> Callable[[], Any]:
+    return _validate_case(workloads.hostile_envelope("deep", 1_000_000))
+
+
+@bench("v4_validate_hostile_metadata_wide10k", number=2000)
+def bench_validate_wide10k() -> Callable[[], Any]:
+    return _validate_case(workloads.hostile_envelope("wide", 10_000))
+
+
+@bench("v4_validate_hostile_metadata_wide1m", number=2000)
+def bench_validate_wide1m() -> Callable[[], Any]:
+    return _validate_case(workloads.hostile_envelope("wide", 1_000_000))
+
+
+@bench("v4_validate_hostile_metadata_long1k", number=2000)
+def bench_validate_long1k() -> Callable[[], Any]:
+    return _validate_case(workloads.hostile_envelope("long", 1_000))
+
+
+def _test_root_signer(digest: str) -> list[dict[str, Any]]:
+    return [build_test_signature_entry(algorithm=algorithm, signed_hash=digest) for algorithm in (CLASSICAL_ED25519, ML_DSA)]
+
+
+@bench("v4_merkle_sign_batch256", number=20)
+def bench_merkle_sign_batch() -> Callable[[], Any]:
+    # Per batch: 256 payload hashes + tree + proofs; one (TEST-ONLY) signature per algorithm.
+    payloads = workloads.unsigned_verdict_payloads(256)
+    return lambda: sign_verdict_batch(payloads, sign_root=_test_root_signer)
+
+
+@bench("v4_merkle_validate_batched_cached", number=2000)
+def bench_merkle_validate_cached() -> Callable[[], Any]:
+    verdicts = sign_verdict_batch(workloads.unsigned_verdict_payloads(256), sign_root=_test_root_signer)
+    profile = compile_trust_profile(workloads.large_trust_profile(0))
+    cache = VerifiedRootCache()
+    items = itertools.cycle(verdicts)
+    return lambda: validate_batched_crypto_verdict_envelope(
+        next(items),
+        expected_context_hash=workloads.CONTEXT_HASH,
+        trust_profile=profile,
+        verification_time=workloads.VERIFY_AT,
+        verifier=verify_test_only_signature,
+        root_cache=cache,
+    )
+
+
+class _StubSignature:
+    """In-memory stand-in for oqs.Signature: measures the backend wrapper, not liboqs."""
+
+    details = {"length_public_key": 1952, "length_signature": 3309}
+
+    def __init__(self, mechanism: str, secret_key: bytes | None = None) -> None:
+        self.mechanism = mechanism
+
+    def __enter__(self) -> "_StubSignature":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def sign(self, message: bytes) -> bytes:
+        return b"\x07" * 3309
+
+    def verify(self, message: bytes, signature: bytes, public_key: bytes) -> bool:
+        return True
+
+
+class _StubOqs:
+    Signature = _StubSignature
+
+    @staticmethod
+    def get_enabled_sig_mechanisms() -> tuple[str, ...]:
+        return (OQS_ML_DSA_MECHANISM,)
+
+
+@bench("v4_oqs_backend_verify_wrapper", number=2000)
+def bench_oqs_wrapper_verify() -> Callable[[], Any]:
+    backend = OqsMlDsaBackend(private_key_resolver=lambda ref: b"\x01" * 4032, oqs_module=_StubOqs)
+    public_key = encode_binary_signature_material(b"\x02" * 1952, field="public_key")
+    signature = encode_binary_signature_material(b"\x07" * 3309)
+    message = b"bench-message"
+    return lambda: backend.verify_signature(algorithm="ml-dsa", public_key=public_key, message=message, signature=signature)
+
+
+@bench("v4_oqs_backend_sign_verify_real", number=50)
+def bench_oqs_real() -> Callable[[], Any] | None:
+    try:
+        import oqs  # type: ignore[import-not-found]
+    except Exception:
+        return None
+    with oqs.Signature(OQS_ML_DSA_MECHANISM) as signer:
+        public_key = signer.generate_keypair()
+        secret_key = signer.export_secret_key()
+    backend = OqsMlDsaBackend(private_key_resolver=lambda ref: secret_key)
+    encoded_public_key = encode_binary_signature_material(public_key, field="public_key")
+    message = b"bench-message"
+
+    def sign_and_verify() -> bool:
+        signature = backend.sign_message(algorithm="ml-dsa", private_key_reference="bench-key", message=message)
+        return backend.verify_signature(
+            algorithm="ml-dsa", public_key=encoded_public_key, message=message, signature=signature
+        )
+
+    return sign_and_verify
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def run_case(case: BenchCase, *, repeat: int, scale: float = 1.0) -> dict[str, Any]:
+    fn = case.setup()
+    if fn is None:
+        return {"skipped": True}
+    number = max(1, int(case.number * scale))
+    fn()  # warm-up
+    timer = timeit.Timer(fn, timer=time.perf_counter_ns)
+    per_op = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "ns_per_op_min": round(min(per_op), 1),
+        "ns_per_op_median": round(statistics.median(per_op), 1),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_suite(*, repeat: int = 5, scale: float = 1.0, only: str | None = None) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for case in BENCHMARKS:
+        if only and only not in case.name:
+            continue
+        results[case.name] = run_case(case, repeat=repeat, scale=scale)
+    return {
+        "schema": SCHEMA,
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "seed": workloads.SEED,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], *, threshold: float = DEFAULT_THRESHOLD) -> list[dict[str, Any]]:
+    """Return one entry per case whose median regressed by more than `threshold` vs the baseline."""
+    regressions: list[dict[str, Any]] = []
+    for name, base in baseline.get("results", {}).items():
+        now = current.get("results", {}).get(name)
+        if not now or now.get("skipped") or base.get("skipped"):
+            continue
+        ratio = now["ns_per_op_median"] / base["ns_per_op_median"]
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                {
+                    "name": name,
+                    "baseline_ns": base["ns_per_op_median"],
+                    "current_ns": now["ns_per_op_median"],
+                    "ratio": round(ratio, 3),
+                }
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="ADN hot-path benchmark suite (stdlib only, no network).")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply per-case iteration counts")
+    parser.add_argument("--only", help="run only cases whose name contains this substring")
+    parser.add_argument("--output", help="write JSON results to this path")
+    parser.add_argument("--baseline", help="compare against a stored JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown fraction")
+    parser.add_argument("--save-baseline", help="write results as the new baseline")
+    ns = parser.parse_args(argv)
+
+    current = run_suite(repeat=ns.repeat, scale=ns.scale, only=ns.only)
+    rendered = json.dumps(current, indent=2, sort_keys=True)
+    if ns.output:
+        Path(ns.output).write_text(rendered + "\n", encoding="utf-8")
+    if ns.save_baseline:
+        Path(ns.save_baseline).write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+
+    if ns.baseline:
+        baseline = json.loads(Path(ns.baseline).read_text(encoding="utf-8"))
+        regressions = compare(current, baseline, threshold=ns.threshold)
+        for item in regressions:
+            print(
+                f"REGRESSION {item['name']}: {item['current_ns']}ns vs {item['baseline_ns']}ns (x{item['ratio']})",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
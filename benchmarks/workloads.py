@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import random
+from typing import Any
+
+from adn_v2.models import DefenseEvent, NodeDefenseState
+from adn_v3.contracts.v3_2_lock import SUPPORTED_EVIDENCE_FAMILIES, SUPPORTED_REASON_IDS
+from adn_v3.v4 import COMPONENT_ROLE, KEY_REGISTRY_SCHEMA_VERSION
+from adn_v3.v4.crypto_verdict import build_signed_crypto_verdict_envelope, build_unsigned_crypto_verdict_payload
+from adn_v3.v4.real_crypto_backend import encode_binary_signature_material
+from adn_v3.v4.signing import build_signature_bundle, build_test_signature_entry, signed_payload_hash
+from adn_v3.v4.trust_profile import ACTIVE, CLASSICAL_ED25519, ML_DSA, SUPPORTED_ALGORITHMS
+
+"""
+Deterministic workload generators for the ADN benchmark suite.
+
+Every generator takes a seed so that two runs on the same interpreter
+build byte-identical inputs; nothing here touches the network or clock.
+"""
+
+SEED = 20260621
+EVENT_TYPES = ("rpc_abuse", "withdrawal_spike", "sentinel_alert", "dqsn_critical", "reorg_warning", "peer_flood")
+SOURCES = ("local", "sentinel", "dqsn", "wallet_guard", "orchestrator")
+CONTEXT_HASH = "a" * 64
+EVIDENCE_HASH = "b" * 64
+NOT_BEFORE = "2026-06-21T00:00:00Z"
+NOT_AFTER = "2026-06-21T00:05:00Z"
+VERIFY_AT = "2026-06-21T00:01:00Z"
+
+
+def _metadata(rng: random.Random, approx_bytes: int) -> dict[str, Any]:
+    meta: dict[str, Any] = {"peer": f"10.0.{rng.randrange(256)}.{rng.randrange(256)}", "depth": rng.randrange(8)}
+    pad = max(0, approx_bytes - 40)
+    if pad:
+        meta["note"] = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(pad))
+    return meta
+
+
+def raw_v3_events(count: int, *, metadata_bytes: int = 64, seed: int = SEED) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "event_type": rng.choice(EVENT_TYPES),
+            "severity": round(rng.random(), 4),
+            "source": rng.choice(SOURCES),
+            "metadata": _metadata(rng, metadata_bytes),
+        }
+        for _ in range(count)
+    ]
+
+
+def v3_request(size: str, *, seed: int = SEED) -> dict[str, Any]:
+    """Shield v3 request: small (1 event), typical (20 events) or max (MAX_EVENTS, ~1KB metadata each)."""
+    count, metadata_bytes = {"small": (1, 32), "typical": (20, 128), "max": (200, 1024)}[size]
+    return {
+        "contract_version": 3,
+        "component": "adn",
+        "request_id": f"bench-{size}",
+        "events": raw_v3_events(count, metadata_bytes=metadata_bytes, seed=seed),
+    }
+
+
+def defense_events(count: int, *, seed: int = SEED) -> list[DefenseEvent]:
+    rng = random.Random(seed)
+    return [
+        DefenseEvent(
+            event_type=rng.choice(EVENT_TYPES),
+            severity=round(rng.random() * 0.6, 4),
+            source=rng.choice(SOURCES),
+            metadata={"depth": rng.randrange(8)} if rng.random() < 0.2 else {},
+            timestamp=1_780_000_000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+def long_lived_defense_state(history: int, *, seed: int = SEED) -> NodeDefenseState:
+    return NodeDefenseState(active_events=defense_events(history, seed=seed))
+
+
+def raw_telemetry(count: int, *, seed: int = SEED) -> list[dict[str, Any]]:
+    """Raw node telemetry dicts (TelemetryAdapter input) with occasional anomalies."""
+    rng = random.Random(seed)
+    return [
+        {
+            "height": 19_000_000 + i,
+            "mempool_size": rng.choice((800, 1_500, 4_000, 25_000)),
+            "peer_count": rng.choice((1, 8, 12, 16)),
+            "timestamp": 1_780_000_000.0 + i,
+            "rpc_rps": rng.randrange(500),
+        }
+        for i in range(count)
+    ]
+
+
+def unsigned_verdict_payload(*, metadata_entries: int = 8) -> dict[str, Any]:
+    return build_unsigned_crypto_verdict_payload(
+        request_id="bench-v4",
+        context_hash=CONTEXT_HASH,
+        freshness_nonce="bench-nonce",
+        not_before=NOT_BEFORE,
+        not_after=NOT_AFTER,
+        decision="ALLOW",
+        reason_ids=list(SUPPORTED_REASON_IDS[:2]),
+        evidence_hash=EVIDENCE_HASH,
+        evidence_families=list(SUPPORTED_EVIDENCE_FAMILIES),
+        key_registry_version=1,
+        metadata={f"field_{i}": {"value": i, "label": f"label-{i}"} for i in range(metadata_entries)},
+    )
+
+
+def unsigned_verdict_payloads(count: int) -> list[dict[str, Any]]:
+    """`count` distinct unsigned payloads (request id / nonce differ) for batch signing."""
+    payloads = []
+    for index in range(count):
+        payload = unsigned_verdict_payload()
+        payload["request_id"] = f"bench-v4-{index}"
+        payload["freshness_nonce"] = f"bench-nonce-{index}"
+        payloads.append(payload)
+    return payloads
+
+
+def signed_test_envelope() -> dict[str, Any]:
+    payload = unsigned_verdict_payload()
+    digest = signed_payload_hash(payload=payload)
+    signatures = [build_test_signature_entry(algorithm=a, signed_hash=digest) for a in (CLASSICAL_ED25519, ML_DSA)]
+    return build_signed_crypto_verdict_envelope(
+        unsigned_payload=payload, signature_bundle=build_signature_bundle(signatures=signatures)
+    )
+
+
+def real_size_envelope_json(*, seed: int = SEED) -> str:
+    """Signed test envelope as JSON text, with signatures swapped for real-size
+    ``b64u:`` material (64-byte Ed25519, 3309-byte ML-DSA-65)."""
+    rng = random.Random(seed)
+    envelope = signed_test_envelope()
+    sizes = {CLASSICAL_ED25519: 64, ML_DSA: 3309}
+    for entry in envelope["signature_bundle"]["signatures"]:
+        entry["signature"] = encode_binary_signature_material(rng.randbytes(sizes[entry["algorithm"]]))
+    return json.dumps(envelope, sort_keys=True, separators=(",", ":"))
+
+
+def hostile_metadata(kind: str, nodes: int) -> dict[str, Any]:
+    """Metadata far beyond every default budget: ``deep`` nesting, ``wide`` lists or ``long`` strings."""
+    if kind == "deep":
+        value: dict[str, Any] = {}
+        for _ in range(nodes):
+            value = {"n": value}
+        return value
+    if kind == "wide":
+        return {"items": [{"i": i} for i in range(nodes)]}
+    if kind == "long":
+        return {f"k{i}": "x" * 4000 for i in range(nodes)}
+    raise ValueError(f"unknown hostile metadata kind: {kind}")
+
+
+def hostile_envelope(kind: str, nodes: int) -> dict[str, Any]:
+    """A signed test envelope whose metadata was swapped for `hostile_metadata` after signing."""
+    return {**signed_test_envelope(), "metadata": hostile_metadata(kind, nodes)}
+
+
+def large_trust_profile(extra_entries: int) -> dict[str, Any]:
+    """Test trust profile padded with `extra_entries` rotated-out keys ahead of the live ones."""
+    entries = [
+        {
+            "role": COMPONENT_ROLE,
+            "key_id": f"rotated-{COMPONENT_ROLE}-{SUPPORTED_ALGORITHMS[i % len(SUPPORTED_ALGORITHMS)]}-{i}",
+            "key_version": i + 2,
+            "algorithm": SUPPORTED_ALGORITHMS[i % len(SUPPORTED_ALGORITHMS)],
+            "not_before": "2026-01-01T00:00:00Z",
+            "not_after": "2030-01-01T00:00:00Z",
+            "status": ACTIVE,
+            "public_key": f"ROTATED-PUBLIC-{i}",
+        }
+        for i in range(extra_entries)
+    ]
+    entries += [
+        {
+            "role": COMPONENT_ROLE,
+            "key_id": f"test-{COMPONENT_ROLE}-{algorithm}-v1",
+            "key_version": 1,
+            "algorithm": algorithm,
+            "not_before": "2026-01-01T00:00:00Z",
+            "not_after": "2030-01-01T00:00:00Z",
+            "status": ACTIVE,
+            "public_key": f"TEST-ONLY-PUBLIC-{COMPONENT_ROLE}-{algorithm}-v1",
+        }
+        for algorithm in SUPPORTED_ALGORITHMS
+    ]
+    return {"schema_version": KEY_REGISTRY_SCHEMA_VERSION, "registry_version": 1, "entries": entries}
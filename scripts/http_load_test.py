@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from adn_v2.http_server import ADNHTTPServer  # noqa: E402
+
+V3_BODY = {
+    "contract_version": 3,
+    "component": "adn",
+    "request_id": "load-test",
+    "events": [
+        {"event_type": "rpc_abuse", "severity": 0.4, "source": "local", "metadata": {"ip": "10.0.0.1"}},
+        {"event_type": "sentinel_alert", "severity": 0.7, "source": "sentinel"},
+    ],
+}
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def _worker(host: str, port: int, path: str, payload: bytes, deadline: float, latencies: list[float]) -> int:
+    reader, writer = await asyncio.open_connection(host, port)
+    method = "POST" if payload else "GET"
+    request = (
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n"
+    ).encode("latin-1") + payload
+    errors = 0
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter_ns()
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append((time.perf_counter_ns() - started) / 1e6)
+            if not status_line.startswith(b"HTTP/1.1 200"):
+                errors += 1
+    finally:
+        writer.close()
+    return errors
+
+
+async def _run(ns: argparse.Namespace) -> dict:
+    server = None
+    host, port = ns.host, ns.port
+    if ns.spawn:
+        server = ADNHTTPServer(max_concurrency=ns.max_concurrency)
+        host, port = await server.start(ns.host, 0)
+
+    path = {"v3": "/v3/evaluate", "health": "/health"}[ns.endpoint]
+    payload = json.dumps(V3_BODY).encode("utf-8") if ns.endpoint == "v3" else b""
+    latencies: list[float] = []
+    started = time.perf_counter()
+    deadline = started + ns.duration
+    try:
+        errors = await asyncio.gather(
+            *(_worker(host, port, path, payload, deadline, latencies) for _ in range(ns.connections))
+        )
+    finally:
+        if server is not None:
+            await server.close()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "endpoint": path,
+        "connections": ns.connections,
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50), 3),
+            "p90": round(_percentile(latencies, 90), 3),
+            "p99": round(_percentile(latencies, 99), 3),
+            "max": round(latencies[-1], 3) if latencies else 0.0,
+        },
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Keep-alive load test for the ADN asyncio HTTP front-end on localhost.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--spawn", action="store_true", help="start an in-process server on a free port")
+    parser.add_argument("--endpoint", choices=("v3", "health"), default="v3")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    ns = parser.parse_args(argv)
+
+    print(json.dumps(asyncio.run(_run(ns)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
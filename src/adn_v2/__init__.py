@@ -9,8 +9,28 @@ External code should import from submodules explicitly, for example:
     from adn_v2.models import DefenseEvent, NodeDefenseState
     from adn_v2.engine import evaluate_defense
     from adn_v2.actions import build_rpc_policy_from_state
+
+The `models`, `engine` and `actions` attributes are still available on the
+package, but are loaded lazily on first access (PEP 562) so short-lived
+processes only pay for the submodules they actually use.
 """
 
-from . import models, engine, actions  # noqa: F401
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import List
 
 __all__ = ["models", "engine", "actions"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, Any
+import queue
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
+from . import metrics
 from .models import (
     DefenseAction,
     NodeDefenseState,
+    PolicyDecision,
 )
 
 
@@ -65,7 +72,7 @@ class ActionExecutor:
     def __init__(self, node_id: str) -> None:
         self.node_id = node_id
 
-    def execute(self, decision, context: Dict[str, Any]) -> None:
+    def execute(self, decision: PolicyDecision, context: Dict[str, Any]) -> None:
         """
         Apply a PolicyDecision to node_state context.
 
@@ -79,3 +86,211 @@ class ActionExecutor:
             node_state["hardened"] = True
 
         context["node_state"] = node_state
+
+
+# ---------------------------------------------------------------------------
+# Asynchronous side-effect dispatch
+# ---------------------------------------------------------------------------
+
+ACTION_DISPATCH = metrics.REGISTRY.counter(
+    "adn_action_dispatch_total",
+    "Side-effect action requests by outcome (dispatched, coalesced, debounced, dropped, failed).",
+    ("result",),
+)
+
+
+@dataclass
+class ActionRequest:
+    """One side effect queued for an AsyncActionExecutor handler."""
+
+    action_type: str
+    node_id: str
+    key: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    submitted_at: float = 0.0
+
+
+ActionHandler = Callable[[ActionRequest], None]
+
+
+class AsyncActionExecutor(ActionExecutor):
+    """
+    ActionExecutor that moves side effects off the decision path.
+
+    `execute` still applies the in-memory NodeState update synchronously
+    (it is a dict write), then only *enqueues* the decision's actions; a
+    small pool of daemon worker threads calls `handler` for each request.
+
+    Ordering – every worker owns its own FIFO and a request always goes to
+    the same worker as earlier requests of its lane, so a lane runs in
+    submission order and never on two threads at once. The lane is the
+    idempotency key, except that all LOCKDOWN_ACTIONS of the node share
+    one lane: ENTER → LIFT → ENTER cannot finish unlocked.
+
+    Per request:
+    - idempotency key – defaults to "<node_id>:<action_type>"; a request
+      whose key is already waiting in the queue is coalesced with it: the
+      waiting entry is dropped and the newest request goes to the back
+    - debounce – `debounce[action_type]` seconds (or `default_debounce`)
+      after a key was accepted, repeats of that key are suppressed, so a
+      flapping node does not re-issue ENTER_FULL_LOCKDOWN every packet
+    - backpressure – queued requests are bounded by `max_queue`; when full
+      the request is dropped and counted, `execute` never blocks (a repeat
+      that cannot be re-queued updates the waiting entry in place)
+
+    Outcomes are counted in `stats` and the adn_action_dispatch_total
+    metric. Handler exceptions are counted as "failed" and never reach
+    the pipeline.
+    """
+
+    LOCKDOWN_ACTIONS = frozenset(
+        {"ENTER_PARTIAL_LOCKDOWN", "ENTER_FULL_LOCKDOWN", "LIFT_LOCKDOWN", "lockdown_trigger"}
+    )
+
+    def __init__(
+        self,
+        node_id: str,
+        handler: Optional[ActionHandler] = None,
+        *,
+        workers: int = 2,
+        max_queue: int = 1024,
+        debounce: Optional[Mapping[str, float]] = None,
+        default_debounce: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(node_id)
+        if workers < 1 or max_queue < 1:
+            raise ValueError("workers and max_queue must be positive")
+        self.handler = handler
+        self.workers = workers
+        self.debounce: Dict[str, float] = dict(debounce or {})
+        self.default_debounce = default_debounce
+        self.stats: Dict[str, int] = {
+            "dispatched": 0, "coalesced": 0, "debounced": 0, "dropped": 0, "failed": 0
+        }
+        self.max_queue = max_queue
+        self._clock = clock
+        self._queues: List["queue.Queue[Optional[ActionRequest]]"] = [queue.Queue() for _ in range(workers)]
+        self._queued = 0  # entries sitting in the worker queues, stale ones included
+        self._pending: Dict[str, ActionRequest] = {}
+        self._last_accepted: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._threads: Dict[int, threading.Thread] = {}
+        self._closed = False
+
+    # -- submission (caller thread) ------------------------------------------
+
+    def execute(self, decision: PolicyDecision, context: Dict[str, Any]) -> None:
+        super().execute(decision, context)
+        level = decision.level.value if hasattr(decision.level, "value") else str(decision.level)
+        for action_type in getattr(decision, "actions", None) or ():
+            self.submit(action_type, {"level": level, "reason": decision.reason})
+
+    def dispatch_defense_actions(self, actions: Iterable[DefenseAction]) -> None:
+        """Queue evaluate_defense() DefenseActions (e.g. ENTER_FULL_LOCKDOWN)."""
+        for action in actions:
+            self.submit(action.action_type, {"reason": action.reason, "metadata": action.metadata or {}})
+
+    def submit(
+        self,
+        action_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        idempotency_key: Optional[str] = None,
+    ) -> bool:
+        """Enqueue one side effect; returns False if it was coalesced, debounced or dropped."""
+        if self._closed:
+            raise RuntimeError("executor is closed")
+        key = idempotency_key or f"{self.node_id}:{action_type}"
+        now = self._clock()
+        request = ActionRequest(action_type, self.node_id, key, dict(payload or {}), now)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                if self._queued >= self.max_queue:
+                    pending.action_type, pending.payload = action_type, request.payload
+                else:
+                    # The waiting entry becomes stale (workers skip it) and
+                    # the newest request runs after everything queued so far.
+                    self._enqueue(request)
+                return self._count("coalesced", False)
+
+            window = self.debounce.get(action_type, self.default_debounce)
+            last = self._last_accepted.get(key)
+            if window > 0 and last is not None and now - last < window:
+                return self._count("debounced", False)
+
+            if self._queued >= self.max_queue:
+                return self._count("dropped", False)
+            self._enqueue(request)
+            self._last_accepted[key] = now
+        return True
+
+    def _enqueue(self, request: ActionRequest) -> None:
+        # Caller holds self._lock.
+        lane = f"{self.node_id}:lockdown" if request.action_type in self.LOCKDOWN_ACTIONS else request.key
+        index = zlib.crc32(lane.encode("utf-8")) % self.workers
+        self._queues[index].put_nowait(request)
+        self._queued += 1
+        self._pending[request.key] = request
+        if index not in self._threads:
+            self._start_worker(index)
+
+    def _count(self, outcome: str, result: bool) -> bool:
+        self.stats[outcome] += 1
+        ACTION_DISPATCH.inc(labels=(outcome,))
+        return result
+
+    def _start_worker(self, index: int) -> None:
+        thread = threading.Thread(
+            target=self._run, args=(self._queues[index],), name=f"adn-actions-{self.node_id}-{index}", daemon=True
+        )
+        self._threads[index] = thread
+        thread.start()
+
+    # -- workers --------------------------------------------------------------
+
+    def _run(self, requests: "queue.Queue[Optional[ActionRequest]]") -> None:
+        while True:
+            request = requests.get()
+            try:
+                if request is None:
+                    return
+                with self._lock:
+                    self._queued -= 1
+                    if self._pending.get(request.key) is not request:
+                        continue  # superseded by a newer request with this key
+                    del self._pending[request.key]
+                try:
+                    if self.handler is not None:
+                        self.handler(request)
+                except Exception:
+                    with self._lock:
+                        self._count("failed", False)
+                else:
+                    with self._lock:
+                        self._count("dispatched", True)
+            finally:
+                requests.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued request has been handled; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for requests in self._queues:
+            with requests.all_tasks_done:
+                while requests.unfinished_tasks:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    requests.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Drain the queue and stop the worker threads."""
+        if self._closed:
+            return
+        self._closed = True
+        for index in self._threads:
+            self._queues[index].put(None)
+        for thread in self._threads.values():
+            thread.join(timeout)
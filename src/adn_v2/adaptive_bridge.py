@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import copy
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 
 ADN_LAYER_NAME = "ADN_v2"
@@ -49,10 +53,20 @@ class AdaptiveEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self)
-        # datetime → ISO string for JSON / logging
-        d["created_at"] = self.created_at.isoformat()
-        return d
+        # Hand-written instead of dataclasses.asdict (which recurses through
+        # every field); only metadata can hold containers, so only it is
+        # deep-copied – the result shares nothing mutable with the event.
+        return {
+            "event_id": self.event_id,
+            "layer": self.layer,
+            "decision": self.decision,
+            "fingerprint": self.fingerprint,
+            "severity": self.severity,
+            # datetime → ISO string for JSON / logging
+            "created_at": self.created_at.isoformat(),
+            "feedback": self.feedback,
+            "metadata": copy.deepcopy(self.metadata),
+        }
 
 
 def build_adaptive_event_from_adn(
@@ -152,3 +166,133 @@ def emit_adaptive_event(
     )
     sink(event)
     return event
+
+
+# --------------------------------------------------------------------------- #
+# Buffered, batching sink (keeps Adaptive Core I/O off the decision path)
+# --------------------------------------------------------------------------- #
+
+AdaptiveBatchSink = Callable[[List[Dict[str, Any]]], None]
+
+
+class BufferedAdaptiveSink:
+    """
+    AdaptiveSink that buffers events and forwards them in batches.
+
+    Calling the sink snapshots the event with `to_dict` on the caller's
+    thread, so mutating the event or its metadata afterwards cannot change
+    (or break) what is forwarded, then appends the dict to a bounded ring
+    buffer under a short lock. A background thread hands lists of those
+    dicts to `flush_batch` when `batch_size` events are waiting or the
+    oldest buffered event is `max_age` seconds old.
+
+    Backpressure: when the ring is full the oldest buffered event is
+    discarded and counted in `stats["dropped"]`, so a slow or failing
+    Adaptive Core never stalls ADN. Batches whose `flush_batch` raises
+    are counted in `stats["failed"]` (events) and not retried.
+
+        sink = BufferedAdaptiveSink(post_to_adaptive_core, batch_size=128)
+        emit_adaptive_event(sink, event_id=..., decision=..., ...)
+        ...
+        sink.close()  # flushes what is left
+    """
+
+    def __init__(
+        self,
+        flush_batch: AdaptiveBatchSink,
+        *,
+        capacity: int = 4096,
+        batch_size: int = 256,
+        max_age: float = 1.0,
+    ) -> None:
+        if capacity < 1 or batch_size < 1 or max_age <= 0:
+            raise ValueError("capacity, batch_size and max_age must be positive")
+        self.flush_batch = flush_batch
+        self.capacity = capacity
+        self.batch_size = min(batch_size, capacity)
+        self.max_age = max_age
+        self.stats: Dict[str, int] = {"accepted": 0, "dropped": 0, "flushed": 0, "failed": 0, "batches": 0}
+        # (enqueue time, event snapshot from to_dict)
+        self._ring: Deque[Tuple[float, Dict[str, Any]]] = deque()
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __call__(self, event: AdaptiveEvent) -> None:
+        snapshot = event.to_dict()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("sink is closed")
+            if len(self._ring) >= self.capacity:
+                self._ring.popleft()
+                self.stats["dropped"] += 1
+            self._ring.append((time.monotonic(), snapshot))
+            self.stats["accepted"] += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="adn-adaptive-sink", daemon=True)
+                self._thread.start()
+            if len(self._ring) >= self.batch_size:
+                self._cond.notify_all()
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        # Caller holds self._cond.
+        count = min(self.batch_size, len(self._ring))
+        batch = [self._ring.popleft()[1] for _ in range(count)]
+        self._inflight += count
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed and not self._ring:
+                        return
+                    if len(self._ring) >= self.batch_size or (self._ring and self._closed):
+                        break
+                    if self._ring:
+                        wait = self._ring[0][0] + self.max_age - time.monotonic()
+                        if wait <= 0:
+                            break
+                    else:
+                        wait = None
+                    self._cond.wait(wait)
+                batch = self._take_batch()
+            self._send(batch)
+
+    def _send(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            self.flush_batch(batch)
+            outcome = "flushed"
+        except Exception:
+            outcome = "failed"
+        with self._cond:
+            self.stats[outcome] += len(batch)
+            self.stats["batches"] += 1
+            self._inflight -= len(batch)
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Forward everything buffered now; returns False if `timeout` expired first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            # Age every buffered event out so the worker sends immediately.
+            self._ring = deque((0.0, event) for _, event in self._ring)
+            self._cond.notify_all()
+            while self._ring or self._inflight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush remaining events and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
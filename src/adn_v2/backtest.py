@@ -0,0 +1,256 @@
+"""
+ADN v2 threshold backtesting – replay recorded DefenseEvents under many configs
+
+Operators tune NodeDefenseConfig.lockdown_threshold / partial_lock_threshold
+by asking "what would have happened last week with these numbers?". Running
+evaluate_defense once per candidate config repeats all the event handling
+for every grid point.
+
+evaluate_defense's aggregate (average severity over every event seen so far)
+does not depend on the config, so the backtest:
+
+1. makes one pass over the recorded batches to build the severity series
+   [(batch timestamp, avg_severity), ...]
+2. replays only the lockdown state machine for each config over that series
+   (a few float comparisons per batch), optionally across processes
+
+Per config it reports time spent in PARTIAL / FULL lockdown, transition
+counts, and flapping (lockdown episodes shorter than `flap_window`).
+Decisions match evaluate_defense run batch by batch from a fresh
+NodeDefenseState.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .models import DefenseEvent, LockdownState, NodeDefenseConfig
+
+
+# (batch timestamp, cumulative average severity after the batch)
+SeriesPoint = Tuple[int, float]
+
+
+@dataclass
+class BacktestResult:
+    """Outcome of replaying one NodeDefenseConfig over a severity series."""
+
+    lockdown_threshold: float
+    partial_lock_threshold: float
+    batches: int = 0
+    partial_batches: int = 0
+    full_batches: int = 0
+    partial_seconds: int = 0
+    full_seconds: int = 0
+    transitions: int = 0
+    enter_partial: int = 0
+    enter_full: int = 0
+    lifts: int = 0
+    episodes: int = 0
+    flaps: int = 0
+    final_state: str = LockdownState.NONE.value
+
+    @property
+    def lockdown_seconds(self) -> int:
+        return self.partial_seconds + self.full_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["lockdown_seconds"] = self.lockdown_seconds
+        return data
+
+
+def batch_events(
+    events: Iterable[DefenseEvent],
+    *,
+    size: Optional[int] = None,
+    window_seconds: Optional[int] = None,
+) -> Iterator[List[DefenseEvent]]:
+    """
+    Group a flat recorded stream into evaluate_defense batches.
+
+    Either every `size` events, or consecutive events whose timestamps fall
+    in the same `window_seconds` bucket. With neither, each event is its
+    own batch.
+    """
+    if size is not None and size < 1:
+        raise ValueError("size must be positive")
+    if window_seconds is not None and window_seconds < 1:
+        raise ValueError("window_seconds must be positive")
+    if window_seconds is not None:
+        for _, group in itertools.groupby(events, key=lambda e: e.timestamp // window_seconds):
+            yield list(group)
+        return
+    step = size or 1
+    batch: List[DefenseEvent] = []
+    for event in events:
+        batch.append(event)
+        if len(batch) >= step:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def severity_series(batches: Iterable[Sequence[DefenseEvent]]) -> List[SeriesPoint]:
+    """Single shared pass: avg_severity after each non-empty batch, as evaluate_defense computes it."""
+    series: List[SeriesPoint] = []
+    total = 0.0
+    count = 0
+    for batch in batches:
+        if not batch:
+            continue  # evaluate_defense leaves the lockdown state untouched
+        for event in batch:
+            total += float(event.severity)
+        count += len(batch)
+        series.append((max(event.timestamp for event in batch), total / count))
+    return series
+
+
+def replay(series: Sequence[SeriesPoint], config: NodeDefenseConfig, *, flap_window: int = 300) -> BacktestResult:
+    """Run evaluate_defense's lockdown state machine for one config over `series`."""
+    full_at = config.lockdown_threshold
+    partial_at = config.partial_lock_threshold
+    result = BacktestResult(lockdown_threshold=full_at, partial_lock_threshold=partial_at, batches=len(series))
+
+    state = LockdownState.NONE
+    episode_start = 0
+    previous_ts: Optional[int] = None
+    for timestamp, avg in series:
+        # Time since the previous batch is attributed to the state it left us in.
+        if previous_ts is not None:
+            elapsed = max(0, timestamp - previous_ts)
+            if state is LockdownState.FULL:
+                result.full_seconds += elapsed
+            elif state is LockdownState.PARTIAL:
+                result.partial_seconds += elapsed
+        previous_ts = timestamp
+
+        if avg >= full_at:
+            if state is not LockdownState.FULL:
+                if state is LockdownState.NONE:
+                    episode_start = timestamp
+                    result.episodes += 1
+                state = LockdownState.FULL
+                result.enter_full += 1
+        elif avg >= partial_at:
+            if state is LockdownState.NONE:
+                episode_start = timestamp
+                result.episodes += 1
+                state = LockdownState.PARTIAL
+                result.enter_partial += 1
+        elif state is not LockdownState.NONE:
+            result.lifts += 1
+            if timestamp - episode_start < flap_window:
+                result.flaps += 1
+            state = LockdownState.NONE
+
+        if state is LockdownState.FULL:
+            result.full_batches += 1
+        elif state is LockdownState.PARTIAL:
+            result.partial_batches += 1
+
+    result.transitions = result.enter_partial + result.enter_full + result.lifts
+    result.final_state = state.value
+    return result
+
+
+def _replay_many(
+    series: Sequence[SeriesPoint], thresholds: Sequence[Tuple[float, float]], flap_window: int
+) -> List[BacktestResult]:
+    return [
+        replay(series, NodeDefenseConfig(lockdown_threshold=full, partial_lock_threshold=partial), flap_window=flap_window)
+        for full, partial in thresholds
+    ]
+
+
+def config_grid(lockdown_thresholds: Iterable[float], partial_lock_thresholds: Iterable[float]) -> List[NodeDefenseConfig]:
+    """Every (lockdown, partial) pair with partial <= lockdown."""
+    partials = sorted(set(partial_lock_thresholds))
+    return [
+        NodeDefenseConfig(lockdown_threshold=full, partial_lock_threshold=partial)
+        for full in sorted(set(lockdown_thresholds))
+        for partial in partials
+        if partial <= full
+    ]
+
+
+def run_backtest(
+    batches: Iterable[Sequence[DefenseEvent]],
+    configs: Sequence[NodeDefenseConfig],
+    *,
+    flap_window: int = 300,
+    workers: int = 1,
+) -> List[BacktestResult]:
+    """
+    Backtest `configs` over recorded `batches`; results keep the order of `configs`.
+
+    The events are walked once. With workers > 1 the config grid is split
+    across processes that each receive only the (timestamp, avg) series.
+    """
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    series = severity_series(batches)
+    thresholds = [(c.lockdown_threshold, c.partial_lock_threshold) for c in configs]
+    if workers == 1 or len(thresholds) < 2:
+        return _replay_many(series, thresholds, flap_window)
+
+    chunk = -(-len(thresholds) // workers)
+    parts = [thresholds[i : i + chunk] for i in range(0, len(thresholds), chunk)]
+    with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+        futures = [pool.submit(_replay_many, series, part, flap_window) for part in parts]
+        return [result for future in futures for result in future.result()]
+
+
+def _load_events(path: str) -> Iterator[DefenseEvent]:
+    handle = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in handle:
+            if line.strip():
+                raw = json.loads(line)
+                yield DefenseEvent(
+                    event_type=raw["event_type"],
+                    severity=float(raw["severity"]),
+                    source=raw.get("source", "unknown"),
+                    metadata=raw.get("metadata") or {},
+                    timestamp=int(raw.get("timestamp", 0)),
+                )
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="adn-backtest",
+        description="Replay recorded DefenseEvents (JSONL) under a grid of NodeDefenseConfig thresholds.",
+    )
+    parser.add_argument("events", help="JSONL DefenseEvent records ('-' for stdin)")
+    parser.add_argument("--lockdown", type=float, nargs="+", required=True, help="lockdown_threshold values")
+    parser.add_argument("--partial", type=float, nargs="+", required=True, help="partial_lock_threshold values")
+    parser.add_argument("--batch-size", type=int, help="events per evaluate_defense call")
+    parser.add_argument("--window", type=int, help="batch by timestamp window (seconds) instead")
+    parser.add_argument("--flap-window", type=int, default=300, help="episodes shorter than this count as flaps")
+    parser.add_argument("-j", "--workers", type=int, default=1)
+    ns = parser.parse_args(argv)
+
+    batches = batch_events(_load_events(ns.events), size=ns.batch_size, window_seconds=ns.window)
+    results = run_backtest(
+        batches,
+        config_grid(ns.lockdown, ns.partial),
+        flap_window=ns.flap_window,
+        workers=ns.workers,
+    )
+    for result in results:
+        print(json.dumps(result.to_dict(), sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
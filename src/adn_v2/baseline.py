@@ -0,0 +1,253 @@
+"""
+ADN v2 streaming baselines – per-node "what is normal here" tracking
+
+Static thresholds (see adn_v2.rules) treat every node the same, but a busy
+exchange node and a small home node have very different normal mempool
+sizes and peer counts. BaselineTracker learns each node's own normal
+range online and flags packets that leave it:
+
+- EWMAStat   – exponentially weighted mean/variance → z-score breaches
+- P2Quantile – P² quantile estimator (Jain & Chlamtac, 1985), five markers
+               per quantile → low/high tail breaches
+
+Every metric costs a fixed handful of floats and O(1) work per packet;
+nothing is buffered. Tracked metrics are mempool_size, peer_count and
+numeric TelemetryPacket.extra fields (capped per node by max_metrics).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .config import BASELINE_THRESHOLDS
+from .models import RiskLevel, RiskSignal, TelemetryPacket
+
+
+class EWMAStat:
+    """Exponentially weighted moving mean and variance."""
+
+    __slots__ = ("alpha", "mean", "var", "count")
+
+    def __init__(self, alpha: float) -> None:
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be within (0, 1]")
+        self.alpha = alpha
+        self.mean = 0.0
+        self.var = 0.0
+        self.count = 0
+
+    def update(self, value: float) -> None:
+        if self.count == 0:
+            self.mean = value
+        else:
+            diff = value - self.mean
+            step = self.alpha * diff
+            self.mean += step
+            self.var = (1.0 - self.alpha) * (self.var + diff * step)
+        self.count += 1
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var)
+
+
+class P2Quantile:
+    """
+    Streaming estimate of a single quantile using the P² algorithm.
+
+    Keeps five marker heights/positions regardless of how many values are
+    observed; exact for the first five values.
+    """
+
+    __slots__ = ("q", "count", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, q: float) -> None:
+        if not 0.0 < q < 1.0:
+            raise ValueError("quantile must be within (0, 1)")
+        self.q = q
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1.0, 1.0 + 2.0 * q, 1.0 + 4.0 * q, 3.0 + 2.0 * q, 5.0]
+        self._increments = (0.0, q / 2.0, q, (1.0 + q) / 2.0, 1.0)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= heights[k + 1]:
+                k += 1
+
+        positions = self._positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        desired = self._desired
+        for i, step in enumerate(self._increments):
+            desired[i] += step
+
+        for i in (1, 2, 3):
+            delta = desired[i] - positions[i]
+            if (delta >= 1.0 and positions[i + 1] - positions[i] > 1) or (
+                delta <= -1.0 and positions[i - 1] - positions[i] < -1
+            ):
+                d = 1 if delta > 0 else -1
+                candidate = self._parabolic(i, d)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = heights[i] + d * (heights[i + d] - heights[i]) / (positions[i + d] - positions[i])
+                heights[i] = candidate
+                positions[i] += d
+
+    def _parabolic(self, i: int, d: int) -> float:
+        h = self._heights
+        n = self._positions
+        return h[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> Optional[float]:
+        """Current quantile estimate, or None before any value was added."""
+        if not self._heights:
+            return None
+        if self.count <= 5:
+            index = min(len(self._heights) - 1, int(self.q * len(self._heights)))
+            return self._heights[index]
+        return self._heights[2]
+
+
+class MetricBaseline:
+    """EWMA plus low/high tail quantile sketches for one metric of one node."""
+
+    __slots__ = ("ewma", "low", "high")
+
+    def __init__(self, alpha: float, quantiles: Tuple[float, float]) -> None:
+        self.ewma = EWMAStat(alpha)
+        self.low = P2Quantile(quantiles[0])
+        self.high = P2Quantile(quantiles[1])
+
+    @property
+    def count(self) -> int:
+        return self.ewma.count
+
+    def update(self, value: float) -> None:
+        self.ewma.update(value)
+        self.low.add(value)
+        self.high.add(value)
+
+
+class BaselineTracker:
+    """
+    Per-node streaming baselines that emit RiskSignals on breaches.
+
+    observe(packet) scores each tracked metric against the node's baseline
+    *before* folding the new value in, so a spike is judged against what
+    was normal up to now. After `warmup` samples a metric emits at most one
+    signal per packet:
+
+    - |z| >= z_high                       → HIGH   ("baseline_zscore")
+    - |z| >= z_threshold                  → ELEVATED ("baseline_zscore")
+    - value outside [q_low, q_high] sketch → ELEVATED ("baseline_quantile")
+
+    The z-score denominator is floored at `rel_std_floor * |mean|` so
+    metrics that are almost constant (e.g. a steady peer_count) do not
+    alarm on every unit change. For the same reason a quantile breach only
+    counts once the value clears the sketch by `rel_std_floor * |mean|` or
+    `min_quantile_gap`, whichever is larger: the tail estimates of a
+    discrete metric sit between its values, so its own minimum and maximum
+    would otherwise fall outside them. Non-finite values (NaN, ±inf) are
+    skipped and never reach the baseline.
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = 0.05,
+        z_threshold: float = 4.0,
+        z_high: float = 8.0,
+        quantiles: Tuple[float, float] = (0.001, 0.999),
+        warmup: int = 30,
+        rel_std_floor: float = 0.05,
+        min_quantile_gap: float = 1.0,
+        max_metrics: int = 32,
+        fields: Sequence[str] = ("mempool_size", "peer_count"),
+    ) -> None:
+        if not 0.0 < quantiles[0] < quantiles[1] < 1.0:
+            raise ValueError("quantiles must satisfy 0 < low < high < 1")
+        if z_threshold <= 0 or z_high < z_threshold:
+            raise ValueError("require 0 < z_threshold <= z_high")
+        EWMAStat(alpha)  # validate alpha eagerly
+        self.alpha = alpha
+        self.z_threshold = z_threshold
+        self.z_high = z_high
+        self.quantiles = quantiles
+        self.warmup = max(1, warmup)
+        self.rel_std_floor = rel_std_floor
+        self.min_quantile_gap = min_quantile_gap
+        self.max_metrics = max_metrics
+        self.fields = tuple(fields)
+        self.nodes: Dict[str, Dict[str, MetricBaseline]] = {}
+
+    def baseline(self, node_id: str, metric: str) -> Optional[MetricBaseline]:
+        return self.nodes.get(node_id, {}).get(metric)
+
+    def observe(self, packet: TelemetryPacket) -> List[RiskSignal]:
+        metrics = self.nodes.get(packet.node_id)
+        if metrics is None:
+            metrics = self.nodes[packet.node_id] = {}
+
+        signals: List[RiskSignal] = []
+        for name in self.fields:
+            self._observe_metric(metrics, name, getattr(packet, name), signals)
+        for name, value in packet.extra.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self._observe_metric(metrics, name, value, signals)
+        return signals
+
+    def _observe_metric(
+        self, metrics: Dict[str, MetricBaseline], name: str, value: float, signals: List[RiskSignal]
+    ) -> None:
+        value = float(value)
+        if not math.isfinite(value):
+            return
+        baseline = metrics.get(name)
+        if baseline is None:
+            if len(metrics) >= self.max_metrics:
+                return
+            baseline = metrics[name] = MetricBaseline(self.alpha, self.quantiles)
+        elif baseline.count >= self.warmup:
+            signal = self._score(name, value, baseline)
+            if signal is not None:
+                signals.append(signal)
+        baseline.update(value)
+
+    def _score(self, name: str, value: float, baseline: MetricBaseline) -> Optional[RiskSignal]:
+        ewma = baseline.ewma
+        std = max(ewma.std, self.rel_std_floor * abs(ewma.mean), 1e-12)
+        z = (value - ewma.mean) / std
+        details = {"metric": name, "value": value, "mean": ewma.mean, "z": round(z, 4)}
+        if abs(z) >= self.z_threshold:
+            level = RiskLevel.HIGH if abs(z) >= self.z_high else RiskLevel.ELEVATED
+            return self._signal(level, {"reason": "baseline_zscore", **details})
+
+        low, high = baseline.low.value(), baseline.high.value()
+        gap = max(self.rel_std_floor * abs(ewma.mean), self.min_quantile_gap)
+        if (low is not None and value < low - gap) or (high is not None and value > high + gap):
+            return self._signal(RiskLevel.ELEVATED, {"reason": "baseline_quantile", "low": low, "high": high, **details})
+        return None
+
+    @staticmethod
+    def _signal(level: RiskLevel, details: Dict[str, object]) -> RiskSignal:
+        return RiskSignal(source="baseline", level=level, score=BASELINE_THRESHOLDS[level.value], details=details)
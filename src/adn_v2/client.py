@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import asdict
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from urllib.request import Request, urlopen
 
 from .models import PolicyDecision
@@ -40,6 +40,18 @@ class ADNClient:
             actions=response.get("actions", []),
         )
 
+    def send_telemetry_batch(self, telemetry: List[Dict[str, Any]]) -> List[PolicyDecision]:
+        response = self._post("/telemetry", {"type": "telemetry_batch", "data": telemetry})
+        return [
+            PolicyDecision(
+                level=item["level"],
+                score=item["score"],
+                reason=item.get("reason", ""),
+                actions=item.get("actions", []),
+            )
+            for item in response["decisions"]
+        ]
+
     def notify_dqsn(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         return self._post("/dqsn", message)
 
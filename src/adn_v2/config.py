@@ -23,6 +23,23 @@ HARDENED_MODE = {
     "fee_multiplier": 1.5,          # temporary fee boost for spam defence
 }
 
+# --- RISK RULES ------------------------------------------------------------
+# Declarative telemetry heuristics compiled by adn_v2.rules for RiskValidator.
+# `field` is a TelemetryPacket attribute or a key of TelemetryPacket.extra;
+# `op` is one of <, <=, >, >=, ==, !=. When `score` is omitted it defaults
+# to BASELINE_THRESHOLDS for the level (normal → "low").
+
+RISK_RULES = [
+    {"name": "low_peer_count", "field": "peer_count", "op": "<", "threshold": 2, "level": "elevated", "score": 0.6},
+    {"name": "mempool_spike", "field": "mempool_size", "op": ">", "threshold": 20000, "level": "high", "score": 0.8},
+]
+
+# Extra rules enabled while HARDENED_MODE["enabled"] is set.
+HARDENED_RISK_RULES = [
+    {"name": "deep_reorg", "field": "reorg_depth", "op": ">", "threshold": HARDENED_MODE["max_reorg_depth"], "level": "high"},
+    {"name": "low_peer_score", "field": "peer_score", "op": "<", "threshold": HARDENED_MODE["min_peer_score"], "level": "elevated"},
+]
+
 # --- TELEMETRY --------------------------------------------------------------
 
 TELEMETRY = {
@@ -1,5 +1,32 @@
-from .v3_reason_codes import ReasonCode
-from .v3_hash import canonical_sha256
-from .v3_types import ADNv3Request
+"""
+DEPRECATED (ADN v3 split): lazy re-exports of the v3 contract primitives.
+
+Authoritative v3 contract code lives in `adn_v3.contracts`; names are
+resolved on first access (PEP 562).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, List
 
 __all__ = ["ReasonCode", "canonical_sha256", "ADNv3Request"]
+
+_LAZY_ATTRS = {
+    "ReasonCode": ".v3_reason_codes",
+    "canonical_sha256": ".v3_hash",
+    "ADNv3Request": ".v3_types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
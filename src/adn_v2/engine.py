@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Dict, Generator, Iterable, Iterator, List, Mapping, Optional, Union
 
-from .actions import ActionExecutor
+from . import metrics
 from .models import (
     NodeState,
     PolicyDecision,
@@ -15,9 +15,15 @@ from .models import (
     LockdownState,
     RiskLevel,
 )
-from .policy import PolicyEngine
-from .telemetry import TelemetryAdapter
-from .validator import RiskValidator
+
+if TYPE_CHECKING:
+    from .actions import ActionExecutor
+    from .policy import PolicyEngine
+    from .telemetry import TelemetryAdapter
+    from .validator import RiskValidator
+
+# process_stream accepts ready packets or raw telemetry dicts (adapter input).
+StreamItem = Union[TelemetryPacket, Mapping[str, Any]]
 
 
 class ADNEngine:
@@ -48,6 +54,13 @@ class ADNEngine:
         validator: Optional[RiskValidator] = None,
         telemetry_adapter: Optional[TelemetryAdapter] = None,
     ) -> None:
+        # Pipeline stages are imported here so that `evaluate_defense`
+        # callers (e.g. adn_v3) do not pay for the telemetry pipeline.
+        from .actions import ActionExecutor
+        from .policy import PolicyEngine
+        from .telemetry import TelemetryAdapter
+        from .validator import RiskValidator
+
         self.state = NodeState(node_id=node_id)
         self.policy_engine = policy_engine or PolicyEngine()
         self.action_executor = action_executor or ActionExecutor(node_id=node_id)
@@ -62,7 +75,7 @@ class ADNEngine:
         turns `raw` into a TelemetryPacket and then `process_packet`
         performs validation, policy selection and action execution.
         """
-        packet = self.telemetry_adapter.from_raw(self.state.node_id, raw)
+        packet = self.telemetry_adapter.parse(raw, node_id=self.state.node_id)
         return self.process_packet(packet)
 
     def process_packet(self, packet: TelemetryPacket) -> PolicyDecision:
@@ -85,6 +98,69 @@ class ADNEngine:
         self.state.last_decision = decision
         return decision
 
+    def process_stream(self, packets: Iterable[StreamItem]) -> Generator[PolicyDecision, None, None]:
+        """
+        Pipeline a continuous telemetry feed through the engine, lazily.
+
+        Each item may be a TelemetryPacket or a raw telemetry dict (parsed
+        with the engine's TelemetryAdapter). Decisions are yielded one by
+        one in input order and applied to `self.state` exactly as
+        `process_packet` would, so memory stays bounded however long the
+        feed is. Stage callables and the executor context dict are bound
+        once and reused across packets instead of being rebuilt per sample.
+        """
+        node_id = self.state.node_id
+        state = self.state
+        parse = self.telemetry_adapter.parse
+        derive_signals = self.validator.derive_signals
+        decide = self.policy_engine.decide
+        execute = self.action_executor.execute
+
+        scratch: Dict[str, Any] = {}
+        context: Dict[str, object] = {"packet": None, "node_state": scratch}
+
+        for item in packets:
+            if isinstance(item, TelemetryPacket):
+                packet = item
+            else:
+                packet = parse(item if isinstance(item, dict) else dict(item), node_id=node_id)
+            decision = decide(derive_signals(packet))
+
+            context["packet"] = packet
+            execute(decision, context)
+            node_state = context["node_state"]
+            if node_state.get("hardened"):  # type: ignore[attr-defined]
+                state.hardened_mode = True
+            if node_state is not scratch:
+                context["node_state"] = scratch
+            scratch.clear()
+
+            state.last_decision = decision
+            yield decision
+
+    async def process_stream_async(self, packets: AsyncIterable[StreamItem]) -> AsyncIterator[PolicyDecision]:
+        """
+        Async-iterator variant of `process_stream` for asyncio telemetry feeds.
+
+        The pipeline itself is synchronous and cheap per packet; this only
+        lets node agents consume an async source (socket, queue) directly.
+        """
+        feed: List[StreamItem] = []
+        stream = self.process_stream(_drain(feed))
+        try:
+            async for item in packets:
+                feed.append(item)
+                yield next(stream)
+        finally:
+            stream.close()
+
+
+def _drain(feed: List[StreamItem]) -> Iterator[StreamItem]:
+    # Never-ending generator over a one-slot buffer filled by the async
+    # wrapper right before each next(); keeps a single process_stream alive.
+    while True:
+        yield feed.pop()
+
 
 def evaluate_defense(
     events: List[DefenseEvent],
@@ -116,14 +192,18 @@ def evaluate_defense(
         state.last_actions = []
         return state
 
-    # Merge new events into active list.
+    # Merge new events into the columnar active-event store and fold the
+    # batch (only) into the per-source / per-event_type aggregates.
     state.active_events.extend(events)
+    state.record_aggregates(events)
 
-    # Compute a simple aggregate severity.
-    severities = [e.severity for e in state.active_events]
-    avg_severity = sum(severities) / len(severities)
+    # Average severity over the whole history; the store keeps a running
+    # total, so this costs O(1) rather than a walk of every active event.
+    store = state.active_events
+    avg_severity = store.severity_sum() / len(store)
 
     actions: List[DefenseAction] = []
+    previous_lockdown = state.lockdown_state
 
     # Decide risk level from average severity.
     if avg_severity >= config.lockdown_threshold:
@@ -163,5 +243,13 @@ def evaluate_defense(
             )
         state.lockdown_state = LockdownState.NONE
 
+    # Out-of-band observability only; never feeds back into decisions.
+    metrics.DEFENSE_EVENTS.inc(len(events))
+    metrics.DEFENSE_AVG_SEVERITY.observe(avg_severity)
+    for action in actions:
+        metrics.DEFENSE_ACTIONS.inc(labels=(action.action_type,))
+    if state.lockdown_state is not previous_lockdown:
+        metrics.LOCKDOWN_TRANSITIONS.inc(labels=(previous_lockdown.value, state.lockdown_state.value))
+
     state.last_actions = actions
     return state
@@ -0,0 +1,387 @@
+"""
+ADN HTTP front-end – stdlib-only asyncio HTTP/1.1 transport
+
+ADNServer only defines pure-Python handlers. This module puts a small,
+dependency-free HTTP/1.1 server in front of them so integrators do not
+have to wrap ADN in the single-threaded `http.server`.
+
+Endpoints:
+- POST /telemetry    – ADNServer.handle_raw_request (same body as ADNClient)
+- GET  /health       – ADNServer.handle_health
+- GET  /metrics      – Prometheus text exposition of adn_v2.metrics.REGISTRY
+- POST /v3/evaluate  – ADNv3.evaluate (Shield Contract v3 request body)
+- POST /v4/verify    – validate_crypto_verdict_envelope (only when a trust
+                       profile and signature verifier are configured)
+
+Transport guarantees:
+- persistent connections (HTTP/1.1 keep-alive, `Connection: close` honoured)
+- bounded request line / headers / body (413 / 431 on overflow, no chunked
+  uploads)
+- a configurable limit on requests processed concurrently
+- CPU-bound handler work runs on an executor, never on the event loop
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple, Union
+
+from . import metrics
+from .engine import ADNEngine
+from .server import ADNServer
+
+if TYPE_CHECKING:
+    from adn_v3.v4.trust_profile import CompiledTrustProfile, TrustProfile
+
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+    503: "Service Unavailable",
+}
+
+
+_INFLIGHT = metrics.REGISTRY.gauge(
+    "adn_http_inflight_requests", "Requests currently being processed by the ADN HTTP front-end."
+)
+_HTTP_RESPONSES = metrics.REGISTRY.counter(
+    "adn_http_responses_total", "HTTP responses written by the ADN front-end.", ("status",)
+)
+
+Response = Tuple[int, Union[Dict[str, Any], str]]
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, error: str) -> None:
+        super().__init__(error)
+        self.status = status
+        self.error = error
+
+
+class ADNHTTPServer:
+    """
+    asyncio HTTP/1.1 server exposing ADN telemetry, health, v3 and v4 endpoints.
+
+    The telemetry engine is stateful, so telemetry requests are serialised
+    by a lock inside the executor; v3 evaluation and v4 verification are
+    stateless and may be in flight together up to `max_concurrency`. They
+    are pure-Python work on a thread pool, so they still take turns on the
+    GIL: the event loop stays responsive, but CPU throughput does not scale
+    with the number of threads.
+
+    The v4 trust profile is compiled once here, not re-validated per request.
+    """
+
+    def __init__(
+        self,
+        server: Optional[ADNServer] = None,
+        *,
+        v3: Any = None,
+        trust_profile: Optional["TrustProfile"] = None,
+        verifier: Optional[Callable[[Dict[str, Any], Dict[str, Any]], bool]] = None,
+        max_body_bytes: int = 1_048_576,
+        max_header_bytes: int = 16_384,
+        max_concurrency: int = 64,
+        keepalive_timeout: float = 15.0,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if max_body_bytes <= 0 or max_header_bytes <= 0 or max_concurrency <= 0:
+            raise ValueError("HTTP server limits must be positive")
+        if v3 is None:
+            from adn_v3 import ADNv3
+
+            v3 = ADNv3()
+        self.adn_server = server or ADNServer(ADNEngine(node_id="adn-http"))
+        self.v3 = v3
+        self.trust_profile: Optional["CompiledTrustProfile"] = None
+        if trust_profile is not None:
+            from adn_v3.v4.trust_profile import compile_trust_profile
+
+            self.trust_profile = compile_trust_profile(trust_profile)
+        self.verifier = verifier
+        self.max_body_bytes = max_body_bytes
+        self.max_header_bytes = max_header_bytes
+        self.max_concurrency = max_concurrency
+        self.keepalive_timeout = keepalive_timeout
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._engine_lock = threading.Lock()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._server: Optional[asyncio.Server] = None
+        self._connections: Set["asyncio.Task[None]"] = set()
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> Tuple[str, int]:
+        """Start listening; returns the bound (host, port) (port 0 picks a free one)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="adn-http"
+            )
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=self.max_header_bytes
+        )
+        sockname = self._server.sockets[0].getsockname()
+        return sockname[0], sockname[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for task in list(self._connections):
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        await self.start(host, port)
+        assert self._server is not None
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    # -------------------------
+    # Routing (runs on the executor)
+    # -------------------------
+
+    def dispatch(self, method: str, path: str, body: bytes) -> Response:
+        """Route one request to the ADN handlers. Pure function of its inputs plus engine state."""
+        if path == "/metrics":
+            if method != "GET":
+                raise _HTTPError(405, "method not allowed")
+            return 200, metrics.render_prometheus()
+
+        if path == "/health":
+            if method != "GET":
+                raise _HTTPError(405, "method not allowed")
+            with self._engine_lock:
+                return 200, self.adn_server.handle_health()
+
+        if path not in ("/telemetry", "/v3/evaluate", "/v4/verify"):
+            raise _HTTPError(404, "not found")
+        if method != "POST":
+            raise _HTTPError(405, "method not allowed")
+
+        if path == "/telemetry":
+            raw = _decode(body)
+            with self._engine_lock:
+                try:
+                    return 200, json.loads(self.adn_server.handle_raw_request(raw))
+                except (ValueError, KeyError) as exc:
+                    raise _HTTPError(400, f"invalid telemetry request: {exc}") from exc
+
+        payload = _parse_json(body)
+        if path == "/v3/evaluate":
+            return 200, self.v3.evaluate(payload)
+        return self._verify_v4(payload)
+
+    def _verify_v4(self, payload: Any) -> Response:
+        if self.trust_profile is None or self.verifier is None:
+            raise _HTTPError(503, "v4 verification is not configured")
+        if not isinstance(payload, dict) or set(payload) != {"verdict", "expected_context_hash", "verification_time"}:
+            raise _HTTPError(400, "v4 verify body must contain verdict, expected_context_hash, verification_time")
+
+        from adn_v3.v4.crypto_verdict import validate_crypto_verdict_envelope
+
+        try:
+            checked = validate_crypto_verdict_envelope(
+                payload["verdict"],
+                expected_context_hash=payload["expected_context_hash"],
+                trust_profile=self.trust_profile,
+                verification_time=payload["verification_time"],
+                verifier=self.verifier,
+            )
+        except ValueError as exc:
+            return 200, {"verified": False, "error": str(exc)}
+        return 200, {"verified": True, "verification_summary": checked["verification_summary"]}
+
+    # -------------------------
+    # Connection handling (event loop)
+    # -------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+        try:
+            await self._serve_connection(reader, writer)
+        except asyncio.CancelledError:
+            # Server shutdown: end the connection quietly instead of
+            # surfacing the cancellation through the stream callback.
+            pass
+        finally:
+            if task is not None:
+                self._connections.discard(task)
+            writer.close()
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while True:
+            try:
+                request = await asyncio.wait_for(self._read_request(reader), self.keepalive_timeout)
+            except _HTTPError as exc:
+                await self._write(writer, exc.status, {"error": exc.error}, keep_alive=False)
+                return
+            except (TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                return
+            if request is None:
+                return
+            method, path, body, keep_alive = request
+
+            assert self._slots is not None
+            async with self._slots:
+                _INFLIGHT.inc()
+                try:
+                    status, response = await self._run(method, path, body)
+                finally:
+                    _INFLIGHT.dec()
+            await self._write(writer, status, response, keep_alive=keep_alive)
+            if not keep_alive:
+                return
+
+    async def _run(self, method: str, path: str, body: bytes) -> Response:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, self.dispatch, method, path, body)
+        except _HTTPError as exc:
+            return exc.status, {"error": exc.error}
+        except Exception:
+            return 500, {"error": "internal error"}
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bytes, bool]]:
+        try:
+            line = await reader.readline()
+        except (asyncio.LimitOverrunError, ValueError) as exc:
+            raise _HTTPError(431, "request line too large") from exc
+        if not line:
+            return None
+        parts = line.decode("latin-1").strip().split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            raise _HTTPError(400, "malformed request line")
+        method, target, version = parts
+
+        headers: Dict[str, str] = {}
+        header_bytes = len(line)
+        while True:
+            try:
+                raw = await reader.readline()
+            except (asyncio.LimitOverrunError, ValueError) as exc:
+                raise _HTTPError(431, "header line too large") from exc
+            header_bytes += len(raw)
+            if header_bytes > self.max_header_bytes:
+                raise _HTTPError(431, "headers too large")
+            if raw in (b"\r\n", b"\n", b""):
+                break
+            name, sep, value = raw.decode("latin-1").partition(":")
+            if not sep:
+                raise _HTTPError(400, "malformed header")
+            headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise _HTTPError(501, "chunked request bodies are not supported")
+
+        body = b""
+        length_raw = headers.get("content-length")
+        if length_raw is not None:
+            try:
+                length = int(length_raw)
+            except ValueError as exc:
+                raise _HTTPError(400, "invalid content-length") from exc
+            if length < 0:
+                raise _HTTPError(400, "invalid content-length")
+            if length > self.max_body_bytes:
+                raise _HTTPError(413, "request body too large")
+            body = await reader.readexactly(length)
+        elif method == "POST":
+            raise _HTTPError(411, "content-length required")
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            keep_alive = connection == "keep-alive"
+        else:
+            keep_alive = connection != "close"
+
+        path = target.split("?", 1)[0]
+        return method.upper(), path, body, keep_alive
+
+    @staticmethod
+    async def _write(
+        writer: asyncio.StreamWriter, status: int, payload: Union[Dict[str, Any], str], *, keep_alive: bool
+    ) -> None:
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), metrics.PROMETHEUS_CONTENT_TYPE
+        else:
+            body, content_type = json.dumps(payload, separators=(",", ":")).encode("utf-8"), "application/json"
+        _HTTP_RESPONSES.inc(labels=(str(status),))
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        ).encode("latin-1")
+        writer.write(head + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+def _decode(body: bytes) -> str:
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise _HTTPError(400, "body must be UTF-8") from exc
+
+
+def _parse_json(body: bytes) -> Any:
+    try:
+        return json.loads(_decode(body))
+    except ValueError as exc:
+        raise _HTTPError(400, "body must be valid JSON") from exc
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="adn-http",
+        description="Active Defense Network — asyncio HTTP/1.1 front-end",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--node-id", default="adn-http")
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    parser.add_argument("--max-body-bytes", type=int, default=1_048_576)
+    ns = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    http = ADNHTTPServer(
+        ADNServer(ADNEngine(node_id=ns.node_id)),
+        max_concurrency=ns.max_concurrency,
+        max_body_bytes=ns.max_body_bytes,
+    )
+    try:
+        asyncio.run(http.serve_forever(ns.host, ns.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,257 @@
+"""
+ADN metrics – dependency-free counters, gauges and fixed-bucket histograms
+
+A tiny in-process registry rendered in the Prometheus text exposition
+format (version 0.0.4). It is wired into:
+
+- adn_v3.ADNv3.evaluate          – decisions and reason codes
+- adn_v2.engine.evaluate_defense – actions, lockdown transitions, severity
+- adn_v3.v4.signing.verify_signature_bundle – verification outcomes
+- adn_v2.http_server             – in-flight requests, GET /metrics
+
+Recording is a dict lookup plus a short uncontended lock, well under a
+microsecond per event (see benchmarks/run.py `metrics_*` cases). Metrics
+are observability only and never feed into decisions or context hashes.
+"""
+
+from __future__ import annotations
+
+import abc
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+LabelValues = Tuple[str, ...]
+Number = Union[int, float]
+
+DEFAULT_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+
+
+def _format_value(value: Number) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_block(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric(abc.ABC):
+    """Shared name / labels / lock handling; subclasses supply `render`."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _check_labels(self, values: Sequence[str]) -> LabelValues:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(v) for v in values)
+
+    @abc.abstractmethod
+    def render(self) -> List[str]:
+        """Prometheus text lines for this metric, HELP/TYPE header included."""
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonic counter, optionally labelled: `c.inc()` or `c.inc(labels=("ALLOW",))`."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, Number] = {}
+
+    def inc(self, amount: Number = 1, labels: LabelValues = ()) -> None:
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        with self._lock:
+            try:
+                self._values[labels] += amount
+            except KeyError:
+                self._values[self._check_labels(labels)] = amount
+
+    def value(self, labels: LabelValues = ()) -> Number:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_label_block(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def inc(self, amount: Number = 1, labels: LabelValues = ()) -> None:
+        with self._lock:
+            try:
+                self._values[labels] += amount
+            except KeyError:
+                self._values[self._check_labels(labels)] = amount
+
+    def dec(self, amount: Number = 1, labels: LabelValues = ()) -> None:
+        self.inc(-amount, labels)
+
+    def set(self, value: Number, labels: LabelValues = ()) -> None:
+        with self._lock:
+            if labels not in self._values:
+                labels = self._check_labels(labels)
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram (buckets are upper bounds, `+Inf` is implicit)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(b) for b in buckets)
+        if not bounds:
+            raise ValueError("histogram needs at least one bucket")
+        self.buckets: Tuple[float, ...] = tuple(bounds)
+        # per label set: [bucket counts..., +Inf count], sum
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        index = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            index += 1
+        with self._lock:
+            counts = self._counts.get(labels)
+            if counts is None:
+                labels = self._check_labels(labels)
+                counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+                self._sums[labels] = 0.0
+            counts[index] += 1
+            self._sums[labels] += value
+
+    def count(self, labels: LabelValues = ()) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = sorted((labels, list(counts), self._sums[labels]) for labels, counts in self._counts.items())
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, hits in zip(self.buckets + (math.inf,), counts, strict=True):
+                cumulative += hits
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_label_block(self.labelnames, labels, le)} {cumulative}")
+            block = _label_block(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{block} {_format_value(total)}")
+            lines.append(f"{self.name}_count{block} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics; `counter` / `gauge` / `histogram` are get-or-create."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, documentation: str, labelnames: Iterable[str], **kwargs: object) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"metric {name} already registered with a different type or labels")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)  # type: ignore[return-value]
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition (version 0.0.4) of every registered metric."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+REGISTRY = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_prometheus(registry: Optional[MetricsRegistry] = None) -> str:
+    return (registry or REGISTRY).render()
+
+
+# --- ADN metric families (process-wide) -------------------------------------
+
+V3_DECISIONS = REGISTRY.counter(
+    "adn_v3_decisions_total", "Shield v3 evaluate() responses by decision.", ("decision",)
+)
+V3_REASON_CODES = REGISTRY.counter(
+    "adn_v3_reason_codes_total", "Reason codes emitted by Shield v3 evaluate().", ("reason_code",)
+)
+DEFENSE_EVENTS = REGISTRY.counter(
+    "adn_defense_events_total", "DefenseEvent objects ingested by evaluate_defense()."
+)
+DEFENSE_ACTIONS = REGISTRY.counter(
+    "adn_defense_actions_total", "DefenseAction entries produced by evaluate_defense().", ("action_type",)
+)
+LOCKDOWN_TRANSITIONS = REGISTRY.counter(
+    "adn_lockdown_transitions_total", "Lockdown state changes made by evaluate_defense().", ("from_state", "to_state")
+)
+DEFENSE_AVG_SEVERITY = REGISTRY.histogram(
+    "adn_defense_avg_severity", "Aggregate average severity computed per evaluate_defense() batch."
+)
+V4_VERIFICATIONS = REGISTRY.counter(
+    "adn_v4_signature_verifications_total", "ADN v4 signature bundle verifications by result.", ("result",)
+)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, overload
 
 
 class RiskLevel(str, Enum):
@@ -139,6 +140,7 @@ class DefenseEvent:
     severity: float  # 0.0 – 1.0
     source: str      # local, sentinel, dqsn, wallet_guard, etc.
     metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: int = 0  # unix seconds; 0 = unknown (deterministic default)
 
 
 @dataclass
@@ -173,6 +175,178 @@ class DefenseAction:
     metadata: Optional[Dict[str, Any]] = None
 
 
+class EventColumns:
+    """
+    Columnar store for the active DefenseEvent history of a node.
+
+    Long-lived defense states can accumulate many events, so instead of a
+    list of dataclass objects each field is kept in its own contiguous
+    buffer:
+    - severities  – array('d')
+    - timestamps  – array('q')
+    - event_type / source – small-int codes into interned name tables
+    - metadata    – side table keyed by row, only for non-empty dicts
+
+    The severity total is kept as a running sum, so severity_sum() is O(1)
+    however long the history grows; other aggregations (per-source
+    breakdowns) run directly over the buffers. The store still behaves like a read-mostly list of
+    DefenseEvent: iterating or indexing materialises fresh DefenseEvent
+    objects, so mutating those copies does not change the store. Metadata
+    dicts are copied (shallowly) both on append and on materialisation.
+    """
+
+    __slots__ = (
+        "severities",
+        "timestamps",
+        "event_type_codes",
+        "source_codes",
+        "event_type_names",
+        "source_names",
+        "metadata",
+        "_severity_total",
+        "_event_type_index",
+        "_source_index",
+    )
+
+    def __init__(self, events: Optional[Iterable[DefenseEvent]] = None) -> None:
+        self.severities: array = array("d")
+        self.timestamps: array = array("q")
+        self.event_type_codes: array = array("I")
+        self.source_codes: array = array("I")
+        self.event_type_names: List[str] = []
+        self.source_names: List[str] = []
+        self.metadata: Dict[int, Dict[str, Any]] = {}
+        self._severity_total = 0.0
+        self._event_type_index: Dict[str, int] = {}
+        self._source_index: Dict[str, int] = {}
+        if events is not None:
+            self.extend(events)
+
+    @staticmethod
+    def _intern(name: str, index: Dict[str, int], names: List[str]) -> int:
+        code = index.get(name)
+        if code is None:
+            code = len(names)
+            index[name] = code
+            names.append(name)
+        return code
+
+    def event_type_code(self, event_type: str) -> int:
+        """Return (and intern if needed) the small-int code of an event_type."""
+        return self._intern(event_type, self._event_type_index, self.event_type_names)
+
+    def source_code(self, source: str) -> int:
+        """Return (and intern if needed) the small-int code of a source."""
+        return self._intern(source, self._source_index, self.source_names)
+
+    def append(self, event: DefenseEvent) -> None:
+        row = len(self.severities)
+        severity = float(event.severity)
+        self.severities.append(severity)
+        self._severity_total += severity
+        self.timestamps.append(int(event.timestamp))
+        self.event_type_codes.append(self.event_type_code(event.event_type))
+        self.source_codes.append(self.source_code(event.source))
+        if event.metadata:
+            self.metadata[row] = dict(event.metadata)
+
+    def extend(self, events: Iterable[DefenseEvent]) -> None:
+        for event in events:
+            self.append(event)
+
+    def clear(self) -> None:
+        """Drop all rows while keeping the interned name tables."""
+        del self.severities[:]
+        del self.timestamps[:]
+        del self.event_type_codes[:]
+        del self.source_codes[:]
+        self.metadata.clear()
+        self._severity_total = 0.0
+
+    def severity_sum(self) -> float:
+        return self._severity_total
+
+    def average_severity_by_source(self) -> Dict[str, float]:
+        """Average severity per source, computed over the column buffers."""
+        totals = [0.0] * len(self.source_names)
+        counts = [0] * len(self.source_names)
+        for code, severity in zip(self.source_codes, self.severities, strict=True):
+            totals[code] += severity
+            counts[code] += 1
+        return {
+            name: totals[code] / counts[code]
+            for code, name in enumerate(self.source_names)
+            if counts[code]
+        }
+
+    def _event_at(self, row: int) -> DefenseEvent:
+        meta = self.metadata.get(row)
+        return DefenseEvent(
+            event_type=self.event_type_names[self.event_type_codes[row]],
+            severity=self.severities[row],
+            source=self.source_names[self.source_codes[row]],
+            metadata=dict(meta) if meta is not None else {},
+            timestamp=self.timestamps[row],
+        )
+
+    def __len__(self) -> int:
+        return len(self.severities)
+
+    def __iter__(self) -> Iterator[DefenseEvent]:
+        for row in range(len(self.severities)):
+            yield self._event_at(row)
+
+    @overload
+    def __getitem__(self, index: int) -> DefenseEvent: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[DefenseEvent]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[DefenseEvent, List[DefenseEvent]]:
+        if isinstance(index, slice):
+            return [self._event_at(row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("event index out of range")
+        return self._event_at(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (EventColumns, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EventColumns(len={len(self)}, sources={self.source_names!r})"
+
+
+@dataclass
+class EventAggregate:
+    """
+    Running aggregate for one source or event_type.
+
+    Updated incrementally by evaluate_defense, one event at a time, so
+    reading a breakdown never requires a scan of the active history.
+    """
+
+    count: int = 0
+    severity_sum: float = 0.0
+    severity_max: float = 0.0
+    last_seen: int = 0  # latest DefenseEvent.timestamp observed
+
+    def add(self, severity: float, timestamp: int = 0) -> None:
+        self.count += 1
+        self.severity_sum += severity
+        if self.count == 1 or severity > self.severity_max:
+            self.severity_max = severity
+        if timestamp > self.last_seen:
+            self.last_seen = timestamp
+
+    @property
+    def severity_avg(self) -> float:
+        return self.severity_sum / self.count if self.count else 0.0
+
+
 @dataclass
 class NodeDefenseState:
     """
@@ -181,10 +355,38 @@ class NodeDefenseState:
     It tracks:
     - the current RiskLevel,
     - which LockdownState is active, and
-    - a list of active events and most recent actions.
+    - the active events (columnar EventColumns store) and most recent actions,
+    - per-source and per-event_type EventAggregate breakdowns.
+
+    A plain list passed as `active_events` is converted to EventColumns, and
+    the breakdowns are seeded from it when none were supplied.
     """
 
     risk_level: RiskLevel = RiskLevel.NORMAL
     lockdown_state: LockdownState = LockdownState.NONE
-    active_events: List[DefenseEvent] = field(default_factory=list)
+    active_events: EventColumns = field(default_factory=EventColumns)
     last_actions: List[DefenseAction] = field(default_factory=list)
+    source_aggregates: Dict[str, EventAggregate] = field(default_factory=dict)
+    event_type_aggregates: Dict[str, EventAggregate] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.active_events, EventColumns):
+            self.active_events = EventColumns(self.active_events)
+        if self.active_events and not (self.source_aggregates or self.event_type_aggregates):
+            self.record_aggregates(self.active_events)
+
+    def record_aggregates(self, events: Iterable[DefenseEvent]) -> None:
+        """Fold a batch of events into the per-source / per-event_type aggregates."""
+        by_source = self.source_aggregates
+        by_type = self.event_type_aggregates
+        for event in events:
+            severity = float(event.severity)
+            timestamp = int(event.timestamp)
+            agg = by_source.get(event.source)
+            if agg is None:
+                agg = by_source[event.source] = EventAggregate()
+            agg.add(severity, timestamp)
+            agg = by_type.get(event.event_type)
+            if agg is None:
+                agg = by_type[event.event_type] = EventAggregate()
+            agg.add(severity, timestamp)
@@ -1,32 +1,161 @@
 """
-ADN v2 Policy Engine (placeholder)
+ADN v2 Policy Engine – RiskSignal[*] → PolicyDecision
 
-This minimal version exists so imports succeed during CI testing.
-Full implementation will be added soon.
+The engine reduces a signal list to three features:
+
+- max level     – highest RiskLevel among the signals
+- source set    – distinct sources reporting that max level
+- score bucket  – mean signal score, bucketed into tenths
+
+Every (max level, corroboration, score bucket) combination is compiled
+into a decision table at construction time, so `decide` is a feature
+extraction plus one dict lookup. Whole outcomes are additionally memoized
+per signal signature (source, level, score, reason), which makes steady
+telemetry streams — where the same few signatures repeat — close to free.
+
+Escalation rules (applied when the table is compiled):
+- corroboration: two or more distinct sources at the max level (above
+  NORMAL) escalate one level
+- score: a mean score at or above BASELINE_THRESHOLDS["critical"] is
+  CRITICAL regardless of signal levels. Buckets wholly at or above the
+  threshold are escalated in the table; when the threshold falls inside a
+  bucket, that bucket alone compares the exact mean at decision time.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .config import BASELINE_THRESHOLDS
+from .models import PolicyDecision, RiskLevel, RiskSignal
+
 
+_ORDER: Tuple[RiskLevel, ...] = (RiskLevel.NORMAL, RiskLevel.ELEVATED, RiskLevel.HIGH, RiskLevel.CRITICAL)
+_RANK: Dict[RiskLevel, int] = {level: rank for rank, level in enumerate(_ORDER)}
 
-@dataclass
-class PolicyDecision:
-    allow: bool
-    reason: str
-    level: str = "normal"
+SCORE_BUCKETS = 10
+
+DEFAULT_ACTIONS: Dict[RiskLevel, Tuple[str, ...]] = {
+    RiskLevel.NORMAL: (),
+    RiskLevel.ELEVATED: ("enable_logging",),
+    RiskLevel.HIGH: ("enable_logging", "enter_cooldown"),
+    RiskLevel.CRITICAL: ("enable_logging", "enter_cooldown", "lockdown_trigger"),
+}
+
+# (final level, suggested actions)
+_Outcome = Tuple[RiskLevel, Tuple[str, ...]]
+# (level, score, reason, actions) – PolicyDecision fields, rebuilt per call
+_Memo = Tuple[RiskLevel, float, str, Tuple[str, ...]]
+
+
+def score_bucket(score: float) -> int:
+    """Bucket a 0.0–1.0 score into 0..SCORE_BUCKETS-1 (out-of-range scores are clamped)."""
+    if score <= 0.0:
+        return 0
+    return min(int(score * SCORE_BUCKETS), SCORE_BUCKETS - 1)
 
 
 class PolicyEngine:
-    def __init__(self):
-        self.rules = {}
-
-    def evaluate(self, telemetry: Dict[str, Any]) -> PolicyDecision:
-        """
-        Minimal placeholder evaluation.
-        Returns a safe default decision.
-        """
-        return PolicyDecision(
-            allow=True,
-            reason="placeholder-policy-engine",
-            level="normal"
-        )
+    """
+    Reference ADN v2 policy engine.
+
+    `decide(signals)` returns a PolicyDecision with the final level, the
+    mean signal score, the signal reasons joined by " | " and the actions
+    suggested for that level. Returned decisions are fresh objects; only
+    their immutable inputs are cached.
+
+    Parameters:
+    - actions: per-level suggested actions (defaults to DEFAULT_ACTIONS)
+    - critical_score: mean score that forces CRITICAL
+    - corroboration_sources: distinct sources at the max level needed to
+      escalate one level
+    - memo_size: max cached signal signatures (cache is reset when full)
+    """
+
+    def __init__(
+        self,
+        actions: Optional[Mapping[RiskLevel, Sequence[str]]] = None,
+        *,
+        critical_score: float = BASELINE_THRESHOLDS["critical"],
+        corroboration_sources: int = 2,
+        memo_size: int = 4096,
+    ) -> None:
+        if corroboration_sources < 2:
+            raise ValueError("corroboration_sources must be at least 2")
+        self.actions: Dict[RiskLevel, Tuple[str, ...]] = dict(DEFAULT_ACTIONS)
+        if actions:
+            self.actions.update({RiskLevel(k): tuple(v) for k, v in actions.items()})
+        self.critical_score = critical_score
+        self.corroboration_sources = corroboration_sources
+        self.memo_size = memo_size
+        self._critical_bucket = score_bucket(critical_score)
+        self._critical: _Outcome = (RiskLevel.CRITICAL, self.actions[RiskLevel.CRITICAL])
+        self.table: Dict[Tuple[RiskLevel, bool, int], _Outcome] = self._compile()
+        self._memo: Dict[Hashable, _Memo] = {}
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def _compile(self) -> Dict[Tuple[RiskLevel, bool, int], _Outcome]:
+        table: Dict[Tuple[RiskLevel, bool, int], _Outcome] = {}
+        for level in _ORDER:
+            for corroborated in (False, True):
+                for bucket in range(SCORE_BUCKETS):
+                    rank = _RANK[level]
+                    if corroborated and level is not RiskLevel.NORMAL:
+                        rank = min(rank + 1, len(_ORDER) - 1)
+                    if bucket > self._critical_bucket or bucket / SCORE_BUCKETS >= self.critical_score:
+                        rank = len(_ORDER) - 1
+                    final = _ORDER[rank]
+                    table[(level, corroborated, bucket)] = (final, self.actions[final])
+        return table
+
+    def decide(self, signals: Iterable[RiskSignal]) -> PolicyDecision:
+        signals = signals if isinstance(signals, list) else list(signals)
+        try:
+            key: Optional[Hashable] = tuple(
+                (s.source, s.level, s.score, s.details.get("reason")) for s in signals
+            )
+            memo = self._memo.get(key)
+        except TypeError:  # unhashable reason detail – skip the cache
+            key = memo = None
+
+        if memo is None:
+            self.memo_misses += 1
+            memo = self._evaluate(signals)
+            if key is not None:
+                if len(self._memo) >= self.memo_size:
+                    self._memo.clear()
+                self._memo[key] = memo
+        else:
+            self.memo_hits += 1
+
+        level, score, reason, actions = memo
+        return PolicyDecision(level=level, score=score, reason=reason, actions=list(actions))
+
+    def _evaluate(self, signals: List[RiskSignal]) -> _Memo:
+        if not signals:
+            level, actions = self.table[(RiskLevel.NORMAL, False, 0)]
+            return level, 0.0, "no_signals", actions
+
+        top = max(_RANK[s.level] for s in signals)
+        top_level = _ORDER[top]
+        sources = {s.source for s in signals if _RANK[s.level] == top}
+        score = sum(s.score for s in signals) / len(signals)
+
+        corroborated = len(sources) >= self.corroboration_sources
+        bucket = score_bucket(score)
+        if bucket == self._critical_bucket and score >= self.critical_score:
+            level, actions = self._critical
+        else:
+            level, actions = self.table[(top_level, corroborated, bucket)]
+
+        reasons: List[str] = []
+        for s in signals:
+            reason = str(s.details.get("reason", s.source))
+            if reason not in reasons:
+                reasons.append(reason)
+        return level, round(score, 6), " | ".join(reasons), actions
+
+    def clear_cache(self) -> None:
+        self._memo.clear()
+        self.memo_hits = self.memo_misses = 0
@@ -0,0 +1,152 @@
+"""
+ADN v2 risk rules – declarative telemetry heuristics
+
+A RiskRule says "if <field> <op> <threshold>, emit a RiskSignal with this
+level and score". Rules are plain config data (see config.RISK_RULES)
+and are compiled once into a RulePlan:
+
+- rules are grouped by field, so each field is read from the packet once
+- ordered comparisons on the same field are chained by threshold, so the
+  first failing comparison ends the chain (e.g. mempool > 20000 failing
+  means mempool > 50000 is never evaluated)
+- signal level/score/reason are resolved at compile time
+
+Evaluation cost is therefore linear in the number of rules in the worst
+case and usually much lower.
+"""
+
+from __future__ import annotations
+
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .config import BASELINE_THRESHOLDS, HARDENED_MODE, HARDENED_RISK_RULES, RISK_RULES
+from .models import RiskLevel, RiskSignal, TelemetryPacket
+
+
+_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+_PACKET_FIELDS = ("height", "mempool_size", "peer_count", "timestamp")
+
+# Level → BASELINE_THRESHOLDS key used when a rule does not set a score.
+_THRESHOLD_KEYS = {
+    RiskLevel.NORMAL: "low",
+    RiskLevel.ELEVATED: "elevated",
+    RiskLevel.HIGH: "high",
+    RiskLevel.CRITICAL: "critical",
+}
+
+
+@dataclass(frozen=True)
+class RiskRule:
+    """Single `field op threshold → level/score` heuristic."""
+
+    name: str
+    field: str
+    op: str
+    threshold: float
+    level: RiskLevel
+    score: float
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any], thresholds: Optional[Mapping[str, float]] = None) -> "RiskRule":
+        try:
+            name = str(raw["name"])
+            field_name = str(raw["field"])
+            op = str(raw["op"])
+            threshold = raw["threshold"]
+            level = RiskLevel(raw["level"])
+        except KeyError as exc:
+            raise ValueError(f"risk rule missing key: {exc.args[0]}") from exc
+        if op not in _OPS:
+            raise ValueError(f"risk rule {name}: unsupported op {op!r}")
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)):
+            raise ValueError(f"risk rule {name}: threshold must be numeric")
+
+        score = raw.get("score")
+        if score is None:
+            score = (thresholds or BASELINE_THRESHOLDS)[_THRESHOLD_KEYS[level]]
+        return cls(name=name, field=field_name, op=op, threshold=threshold, level=level, score=float(score))
+
+
+RuleLike = Union[RiskRule, Mapping[str, Any]]
+
+# (compare, threshold, level, score, reason)
+_Check = Tuple[Callable[[Any, Any], bool], float, RiskLevel, float, str]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class RulePlan:
+    """
+    Compiled, flat evaluation plan for a rule set.
+
+    `steps` holds one entry per field: (field, is_extra, chains), where each
+    chain is a list of checks that short-circuits on the first miss.
+    """
+
+    __slots__ = ("rules", "steps")
+
+    def __init__(self, rules: Iterable[RiskRule]) -> None:
+        self.rules: Tuple[RiskRule, ...] = tuple(rules)
+        by_field: Dict[str, List[RiskRule]] = {}
+        for rule in self.rules:
+            by_field.setdefault(rule.field, []).append(rule)
+
+        steps: List[Tuple[str, bool, Tuple[Tuple[_Check, ...], ...]]] = []
+        for field_name, rules in by_field.items():
+            chains: List[Tuple[_Check, ...]] = []
+            # Ascending thresholds for >/>=: once x > t fails, x > t' fails for all t' >= t.
+            rising = sorted((r for r in rules if r.op in (">", ">=")), key=lambda r: (r.threshold, r.op == ">"))
+            # Descending thresholds for </<=: mirror image of the above.
+            falling = sorted((r for r in rules if r.op in ("<", "<=")), key=lambda r: (-r.threshold, r.op == "<"))
+            for ordered in (falling, rising):
+                if ordered:
+                    chains.append(tuple(_check(r) for r in ordered))
+            chains.extend((_check(r),) for r in rules if r.op in ("==", "!="))
+            steps.append((field_name, field_name not in _PACKET_FIELDS, tuple(chains)))
+        self.steps = tuple(steps)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def evaluate(self, packet: TelemetryPacket) -> List[RiskSignal]:
+        signals: List[RiskSignal] = []
+        extra = packet.extra
+        for field_name, is_extra, chains in self.steps:
+            value = extra.get(field_name) if is_extra else getattr(packet, field_name)
+            if not _is_number(value):
+                continue
+            for chain in chains:
+                for compare, threshold, level, score, reason in chain:
+                    if not compare(value, threshold):
+                        break
+                    signals.append(RiskSignal(source="telemetry", level=level, score=score, details={"reason": reason}))
+        return signals
+
+
+def _check(rule: RiskRule) -> _Check:
+    return (_OPS[rule.op], rule.threshold, rule.level, rule.score, rule.name)
+
+
+def compile_rules(rules: Iterable[RuleLike], thresholds: Optional[Mapping[str, float]] = None) -> RulePlan:
+    """Validate rule dicts / RiskRule objects and compile them into a RulePlan."""
+    return RulePlan(r if isinstance(r, RiskRule) else RiskRule.from_dict(r, thresholds) for r in rules)
+
+
+def default_rules() -> List[Dict[str, Any]]:
+    """config.RISK_RULES plus config.HARDENED_RISK_RULES when hardened mode is enabled."""
+    rules = list(RISK_RULES)
+    if HARDENED_MODE.get("enabled"):
+        rules.extend(HARDENED_RISK_RULES)
+    return rules
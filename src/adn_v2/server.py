@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from .engine import ADNEngine
 
@@ -14,6 +14,9 @@ class ADNServer:
     Here we only define pure-Python handlers that accept dicts and return dicts.
     """
 
+    # Upper bound on snapshots accepted in one telemetry_batch request.
+    MAX_BATCH_ITEMS = 10_000
+
     def __init__(self, engine: ADNEngine) -> None:
         self.engine = engine
 
@@ -27,6 +30,41 @@ class ADNServer:
             "actions": decision.actions,
         }
 
+    def handle_telemetry_batch(self, payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run many buffered telemetry snapshots through the engine in order.
+
+        The node_id is reported once for the whole batch; each entry in
+        `decisions` carries level / score / reason / actions, in input order.
+        """
+        if not isinstance(payloads, list):
+            raise ValueError("telemetry_batch data must be a list")
+        if len(payloads) > self.MAX_BATCH_ITEMS:
+            raise ValueError("telemetry_batch exceeds MAX_BATCH_ITEMS")
+        # Checked up front so a bad item rejects the batch before any
+        # snapshot has touched engine state.
+        if not all(isinstance(raw, dict) for raw in payloads):
+            raise ValueError("telemetry_batch items must be objects")
+
+        process = self.engine.process_raw_telemetry
+        decisions: List[Dict[str, Any]] = []
+        append = decisions.append
+        for raw in payloads:
+            decision = process(raw)
+            append(
+                {
+                    "level": decision.level.value,
+                    "score": decision.score,
+                    "reason": decision.reason,
+                    "actions": decision.actions,
+                }
+            )
+        return {
+            "node_id": self.engine.state.node_id,
+            "count": len(decisions),
+            "decisions": decisions,
+        }
+
     def handle_health(self) -> Dict[str, Any]:
         state = self.engine.state
         return {
@@ -42,8 +80,13 @@ class ADNServer:
 
     def handle_raw_request(self, body: str) -> str:
         payload = json.loads(body)
-        if payload.get("type") == "telemetry":
+        if not isinstance(payload, dict):
+            raise ValueError("request body must be a JSON object")
+        request_type = payload.get("type")
+        if request_type == "telemetry":
             response = self.handle_telemetry(payload["data"])
+        elif request_type == "telemetry_batch":
+            response = self.handle_telemetry_batch(payload["data"])
         else:
             response = self.handle_health()
         return json.dumps(response)
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import json
+import mmap
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from .models import TelemetryPacket
 
@@ -18,6 +23,13 @@ Security/Determinism note:
 - We must NOT default missing timestamps to the current system time,
   because that makes identical inputs produce different outputs.
 - If timestamp is missing or invalid, we default deterministically to 0.0.
+
+JSONL replay:
+- JSONLTelemetryReader streams TelemetryPackets from JSON Lines archives
+  (memory-mapped or buffered), one line at a time, counting and skipping
+  malformed lines instead of failing the whole replay.
+- jsonl_chunk_offsets / read_jsonl_parallel split an archive into byte
+  ranges aligned to line boundaries and parse them across processes.
 """
 
 
@@ -60,3 +72,168 @@ class TelemetryAdapter:
                 if k not in {"height", "mempool_size", "peer_count", "timestamp"}
             },
         )
+
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+@dataclass
+class JSONLStats:
+    """Counters for a JSONL replay (lines seen, packets produced, lines skipped)."""
+
+    lines: int = 0
+    packets: int = 0
+    blank: int = 0
+    malformed: int = 0
+
+    def merge(self, other: "JSONLStats") -> None:
+        self.lines += other.lines
+        self.packets += other.packets
+        self.blank += other.blank
+        self.malformed += other.malformed
+
+
+class JSONLTelemetryReader:
+    """
+    Lazy TelemetryPacket reader for (multi-gigabyte) JSON Lines archives.
+
+    Only the byte range [start, end) is read; a line belongs to the range
+    its first byte falls in, so adjacent ranges never double-count or drop
+    a line. Lines that are not valid UTF-8 JSON objects are skipped and
+    counted in `stats.malformed`.
+
+    With use_mmap=True (default) the file is memory-mapped and lines are
+    sliced straight out of the page cache; otherwise a buffered binary
+    file object is used.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        *,
+        node_id: str = "unknown",
+        adapter: Optional[TelemetryAdapter] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+        use_mmap: bool = True,
+    ) -> None:
+        if start < 0 or (end is not None and end < start):
+            raise ValueError("invalid JSONL byte range")
+        self.path = os.fspath(path)
+        self.node_id = node_id
+        self.adapter = adapter or TelemetryAdapter()
+        self.start = start
+        self.end = end
+        self.use_mmap = use_mmap
+        self.stats = JSONLStats()
+
+    def _lines(self) -> Iterator[bytes]:
+        with open(self.path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            end = size if self.end is None else min(self.end, size)
+            if self.start >= end:
+                return
+            if self.use_mmap:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from _iter_range(mapped, self.start, end)
+            else:
+                yield from _iter_range(handle, self.start, end)
+
+    def __iter__(self) -> Iterator[TelemetryPacket]:
+        parse = self.adapter.parse
+        node_id = self.node_id
+        stats = self.stats
+        loads = json.loads
+        for line in self._lines():
+            stats.lines += 1
+            if not line.strip():
+                stats.blank += 1
+                continue
+            try:
+                raw = loads(line)
+            except ValueError:
+                stats.malformed += 1
+                continue
+            if not isinstance(raw, dict):
+                stats.malformed += 1
+                continue
+            stats.packets += 1
+            yield parse(raw, node_id=node_id)
+
+
+def _iter_range(source: Any, start: int, end: int) -> Iterator[bytes]:
+    # `source` is an mmap or a binary file; both support seek/readline/tell.
+    if start > 0:
+        # Align to the first line starting at or after `start`.
+        source.seek(start - 1)
+        source.readline()
+    else:
+        source.seek(0)
+    readline = source.readline
+    tell = source.tell
+    while tell() < end:
+        line = readline()
+        if not line:
+            break
+        yield line
+
+
+def jsonl_chunk_offsets(path: PathLike, chunks: int) -> List[Tuple[int, int]]:
+    """Split a file into `chunks` contiguous byte ranges for JSONLTelemetryReader."""
+    if chunks <= 0:
+        raise ValueError("chunks must be positive")
+    size = os.path.getsize(path)
+    step = max(1, -(-size // chunks))
+    return [(offset, min(offset + step, size)) for offset in range(0, size, step)]
+
+
+_Chunk = Tuple[List[TelemetryPacket], JSONLStats]
+
+
+def _parse_jsonl_chunk(
+    path: str, start: int, end: int, node_id: str, adapter: Optional[TelemetryAdapter], use_mmap: bool
+) -> _Chunk:
+    reader = JSONLTelemetryReader(path, node_id=node_id, adapter=adapter, start=start, end=end, use_mmap=use_mmap)
+    packets = list(reader)
+    return packets, reader.stats
+
+
+def read_jsonl_parallel(
+    path: PathLike,
+    *,
+    node_id: str = "unknown",
+    adapter: Optional[TelemetryAdapter] = None,
+    use_mmap: bool = True,
+    workers: Optional[int] = None,
+    chunk_bytes: int = 64 * 1024 * 1024,
+    stats: Optional[JSONLStats] = None,
+) -> Iterator[TelemetryPacket]:
+    """
+    Parse a JSONL archive across worker processes, yielding packets in file order.
+
+    The file is cut into ~chunk_bytes ranges; at most `workers` chunks are
+    in flight at once, so peak memory is bounded by workers * chunk_bytes
+    worth of parsed packets. Per-chunk counters are merged into `stats`.
+
+    `adapter` and `use_mmap` are handed to each chunk's JSONLTelemetryReader;
+    the adapter is pickled into the worker processes, so it must be
+    picklable (e.g. an instance of a module-level class).
+    """
+    if chunk_bytes <= 0:
+        raise ValueError("chunk_bytes must be positive")
+    clean_path = os.fspath(path)
+    size = os.path.getsize(clean_path)
+    ranges = jsonl_chunk_offsets(clean_path, max(1, -(-size // chunk_bytes))) if size else []
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: List["Future[_Chunk]"] = []
+        next_range = 0
+        while next_range < len(ranges) or pending:
+            while next_range < len(ranges) and len(pending) < workers:
+                start, end = ranges[next_range]
+                pending.append(pool.submit(_parse_jsonl_chunk, clean_path, start, end, node_id, adapter, use_mmap))
+                next_range += 1
+            packets, chunk_stats = pending.pop(0).result()
+            if stats is not None:
+                stats.merge(chunk_stats)
+            yield from packets
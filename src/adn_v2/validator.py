@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Iterable, List, Optional
 
 from .models import (
     RiskSignal,
     TelemetryPacket,
     RiskLevel,
 )
+from .baseline import BaselineTracker
+from .rules import RuleLike, RulePlan, compile_rules, default_rules
 
 
 """
@@ -23,46 +25,33 @@ core engine.
 
 class RiskValidator:
     """
-    Minimal reference validator for ADN v2.
+    Reference validator for ADN v2.
 
     It inspects TelemetryPacket fields and produces a list of
-    RiskSignal entries. The logic is intentionally simple:
+    RiskSignal entries using a declarative rule set (see adn_v2.rules).
+    By default the rules come from config.RISK_RULES (plus
+    config.HARDENED_RISK_RULES in hardened mode):
     - low peer count → elevated risk
     - large mempool spike → high risk
     - otherwise → normal baseline
 
-    This keeps v2 tests and CI clean while providing a realistic
-    entry point for future expansion.
+    Pass `rules=` to run a custom rule set; it is compiled once here.
+    Pass `baseline=BaselineTracker()` to also flag packets that leave the
+    node's own learned normal range (see adn_v2.baseline).
     """
 
-    def derive_signals(self, packet: TelemetryPacket) -> List[RiskSignal]:
-        signals: List[RiskSignal] = []
-
-        # ---------------------------
-        # Simple heuristics for v2
-        # ---------------------------
-
-        # Very low peer connectivity → mild/elevated risk
-        if packet.peer_count < 2:
-            signals.append(
-                RiskSignal(
-                    source="telemetry",
-                    level=RiskLevel.ELEVATED,
-                    score=0.6,
-                    details={"reason": "low_peer_count"},
-                )
-            )
+    def __init__(
+        self,
+        rules: Optional[Iterable[RuleLike]] = None,
+        baseline: Optional[BaselineTracker] = None,
+    ) -> None:
+        self.plan: RulePlan = compile_rules(default_rules() if rules is None else rules)
+        self.baseline = baseline
 
-        # Mempool spike → potential congestion / attack pattern
-        if packet.mempool_size > 20000:
-            signals.append(
-                RiskSignal(
-                    source="telemetry",
-                    level=RiskLevel.HIGH,
-                    score=0.8,
-                    details={"reason": "mempool_spike"},
-                )
-            )
+    def derive_signals(self, packet: TelemetryPacket) -> List[RiskSignal]:
+        signals = self.plan.evaluate(packet)
+        if self.baseline is not None:
+            signals.extend(self.baseline.observe(packet))
 
         # No notable anomalies → baseline “normal” signal
         if not signals:
@@ -4,8 +4,29 @@ ADN v3 (authoritative)
 This package is the canonical implementation of the ADN Shield Contract v3 surface.
 
 Legacy code remains under `adn_v2` for reference/compatibility only.
+
+`ADNv3` is resolved lazily (PEP 562): importing `adn_v3.contracts.*` or
+`adn_v3.v4.*` does not pull in the v2 defense engine.
 """
 
-from .core import ADNv3
+from __future__ import annotations
+
+import importlib
+from typing import Any, List
 
 __all__ = ["ADNv3"]
+
+_LAZY_ATTRS = {"ADNv3": ".core"}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
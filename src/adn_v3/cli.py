@@ -0,0 +1,157 @@
+"""
+adn-v3 command line.
+
+    python -m adn_v3.cli eval-batch requests.jsonl -o responses.jsonl --workers 8
+
+`eval-batch` streams Shield v3 requests (one JSON object per line, from a
+file or stdin), evaluates them with ADNv3 across worker processes and
+writes one canonical JSON response per line in input order. Lines that
+are not valid JSON are answered with the same fail-closed ERROR response
+`ADNv3.evaluate` gives any malformed request. Blank lines are skipped.
+
+A throughput / latency summary (per-request evaluate() time measured in
+the worker) is printed to stderr when the run ends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Any
+
+from .core import ADNv3
+
+# (response line, evaluate() latency in ns, decision)
+Result = tuple[str, int, str]
+
+_ENGINE = ADNv3()
+
+
+def _evaluate_chunk(lines: list[str]) -> list[Result]:
+    results: list[Result] = []
+    for line in lines:
+        started = time.perf_counter_ns()
+        try:
+            request: Any = json.loads(line)
+        except ValueError:
+            request = None
+        response = _ENGINE.evaluate(request)
+        elapsed = time.perf_counter_ns() - started
+        results.append((json.dumps(response, sort_keys=True, separators=(",", ":")), elapsed, response["decision"]))
+    return results
+
+
+def _chunks(stream: Iterable[str], size: int) -> Iterator[list[str]]:
+    chunk: list[str] = []
+    for line in stream:
+        if not line.strip():
+            continue
+        chunk.append(line)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def evaluate_lines(stream: Iterable[str], *, workers: int = 1, chunk_size: int = 64) -> Iterator[Result]:
+    """Evaluate JSONL request lines, yielding results in input order."""
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers and chunk_size must be positive")
+    chunks = _chunks(stream, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield from _evaluate_chunk(chunk)
+        return
+
+    # At most 2 chunks per worker in flight keeps memory bounded on huge inputs.
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future[list[Result]]] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_evaluate_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _percentile(sorted_ns: array, pct: float) -> float:
+    if not sorted_ns:
+        return 0.0
+    index = min(len(sorted_ns) - 1, int(round(pct / 100.0 * (len(sorted_ns) - 1))))
+    return round(float(sorted_ns[index]) / 1000.0, 1)
+
+
+def eval_batch(source: IO[str], sink: IO[str], *, workers: int = 1, chunk_size: int = 64) -> dict[str, Any]:
+    """Run a batch from `source` to `sink` and return the summary dict."""
+    latencies = array("q")
+    decisions: dict[str, int] = {}
+    started = time.perf_counter()
+    for line, elapsed_ns, decision in evaluate_lines(source, workers=workers, chunk_size=chunk_size):
+        sink.write(line)
+        sink.write("\n")
+        latencies.append(elapsed_ns)
+        decisions[decision] = decisions.get(decision, 0) + 1
+    elapsed = time.perf_counter() - started
+
+    ordered = array("q", sorted(latencies))
+    return {
+        "requests": len(latencies),
+        "decisions": dict(sorted(decisions.items())),
+        "workers": workers,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        "latency_us": {
+            "p50": _percentile(ordered, 50),
+            "p90": _percentile(ordered, 90),
+            "p99": _percentile(ordered, 99),
+            "max": _percentile(ordered, 100),
+        },
+    }
+
+
+def _positive_int(text: str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return value
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="adn-v3", description="ADN Shield v3 command line")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    batch = sub.add_parser("eval-batch", help="evaluate Shield v3 requests from JSONL")
+    batch.add_argument("input", nargs="?", default="-", help="JSONL file of requests ('-' for stdin)")
+    batch.add_argument("-o", "--output", default="-", help="JSONL file for responses ('-' for stdout)")
+    batch.add_argument("-j", "--workers", type=_positive_int, default=1, help="worker processes")
+    batch.add_argument("--chunk-size", type=_positive_int, default=64, help="requests per worker task")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ns = _parse_args(sys.argv[1:] if argv is None else argv)
+    source = sys.stdin if ns.input == "-" else open(ns.input, encoding="utf-8")
+    sink = sys.stdout if ns.output == "-" else open(ns.output, "w", encoding="utf-8")
+    try:
+        summary = eval_batch(source, sink, workers=ns.workers, chunk_size=ns.chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    print(json.dumps(summary, indent=2), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
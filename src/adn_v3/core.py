@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 import json
 
 from adn_v2.models import DefenseEvent, NodeDefenseConfig, NodeDefenseState, RiskLevel, LockdownState
 from adn_v2.engine import evaluate_defense
+from adn_v2 import metrics
 
 from .contracts.v3_hash import canonical_sha256
 from .contracts.v3_reason_codes import ReasonCode
 from .contracts.v3_types import ADNv3Request
+from .observability import StageObserver, StageTimer
 
 
 @dataclass(frozen=True)
@@ -25,9 +27,14 @@ class ADNv3:
 
     Glass-box invariant:
     - contract payload must be deterministic (no timestamps / runtime timing)
+
+    Runtime timing is available out-of-band only: an optional `observer`
+    receives per-stage perf_counter_ns durations (see adn_v3.observability)
+    and never influences the response or its context_hash.
     """
 
     config: Optional[NodeDefenseConfig] = None
+    observer: Optional[StageObserver] = field(default=None, compare=False, repr=False)
 
     COMPONENT: str = "adn"
     CONTRACT_VERSION: int = 3
@@ -37,6 +44,18 @@ class ADNv3:
     MAX_METADATA_BYTES: int = 16_384  # 16KB
 
     def evaluate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if self.observer is None:
+            response = self._evaluate(request, None)
+        else:
+            timer = StageTimer(self.observer)
+            response = self._evaluate(request, timer)
+            timer.finish("error" if response["decision"] == "ERROR" else "total")
+        metrics.V3_DECISIONS.inc(labels=(response["decision"],))
+        for reason_code in response["reason_codes"]:
+            metrics.V3_REASON_CODES.inc(labels=(reason_code,))
+        return response
+
+    def _evaluate(self, request: Dict[str, Any], timer: Optional[StageTimer]) -> Dict[str, Any]:
         # Deterministic contract envelope: no runtime timing inside payload
         latency_ms = 0
 
@@ -77,6 +96,9 @@ class ADNv3:
                 latency_ms=latency_ms,
             )
 
+        if timer is not None:
+            timer.mark("parse_request")
+
         # Map v3 events → v2 DefenseEvent objects (fail-closed)
         try:
             events: List[DefenseEvent] = self._parse_events(req.events)
@@ -89,12 +111,18 @@ class ADNv3:
                 latency_ms=latency_ms,
             )
 
+        if timer is not None:
+            timer.mark("parse_events")
+
         cfg = self.config or NodeDefenseConfig()
         state_in = NodeDefenseState()
 
         # Existing v2 engine (authoritative behavior for now)
         state_out = evaluate_defense(events=events, config=cfg, state=state_in)
 
+        if timer is not None:
+            timer.mark("engine")
+
         decision = self._decision_from_state(state_out)
         reason_codes = self._reason_codes_from_state(state_out)
 
@@ -114,6 +142,9 @@ class ADNv3:
             }
         )
 
+        if timer is not None:
+            timer.mark("context_hash")
+
         return {
             "contract_version": self.CONTRACT_VERSION,
             "component": self.COMPONENT,
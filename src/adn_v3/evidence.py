@@ -0,0 +1,184 @@
+"""
+Append-only evidence accumulator for the ``evidence_hash`` verdict field.
+
+Both ``v3_2_lock.build_verdict`` and the v4 payload carry an ``evidence_hash``.
+EvidenceAccumulator keeps a Merkle tree over the ordered defense events so
+the hash can be refreshed after every append without rehashing the history:
+
+- leaf  = sha256(0x00 || canonical JSON of the event)
+- node  = sha256(0x01 || left || right)
+- root  = RFC 6962 / RFC 9162 Merkle Tree Hash over all leaves
+
+Appending folds completed subtrees like a binary counter (O(log n) hashes).
+Every completed subtree is kept, so the root at any earlier size and the
+inclusion proof for any event can be produced in O(log n), and checked with
+``verify_evidence_inclusion`` by an auditor holding only the event, the proof
+and the evidence hash.
+
+Events are dicts (e.g. Shield v3 request events) or dataclasses such as
+``adn_v2.models.DefenseEvent``; they are canonicalized like ``canonical_sha256``.
+Values without a JSON form (sets, bytes, arbitrary objects) and non-finite
+floats are rejected with ValueError rather than stringified.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from collections.abc import Iterable
+from typing import Any
+
+EMPTY_EVIDENCE_HASH = hashlib.sha256(b"").hexdigest()
+
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+def evidence_leaf_hash(event: Any) -> bytes:
+    if dataclasses.is_dataclass(event) and not isinstance(event, type):
+        event = dataclasses.asdict(event)
+    if not isinstance(event, dict):
+        raise ValueError("evidence event must be dict or dataclass")
+    try:
+        encoded = json.dumps(event, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    except TypeError as exc:
+        # no str() fallback: a set or custom object has no stable JSON form
+        raise ValueError(f"evidence event is not JSON-serializable: {exc}") from exc
+    return hashlib.sha256(_LEAF + encoded.encode("utf-8")).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+def _split(size: int) -> int:
+    # largest power of two strictly below size (size >= 2)
+    return 1 << ((size - 1).bit_length() - 1)
+
+
+class EvidenceAccumulator:
+    """Ordered, append-only Merkle accumulator over defense events."""
+
+    __slots__ = ("_levels",)
+
+    def __init__(self, events: Iterable[Any] = ()) -> None:
+        # _levels[h][i] is the root of the complete subtree over leaves [i << h, (i + 1) << h)
+        self._levels: list[list[bytes]] = [[]]
+        self.extend(events)
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    def append(self, event: Any) -> int:
+        """Add one event; returns its leaf index."""
+        return self.append_leaf(evidence_leaf_hash(event))
+
+    def append_leaf(self, leaf: bytes) -> int:
+        if not isinstance(leaf, bytes) or len(leaf) != 32:
+            raise ValueError("evidence leaf must be 32-byte sha256 digest")
+        levels = self._levels
+        index = len(levels[0])
+        levels[0].append(leaf)
+        height, node = 0, leaf
+        while len(levels[height]) % 2 == 0:
+            node = _node(levels[height][-2], node)
+            height += 1
+            if height == len(levels):
+                levels.append([])
+            levels[height].append(node)
+        return index
+
+    def extend(self, events: Iterable[Any]) -> None:
+        for event in events:
+            self.append(event)
+
+    @property
+    def evidence_hash(self) -> str:
+        """Current root as lowercase hex (``EMPTY_EVIDENCE_HASH`` when empty)."""
+        root: bytes | None = None
+        for level in self._levels:
+            if len(level) % 2:
+                root = level[-1] if root is None else _node(level[-1], root)
+        return EMPTY_EVIDENCE_HASH if root is None else root.hex()
+
+    def evidence_hash_at(self, size: int) -> str:
+        """Root over the first `size` events, as it was right after they were appended."""
+        self._require_size(size)
+        return EMPTY_EVIDENCE_HASH if size == 0 else self._subtree(0, size).hex()
+
+    def inclusion_proof(self, index: int, size: int | None = None) -> dict[str, Any]:
+        """Audit path for event `index` in the tree over the first `size` events (default: all)."""
+        tree_size = len(self) if size is None else size
+        self._require_size(tree_size)
+        if isinstance(index, bool) or not isinstance(index, int) or not 0 <= index < tree_size:
+            raise ValueError("leaf_index out of range")
+        path: list[str] = []
+        start, end = 0, tree_size
+        # RFC 9162 2.1.3.1 PATH(m, D[n]), walked top-down; siblings are collected leaf-first.
+        while end - start > 1:
+            k = _split(end - start)
+            if index - start < k:
+                path.append(self._subtree(start + k, end).hex())
+                end = start + k
+            else:
+                path.append(self._subtree(start, start + k).hex())
+                start += k
+        path.reverse()
+        return {"leaf_index": index, "tree_size": tree_size, "path": path}
+
+    def _subtree(self, start: int, end: int) -> bytes:
+        size = end - start
+        height = size.bit_length() - 1
+        if size == 1 << height and start % size == 0:
+            return self._levels[height][start >> height]
+        k = _split(size)
+        return _node(self._subtree(start, start + k), self._subtree(start + k, end))
+
+    def _require_size(self, size: int) -> None:
+        if isinstance(size, bool) or not isinstance(size, int) or not 0 <= size <= len(self):
+            raise ValueError("tree_size out of range")
+
+
+def evidence_hash(events: Iterable[Any]) -> str:
+    """One-shot ``evidence_hash`` for an event list (same value as an accumulator over it)."""
+    return EvidenceAccumulator(events).evidence_hash
+
+
+def verify_evidence_inclusion(event: Any, proof: dict[str, Any], *, evidence_hash: str) -> bool:
+    """Check an ``inclusion_proof`` for `event` against a published evidence hash (RFC 9162 2.1.3.2).
+
+    As in RFC 9162 the root does not commit to the tree size; take
+    ``tree_size`` from the record that published `evidence_hash`, not from
+    an untrusted proof.
+    """
+    if not isinstance(proof, dict) or set(proof) != {"leaf_index", "tree_size", "path"}:
+        raise ValueError("evidence proof fields must match required schema")
+    index, size, path = proof["leaf_index"], proof["tree_size"], proof["path"]
+    for value, field in ((index, "leaf_index"), (size, "tree_size")):
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise ValueError(f"{field} must be non-negative integer")
+    if index >= size:
+        raise ValueError("leaf_index out of range")
+    if not isinstance(path, list):
+        raise ValueError("evidence proof path must be list")
+    try:
+        siblings = [bytes.fromhex(item) for item in path]
+    except (TypeError, ValueError) as exc:
+        raise ValueError("evidence proof path entries must be hex") from exc
+
+    node = evidence_leaf_hash(event)
+    fn, sn = index, size - 1
+    for sibling in siblings:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            node = _node(sibling, node)
+            while not fn & 1 and fn:
+                fn >>= 1
+                sn >>= 1
+        else:
+            node = _node(node, sibling)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and node.hex() == evidence_hash
@@ -0,0 +1,122 @@
+"""
+Out-of-band latency instrumentation for ADNv3.evaluate.
+
+The Shield v3 contract payload is deterministic (`meta.latency_ms` is always
+0 and timings never enter `context_hash`). Operators who need to see where
+time goes can pass a StageObserver to `ADNv3(observer=...)`; it receives
+monotonic `perf_counter_ns` durations per stage and never touches the
+response.
+
+Stages (see STAGES):
+- parse_request – ADNv3Request.from_dict + version/component checks
+- parse_events  – v3 event dicts → DefenseEvent mapping
+- engine        – v2 evaluate_defense call
+- context_hash  – decision mapping + canonical context hash
+- total         – whole evaluate() call for successful responses
+- error         – whole evaluate() call for fail-closed ERROR responses
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+StageObserver = Callable[[str, int], None]
+
+STAGES = ("parse_request", "parse_events", "engine", "context_hash", "total", "error")
+_BUCKETS = 64  # log2(ns) buckets: bucket i holds durations in [2**(i-1), 2**i)
+
+
+class StageTimer:
+    """Per-call stopwatch that forwards stage durations to an observer."""
+
+    __slots__ = ("_observer", "_start", "_last")
+
+    def __init__(self, observer: StageObserver) -> None:
+        self._observer = observer
+        self._start = self._last = perf_counter_ns()
+
+    def _emit(self, stage: str, elapsed_ns: int) -> None:
+        try:
+            self._observer(stage, elapsed_ns)
+        except Exception:
+            # Instrumentation must never change the contract outcome.
+            pass
+
+    def mark(self, stage: str) -> None:
+        """Report the time since the previous mark (or start) as `stage`."""
+        now = perf_counter_ns()
+        self._emit(stage, now - self._last)
+        self._last = now
+
+    def finish(self, stage: str) -> None:
+        """Report the time since start as `stage` (total / error)."""
+        self._emit(stage, perf_counter_ns() - self._start)
+
+
+class LatencyHistogram:
+    """
+    Low-overhead fixed-bucket latency collector usable as a StageObserver.
+
+    Each stage keeps a 64-slot power-of-two histogram plus count, sum and
+    max, so recording is one `int.bit_length()` and a list increment.
+    Percentiles are reported as the upper bound of the matching bucket.
+    """
+
+    __slots__ = ("_buckets", "_count", "_sum", "_max")
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, List[int]] = {}
+        self._count: Dict[str, int] = {}
+        self._sum: Dict[str, int] = {}
+        self._max: Dict[str, int] = {}
+
+    def __call__(self, stage: str, elapsed_ns: int) -> None:
+        buckets = self._buckets.get(stage)
+        if buckets is None:
+            buckets = self._buckets[stage] = [0] * _BUCKETS
+            self._count[stage] = self._sum[stage] = self._max[stage] = 0
+        buckets[min(elapsed_ns.bit_length(), _BUCKETS - 1)] += 1
+        self._count[stage] += 1
+        self._sum[stage] += elapsed_ns
+        if elapsed_ns > self._max[stage]:
+            self._max[stage] = elapsed_ns
+
+    def count(self, stage: str) -> int:
+        return self._count.get(stage, 0)
+
+    def percentile(self, stage: str, pct: float) -> int:
+        """Upper-bound estimate (ns) of the `pct` percentile for `stage`; 0 if unseen."""
+        if not 0.0 <= pct <= 100.0:
+            raise ValueError("percentile must be within [0, 100]")
+        total = self._count.get(stage, 0)
+        if not total:
+            return 0
+        rank = max(1, -(-total * pct // 100))
+        seen = 0
+        for index, hits in enumerate(self._buckets[stage]):
+            seen += hits
+            if seen >= rank:
+                return min(1 << index, self._max[stage])
+        return self._max[stage]  # pragma: no cover - rank <= total always terminates above.
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """JSON-friendly per-stage summary (count, mean, p50/p90/p99, max in ns)."""
+        return {
+            stage: {
+                "count": self._count[stage],
+                "mean_ns": self._sum[stage] // self._count[stage],
+                "p50_ns": self.percentile(stage, 50),
+                "p90_ns": self.percentile(stage, 90),
+                "p99_ns": self.percentile(stage, 99),
+                "max_ns": self._max[stage],
+            }
+            for stage in self._buckets
+        }
+
+    def reset(self) -> None:
+        self._buckets.clear()
+        self._count.clear()
+        self._sum.clear()
+        self._max.clear()
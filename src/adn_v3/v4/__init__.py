@@ -7,6 +7,7 @@ POLICY_VERSION = "policy.v1"
 VERDICT_SCHEMA_VERSION = "shield.verdict.v2"
 SIGNATURE_BUNDLE_SCHEMA_VERSION = "shield.signature_bundle.v1"
 KEY_REGISTRY_SCHEMA_VERSION = "shield.key_registry.v1"
+MERKLE_PROOF_SCHEMA_VERSION = "shield.merkle_proof.v1"
 COMPONENT_ID = "adn"
 COMPONENT_ROLE = "shield_component_adn"
 CONTRACT_VERSION = 4
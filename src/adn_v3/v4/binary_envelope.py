@@ -0,0 +1,246 @@
+"""
+Compact deterministic binary encoding for stored and transported v4 envelopes.
+
+``encode_binary_envelope`` writes a signed envelope (plain or batched) as
+deterministic CBOR (RFC 8949 section 4.2.1), with no third-party dependency:
+
+- the data starts with the self-describe tag 55799 (``d9 d9 f7``)
+- integers and lengths use the shortest form; lengths are always definite
+- map keys are text strings, sorted by their encoded bytes
+- an even-length lowercase hex string value (hashes, test signatures) is
+  stored as tag 23 over its raw bytes
+- a ``b64u:`` string value in canonical unpadded base64url (real
+  signatures and public keys) is stored as tag 21 over its raw bytes
+- every other string is UTF-8 text; ``true`` / ``false`` are simple values
+
+Floats, null and integers outside 64 bits are rejected, as they are by the
+canonical JSON profile. ``decode_binary_envelope`` accepts only this exact
+encoding. That includes rejecting plain text that should have been tagged,
+so every envelope has exactly one binary form. It returns the same dict the
+JSON envelope parses to.
+
+The encoding is a storage and transport format only. Signatures still cover
+the canonical JSON payload, so a decoded envelope goes through
+``validate_crypto_verdict_envelope`` unchanged.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import functools
+import re
+import struct
+from typing import Any
+
+from adn_v3.v4.real_crypto_backend import REAL_SIGNATURE_ENCODING_PREFIX
+
+BINARY_ENVELOPE_MAGIC = b"\xd9\xd9\xf7"
+MAX_NESTING = 32
+
+_LOWER_HEX = re.compile(r"(?:[0-9a-f]{2})+")
+_TAG_BASE64URL = 21
+_TAG_BASE16 = 23
+_FALSE = b"\xf4"
+_TRUE = b"\xf5"
+
+
+def _head(major: int, value: int) -> bytes:
+    if value < 24:
+        return bytes((major << 5 | value,))
+    if value < 0x100:
+        return bytes((major << 5 | 24, value))
+    if value < 0x10000:
+        return struct.pack(">BH", major << 5 | 25, value)
+    if value < 0x100000000:
+        return struct.pack(">BI", major << 5 | 26, value)
+    return struct.pack(">BQ", major << 5 | 27, value)
+
+
+def _hex_bytes(value: str) -> bytes | None:
+    if _LOWER_HEX.fullmatch(value) is None:
+        return None
+    return bytes.fromhex(value)
+
+
+def _b64u_bytes(value: str) -> bytes | None:
+    if not value.startswith(REAL_SIGNATURE_ENCODING_PREFIX) or len(value) == len(REAL_SIGNATURE_ENCODING_PREFIX):
+        return None
+    encoded = value[len(REAL_SIGNATURE_ENCODING_PREFIX) :]
+    try:
+        raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+    except (binascii.Error, ValueError):
+        return None
+    # Re-encoding catches everything the decoder is lenient about: padding,
+    # foreign characters and non-zero unused bits in the last character.
+    return raw if _b64u_text(raw) == value else None
+
+
+def _b64u_text(raw: bytes) -> str:
+    return REAL_SIGNATURE_ENCODING_PREFIX + base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _encode_text(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return _head(3, len(raw)) + raw
+
+
+# envelope field names repeat in every verdict
+_encode_key = functools.lru_cache(maxsize=1024)(_encode_text)
+
+
+def _encode(value: Any, out: list[bytes], depth: int) -> None:
+    if isinstance(value, bool):
+        out.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        if not -(1 << 64) <= value < 1 << 64:
+            raise ValueError("binary envelope integers must fit in 64 bits")
+        out.append(_head(0, value) if value >= 0 else _head(1, -1 - value))
+    elif isinstance(value, str):
+        raw = _hex_bytes(value)
+        if raw is not None:
+            out.append(bytes((0xC0 | _TAG_BASE16,)) + _head(2, len(raw)) + raw)
+            return
+        raw = _b64u_bytes(value)
+        if raw is not None:
+            out.append(bytes((0xC0 | _TAG_BASE64URL,)) + _head(2, len(raw)) + raw)
+            return
+        out.append(_encode_text(value))
+    elif isinstance(value, (list, tuple, dict)):
+        if depth >= MAX_NESTING:
+            raise ValueError("binary envelope nesting too deep")
+        if isinstance(value, dict):
+            entries = []
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise ValueError("binary envelope object keys must be strings")
+                entries.append((_encode_key(key), item))
+            entries.sort(key=lambda entry: entry[0])
+            out.append(_head(5, len(entries)))
+            for key_bytes, item in entries:
+                out.append(key_bytes)
+                _encode(item, out, depth + 1)
+        else:
+            out.append(_head(4, len(value)))
+            for item in value:
+                _encode(item, out, depth + 1)
+    else:
+        raise ValueError(f"binary envelope cannot encode {type(value).__name__}")
+
+
+def encode_binary_envelope(envelope: dict[str, Any]) -> bytes:
+    """Deterministic binary form of a signed JSON envelope (see module docstring)."""
+    if not isinstance(envelope, dict):
+        raise ValueError("envelope must be dict")
+    out = [BINARY_ENVELOPE_MAGIC]
+    _encode(envelope, out, 0)
+    return b"".join(out)
+
+
+def _decode_item(data: bytes, pos: int, depth: int) -> tuple[Any, int]:
+    initial = data[pos]
+    pos += 1
+    major, argument = initial >> 5, initial & 0x1F
+    if major == 7:
+        if argument in (20, 21):
+            return argument == 21, pos
+        raise ValueError("binary envelope contains unsupported item")
+    if argument >= 24:
+        if argument > 27:
+            raise ValueError("binary envelope uses indefinite or reserved length")
+        size = 1 << (argument - 24)
+        argument = int.from_bytes(data[pos : pos + size], "big")
+        pos += size
+        # shortest form: the value must not fit the next smaller encoding
+        if pos > len(data) or argument < (24 if size == 1 else 1 << (4 * size)):
+            raise ValueError("binary envelope integer not in shortest form or truncated")
+    if major == 0:
+        return argument, pos
+    if major == 1:
+        return -1 - argument, pos
+    if major in (2, 3):
+        end = pos + argument
+        if end > len(data):
+            raise ValueError("binary envelope truncated")
+        raw = data[pos:end]
+        if major == 2:
+            raise ValueError("binary envelope byte strings must be tagged")
+        text = raw.decode("utf-8")
+        if _hex_bytes(text) is not None or _b64u_bytes(text) is not None:
+            raise ValueError("binary envelope string must use its byte tag")
+        return text, end
+    if major == 6:
+        if argument not in (_TAG_BASE16, _TAG_BASE64URL) or pos >= len(data) or data[pos] >> 5 != 2:
+            raise ValueError("binary envelope contains unsupported item")
+        raw, pos = _decode_bytes(data, pos)
+        if not raw:
+            raise ValueError("binary envelope tag must wrap non-empty bytes")
+        return (raw.hex() if argument == _TAG_BASE16 else _b64u_text(raw)), pos
+    if depth >= MAX_NESTING:
+        raise ValueError("binary envelope nesting too deep")
+    # every item takes at least one byte, so no count can exceed what is left
+    if argument > len(data) - pos:
+        raise ValueError("binary envelope truncated")
+    if major == 4:
+        items = []
+        for _ in range(argument):
+            item, pos = _decode_item(data, pos, depth + 1)
+            items.append(item)
+        return items, pos
+    result: dict[str, Any] = {}
+    previous = b""
+    for _ in range(argument):
+        start = pos
+        head = data[pos]
+        if head >> 5 != 3:
+            raise ValueError("binary envelope object keys must be strings")
+        if head < 0x78:
+            # short key: length is in the initial byte
+            pos += 1 + (head & 0x1F)
+            key_bytes = data[start + 1 : pos]
+        else:
+            key_bytes, pos = _decode_bytes(data, pos)
+        encoded_key = data[start:pos]
+        if encoded_key <= previous or pos > len(data):
+            raise ValueError("binary envelope keys must be unique, sorted and complete")
+        previous = encoded_key
+        result[key_bytes.decode("utf-8")], pos = _decode_item(data, pos, depth + 1)
+    return result, pos
+
+
+def _decode_bytes(data: bytes, pos: int) -> tuple[bytes, int]:
+    """Raw content of the byte or text string whose head is at `pos`."""
+    argument = data[pos] & 0x1F
+    pos += 1
+    if argument >= 24:
+        if argument > 27:
+            raise ValueError("binary envelope uses indefinite or reserved length")
+        size = 1 << (argument - 24)
+        argument = int.from_bytes(data[pos : pos + size], "big")
+        pos += size
+        if pos > len(data) or argument < (24 if size == 1 else 1 << (4 * size)):
+            raise ValueError("binary envelope integer not in shortest form or truncated")
+    end = pos + argument
+    if end > len(data):
+        raise ValueError("binary envelope truncated")
+    return data[pos:end], end
+
+
+def decode_binary_envelope(data: bytes) -> dict[str, Any]:
+    """Inverse of ``encode_binary_envelope``; rejects any other encoding."""
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise ValueError("binary envelope must be bytes")
+    raw = bytes(data)
+    if not raw.startswith(BINARY_ENVELOPE_MAGIC):
+        raise ValueError("binary envelope magic mismatch")
+    try:
+        envelope, end = _decode_item(raw, len(BINARY_ENVELOPE_MAGIC), 0)
+    except IndexError as exc:
+        raise ValueError("binary envelope truncated") from exc
+    except UnicodeDecodeError as exc:
+        raise ValueError("binary envelope text must be UTF-8") from exc
+    if not isinstance(envelope, dict):
+        raise ValueError("binary envelope root must be map")
+    if end != len(raw):
+        raise ValueError("binary envelope has trailing bytes")
+    return envelope
@@ -0,0 +1,237 @@
+"""
+adn-v4 command line: bulk offline verification of signed ADN v4 verdicts.
+
+    python -m adn_v3.v4.cli verify --trust-profile registry.json archive/ verdicts.jsonl --workers 8
+
+Inputs are JSONL files (one record per line), single-record ``.json`` files,
+directories (searched recursively for ``*.json`` / ``*.jsonl``) or ``-`` for
+stdin. A record is either a bare signed envelope or the same body accepted by
+``POST /v4/verify``::
+
+    {"verdict": {...}, "expected_context_hash": "...", "verification_time": "..."}
+
+For bare envelopes the expected context hash is the envelope's own
+``context_hash`` and the verification time is ``--at`` or, failing that, the
+envelope's ``not_before`` (was it valid when it was issued). Records are parsed
+with duplicate-key rejection and checked with ``validate_crypto_verdict_envelope``
+against a trust profile compiled once per worker process.
+
+Each failure is written to stdout as one JSON line (source, request_id, error);
+a summary with per-reason counts and throughput goes to stderr. Exit status is
+0 when every record verified, 1 when any failed and 2 for unusable arguments.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from adn_v3.v4.crypto_verdict import validate_crypto_verdict_envelope
+from adn_v3.v4.signing import SignatureVerifier, parse_json_no_duplicate_keys, verify_test_only_signature
+from adn_v3.v4.trust_profile import CompiledTrustProfile, compile_trust_profile
+
+# (source label, raw JSON text)
+Record = tuple[str, str]
+# (source label, request_id, error or None)
+Outcome = tuple[str, str, str | None]
+
+_STATE: dict[str, Any] = {}
+
+
+def resolve_verifier(spec: str) -> SignatureVerifier:
+    """Map a --backend value to a signature verifier callback.
+
+    ``test``  – deterministic TEST-ONLY signatures (``verify_test_only_signature``)
+    ``oqs``   – liboqs ML-DSA-65 via ``OqsMlDsaBackend`` (verify only)
+    ``module:attr`` – a SignatureVerifier callable or a real crypto backend object
+    """
+    if spec == "test":
+        return verify_test_only_signature
+    from adn_v3.v4.real_crypto_backend import make_real_crypto_signature_verifier
+
+    if spec == "oqs":
+        from adn_v3.v4.oqs_mldsa_backend import OqsMlDsaBackend
+
+        return make_real_crypto_signature_verifier(OqsMlDsaBackend(private_key_resolver=_no_private_keys))
+    module_name, sep, attr = spec.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError("backend must be 'test', 'oqs' or 'module:attr'")
+    target = getattr(importlib.import_module(module_name), attr)
+    if hasattr(target, "verify_signature"):
+        return make_real_crypto_signature_verifier(target)
+    if not callable(target):
+        raise ValueError("backend target must be a verifier callable or crypto backend")
+    return target  # type: ignore[no-any-return]
+
+
+def _no_private_keys(reference: str) -> bytes:
+    raise ValueError("offline verifier has no private keys")
+
+
+def _init_worker(profile: dict[str, Any], backend: str) -> None:
+    _STATE["profile"] = compile_trust_profile(profile)
+    _STATE["verifier"] = resolve_verifier(backend)
+
+
+def _verify_record(text: str, at: str | None) -> tuple[str, str | None]:
+    request_id = "unknown"
+    try:
+        record = parse_json_no_duplicate_keys(text)
+        wrapped = "verdict" in record
+        verdict = record["verdict"] if wrapped else record
+        if not isinstance(verdict, dict):
+            raise ValueError("ADN v4 verdict must be dict")
+        request_id = str(verdict.get("request_id", "unknown"))
+        expected = record.get("expected_context_hash") if wrapped else verdict.get("context_hash")
+        verification_time = at or (record.get("verification_time") if wrapped else None) or verdict.get("not_before")
+        validate_crypto_verdict_envelope(
+            verdict,
+            expected_context_hash=expected,  # type: ignore[arg-type]
+            trust_profile=_STATE["profile"],
+            verification_time=verification_time,  # type: ignore[arg-type]
+            verifier=_STATE["verifier"],
+        )
+    except ValueError as exc:
+        return request_id, str(exc) or type(exc).__name__
+    except Exception as exc:
+        # Fail closed on anything a malformed archive record can trigger.
+        return request_id, f"{type(exc).__name__}: {exc}"
+    return request_id, None
+
+
+def _verify_chunk(records: list[Record], at: str | None) -> list[Outcome]:
+    outcomes: list[Outcome] = []
+    for label, text in records:
+        request_id, error = _verify_record(text, at)
+        outcomes.append((label, request_id, error))
+    return outcomes
+
+
+def iter_records(inputs: Iterable[str]) -> Iterator[Record]:
+    """Yield (source label, JSON text) for every record under `inputs`."""
+    for name in inputs:
+        if name == "-":
+            yield from _jsonl_records("<stdin>", sys.stdin)
+            continue
+        path = Path(name)
+        files = sorted(p for p in path.rglob("*") if p.suffix in (".json", ".jsonl")) if path.is_dir() else [path]
+        for file in files:
+            if file.suffix == ".json":
+                yield str(file), file.read_text(encoding="utf-8")
+            else:
+                with file.open(encoding="utf-8") as handle:
+                    yield from _jsonl_records(str(file), handle)
+
+
+def _jsonl_records(label: str, lines: Iterable[str]) -> Iterator[Record]:
+    for number, line in enumerate(lines, start=1):
+        if line.strip():
+            yield f"{label}:{number}", line
+
+
+def _chunks(records: Iterable[Record], size: int) -> Iterator[list[Record]]:
+    chunk: list[Record] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def verify_records(
+    records: Iterable[Record],
+    *,
+    trust_profile: dict[str, Any] | CompiledTrustProfile,
+    backend: str = "test",
+    at: str | None = None,
+    workers: int = 1,
+    chunk_size: int = 256,
+) -> Iterator[Outcome]:
+    """Verify records (in input order) with one compiled trust profile per process."""
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers and chunk_size must be positive")
+    profile = compile_trust_profile(trust_profile).profile
+    chunks = _chunks(records, chunk_size)
+    if workers == 1:
+        _init_worker(profile, backend)
+        for chunk in chunks:
+            yield from _verify_chunk(chunk, at)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(profile, backend)) as pool:
+        pending: deque[Future[list[Outcome]]] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_verify_chunk, chunk, at))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="adn-v4", description="ADN Shield v4 offline tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    verify = sub.add_parser("verify", help="bulk-verify signed ADN v4 verdict envelopes")
+    verify.add_argument("inputs", nargs="+", help="JSONL / .json files, directories, or '-' for stdin")
+    verify.add_argument("--trust-profile", required=True, help="key registry JSON file")
+    verify.add_argument("--backend", default="test", help="'test', 'oqs' or 'module:attr' (default: test)")
+    verify.add_argument("--at", help="verification time (RFC3339 UTC) applied to every record")
+    verify.add_argument("-j", "--workers", type=int, default=1, help="worker processes")
+    verify.add_argument("--chunk-size", type=int, default=256, help="records per worker task")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ns = _parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        profile = compile_trust_profile(parse_json_no_duplicate_keys(Path(ns.trust_profile).read_text(encoding="utf-8")))
+        resolve_verifier(ns.backend)
+    except (OSError, ValueError, ImportError, AttributeError) as exc:
+        print(f"adn-v4 verify: {exc}", file=sys.stderr)
+        return 2
+
+    reasons: dict[str, int] = {}
+    total = 0
+    started = time.perf_counter()
+    outcomes = verify_records(
+        iter_records(ns.inputs),
+        trust_profile=profile,
+        backend=ns.backend,
+        at=ns.at,
+        workers=ns.workers,
+        chunk_size=ns.chunk_size,
+    )
+    for label, request_id, error in outcomes:
+        total += 1
+        if error is not None:
+            reasons[error] = reasons.get(error, 0) + 1
+            print(json.dumps({"source": label, "request_id": request_id, "error": error}, sort_keys=True))
+    elapsed = time.perf_counter() - started
+
+    failed = sum(reasons.values())
+    summary = {
+        "total": total,
+        "verified": total - failed,
+        "failed": failed,
+        "reasons": dict(sorted(reasons.items())),
+        "workers": ns.workers,
+        "elapsed_s": round(elapsed, 3),
+        "verifications_per_s": round(total / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+    print(json.dumps(summary, indent=2), file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from adn_v3.contracts.v3_2_lock import SUPPORTED_DECISIONS, SUPPORTED_EVIDENCE_FAMILIES, SUPPORTED_REASON_IDS
 from adn_v3.v4 import CANONICALIZATION_PROFILE, COMPONENT_ID, CONTRACT_VERSION, POLICY_VERSION, VERDICT_SCHEMA_VERSION
+from adn_v3.v4.replay import ReplayGuard
 from adn_v3.v4.signing import SignatureVerifier, signed_payload_hash, verify_signature_bundle
-from adn_v3.v4.trust_profile import require_non_empty_str, require_positive_int, validate_freshness_window
+from adn_v3.v4.trust_profile import TrustProfile, require_non_empty_str, require_positive_int, validate_freshness_window
 
 REQUIRED_UNSIGNED_VERDICT_FIELDS = frozenset(
     {
@@ -92,6 +94,87 @@ def contains_forbidden_metadata_authority(value: Any) -> bool:
     return False
 
 
+@dataclass(frozen=True)
+class MetadataLimits:
+    """
+    Budgets for the ``metadata`` object of a verdict payload.
+
+    - max_bytes: compact canonical JSON size (string escapes not counted)
+    - max_depth: container nesting, the metadata object itself being depth 1
+    - max_nodes: values in the tree, the metadata object included
+    - max_string_length: characters in any key or string value
+    """
+
+    max_bytes: int = 16_384
+    max_depth: int = 16
+    max_nodes: int = 1_024
+    max_string_length: int = 4_096
+
+    def __post_init__(self) -> None:
+        for field in ("max_bytes", "max_depth", "max_nodes", "max_string_length"):
+            require_positive_int(getattr(self, field), field=field)
+
+
+DEFAULT_METADATA_LIMITS = MetadataLimits()
+
+
+def _json_string_size(value: str, limits: MetadataLimits) -> int:
+    if len(value) > limits.max_string_length:
+        raise ValueError("metadata string exceeds max_string_length")
+    return (len(value) if value.isascii() else len(value.encode("utf-8"))) + 2
+
+
+def validate_metadata(metadata: Any, *, limits: MetadataLimits = DEFAULT_METADATA_LIMITS) -> dict[str, Any]:
+    """
+    Check `metadata` against `limits` and the forbidden authority keys in one pass.
+
+    The walk is iterative and stops at the first exceeded budget, so hostile
+    metadata costs at most about ``limits.max_nodes`` steps. Type and
+    Unicode rules are left to ``normalise_for_signing``, which now only ever
+    sees bounded input.
+    """
+    if not isinstance(metadata, dict):
+        raise ValueError("metadata must be dict")
+    size = 0
+    nodes = 0
+    stack: list[tuple[Any, int]] = [(metadata, 1)]
+    while stack:
+        value, depth = stack.pop()
+        nodes += 1
+        if isinstance(value, str):
+            size += _json_string_size(value, limits)
+        elif isinstance(value, (dict, list, tuple)):
+            if depth > limits.max_depth:
+                raise ValueError("metadata exceeds max_depth")
+            if nodes + len(value) > limits.max_nodes:
+                raise ValueError("metadata exceeds max_nodes")
+            # braces plus separating commas
+            size += max(2, len(value) + 1)
+            if isinstance(value, dict):
+                if not FORBIDDEN_METADATA_AUTHORITY_KEYS.isdisjoint(value):
+                    raise ValueError("metadata contains forbidden authority field")
+                for key, item in value.items():
+                    if not isinstance(key, str):
+                        raise ValueError("metadata object keys must be strings")
+                    size += _json_string_size(key, limits) + 1
+                    if size > limits.max_bytes:
+                        raise ValueError("metadata exceeds max_bytes")
+                    stack.append((item, depth + 1))
+            else:
+                stack.extend((item, depth + 1) for item in value)
+        elif isinstance(value, bool):
+            size += 4 if value else 5
+        elif isinstance(value, int):
+            # decimal digits without str(), which is quadratic for huge ints
+            size += value.bit_length() * 3 // 10 + 1 + (value < 0)
+        else:
+            # null, floats and other types are rejected by normalise_for_signing
+            size += 4
+        if size > limits.max_bytes:
+            raise ValueError("metadata exceeds max_bytes")
+    return metadata
+
+
 def build_unsigned_crypto_verdict_payload(
     *,
     request_id: str,
@@ -105,14 +188,11 @@ def build_unsigned_crypto_verdict_payload(
     evidence_families: tuple[str, ...] | list[str],
     key_registry_version: int,
     metadata: dict[str, Any] | None = None,
+    metadata_limits: MetadataLimits = DEFAULT_METADATA_LIMITS,
 ) -> dict[str, Any]:
     if decision not in SUPPORTED_DECISIONS:
         raise ValueError("unsupported decision")
-    checked_metadata = {} if metadata is None else metadata
-    if not isinstance(checked_metadata, dict):
-        raise ValueError("metadata must be dict")
-    if contains_forbidden_metadata_authority(checked_metadata):
-        raise ValueError("metadata contains forbidden authority field")
+    checked_metadata = validate_metadata({} if metadata is None else metadata, limits=metadata_limits)
     checked_not_before, checked_not_after = validate_freshness_window(not_before=not_before, not_after=not_after)
     return {
         "component_id": COMPONENT_ID,
@@ -149,14 +229,48 @@ def validate_crypto_verdict_envelope(
     verdict: dict[str, Any],
     *,
     expected_context_hash: str,
-    trust_profile: dict[str, Any],
+    trust_profile: TrustProfile,
     verification_time: str,
     verifier: SignatureVerifier,
+    replay_guard: ReplayGuard | None = None,
+    metadata_limits: MetadataLimits = DEFAULT_METADATA_LIMITS,
 ) -> dict[str, Any]:
     if not isinstance(verdict, dict):
         raise ValueError("ADN v4 verdict must be dict")
     if set(verdict.keys()) != REQUIRED_SIGNED_VERDICT_FIELDS:
         raise ValueError("ADN v4 verdict fields must match required schema")
+    unsigned_payload = unsigned_payload_from_envelope(
+        verdict,
+        expected_context_hash=expected_context_hash,
+        metadata_limits=metadata_limits,
+    )
+    expected_payload_hash = signed_payload_hash(payload=unsigned_payload)
+    if require_hash(verdict["signed_payload_hash"], field="signed_payload_hash") != expected_payload_hash:
+        raise ValueError("signed payload hash mismatch")
+    verification = verify_signature_bundle(
+        verdict["signature_bundle"],
+        expected_signed_payload_hash=expected_payload_hash,
+        trust_profile=trust_profile,
+        verification_time=verification_time,
+        artifact_not_before=verdict["not_before"],
+        artifact_not_after=verdict["not_after"],
+        verifier=verifier,
+    )
+    if replay_guard is not None:
+        replay_guard.check_and_record(
+            freshness_nonce=unsigned_payload["freshness_nonce"],
+            not_after=unsigned_payload["not_after"],
+            verification_time=verification_time,
+        )
+    return {**verdict, "verification_summary": verification}
+
+
+def unsigned_payload_from_envelope(
+    verdict: dict[str, Any],
+    *,
+    expected_context_hash: str,
+    metadata_limits: MetadataLimits = DEFAULT_METADATA_LIMITS,
+) -> dict[str, Any]:
     if verdict["component_id"] != COMPONENT_ID:
         raise ValueError("component_id mismatch")
     if verdict["contract_version"] != CONTRACT_VERSION:
@@ -181,19 +295,8 @@ def validate_crypto_verdict_envelope(
         evidence_families=verdict["evidence_families"],
         metadata=verdict["metadata"],
         key_registry_version=verdict["key_registry_version"],
+        metadata_limits=metadata_limits,
     )
     if unsigned_payload["context_hash"] != require_hash(expected_context_hash, field="expected_context_hash"):
         raise ValueError("context_hash mismatch")
-    expected_payload_hash = signed_payload_hash(payload=unsigned_payload)
-    if require_hash(verdict["signed_payload_hash"], field="signed_payload_hash") != expected_payload_hash:
-        raise ValueError("signed payload hash mismatch")
-    verification = verify_signature_bundle(
-        verdict["signature_bundle"],
-        expected_signed_payload_hash=expected_payload_hash,
-        trust_profile=trust_profile,
-        verification_time=verification_time,
-        artifact_not_before=verdict["not_before"],
-        artifact_not_after=verdict["not_after"],
-        verifier=verifier,
-    )
-    return {**verdict, "verification_summary": verification}
+    return unsigned_payload
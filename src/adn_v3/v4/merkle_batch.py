@@ -0,0 +1,266 @@
+"""
+Opt-in Merkle batch signing for DigiByte ADN Shield v4 verdicts.
+
+``sign_verdict_batch`` hashes every unsigned payload as usual
+(``signed_payload_hash``), builds a binary SHA-256 Merkle tree over those
+hashes and signs one domain-separated root hash per algorithm. Each returned
+envelope is the normal signed envelope plus a ``merkle_proof``::
+
+    {"schema_version": "shield.merkle_proof.v1", "root": "...",
+     "leaf_index": 3, "leaf_count": 256, "path": ["<sibling hex>", ...]}
+
+and its ``signature_bundle`` signs the batch root instead of the verdict's
+own payload hash. Signing cost per verdict drops by the batch size; each
+proof adds ``ceil(log2(leaf_count))`` hashes.
+
+Tree rules: leaves are ``sha256(0x00 || payload_hash)``, inner nodes
+``sha256(0x01 || left || right)`` and an unpaired last node is carried up
+unchanged (never duplicated). The signed root hash also binds ``leaf_count``,
+so a proof cannot be replayed against a differently shaped tree.
+
+Batched envelopes are verified with ``validate_batched_crypto_verdict_envelope``;
+they are deliberately rejected by ``validate_crypto_verdict_envelope``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Sequence
+from typing import Any
+
+from adn_v3.v4 import MERKLE_PROOF_SCHEMA_VERSION
+from adn_v3.v4.crypto_verdict import (
+    DEFAULT_METADATA_LIMITS,
+    REQUIRED_SIGNED_VERDICT_FIELDS,
+    REQUIRED_UNSIGNED_VERDICT_FIELDS,
+    MetadataLimits,
+    require_hash,
+    unsigned_payload_from_envelope,
+)
+from adn_v3.v4.replay import ReplayGuard
+from adn_v3.v4.signing import (
+    COMPONENT_VERDICT_DOMAIN,
+    HashSigner,
+    SignatureVerifier,
+    build_signature_bundle,
+    signed_payload_hash,
+    verify_signature_bundle,
+)
+from adn_v3.v4.trust_profile import TrustProfile, require_positive_int
+
+MERKLE_ROOT_HASH_PREFIX = "DGB-SHIELD-V4-MERKLE-ROOT"
+REQUIRED_BATCHED_VERDICT_FIELDS = REQUIRED_SIGNED_VERDICT_FIELDS | {"merkle_proof"}
+MERKLE_PROOF_FIELDS = frozenset({"schema_version", "root", "leaf_index", "leaf_count", "path"})
+MAX_BATCH_LEAVES = 1 << 20
+
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+def merkle_leaf(payload_hash: str) -> bytes:
+    return hashlib.sha256(_LEAF + bytes.fromhex(require_hash(payload_hash, field="signed_payload_hash"))).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+def merkle_batch_root_hash(*, root: str, leaf_count: int) -> str:
+    """The hash the root signatures cover (root bound to domain and leaf count)."""
+    clean_root = require_hash(root, field="merkle root")
+    clean_count = require_positive_int(leaf_count, field="leaf_count")
+    return hashlib.sha256(
+        f"{MERKLE_ROOT_HASH_PREFIX}\n{COMPONENT_VERDICT_DOMAIN}\n{clean_count}\n{clean_root}".encode("utf-8")
+    ).hexdigest()
+
+
+def merkle_tree_proofs(payload_hashes: Sequence[str]) -> tuple[str, list[list[str]]]:
+    """Return (root hex, inclusion path per leaf) for `payload_hashes` in order."""
+    if not payload_hashes:
+        raise ValueError("merkle batch must not be empty")
+    if len(payload_hashes) > MAX_BATCH_LEAVES:
+        raise ValueError("merkle batch too large")
+    level = [merkle_leaf(item) for item in payload_hashes]
+    paths: list[list[str]] = [[] for _ in level]
+    # positions[i] is leaf i's node index within the current level
+    positions = list(range(len(level)))
+    while len(level) > 1:
+        width = len(level)
+        for leaf, position in enumerate(positions):
+            sibling = position ^ 1
+            if sibling < width:
+                paths[leaf].append(level[sibling].hex())
+            positions[leaf] = position >> 1
+        level = [_node(level[i], level[i + 1]) if i + 1 < width else level[i] for i in range(0, width, 2)]
+    return level[0].hex(), paths
+
+
+def merkle_root_from_proof(*, payload_hash: str, leaf_index: int, leaf_count: int, path: Sequence[str]) -> str:
+    """Recompute the root for one leaf; the path length must match the tree shape exactly."""
+    if isinstance(leaf_index, bool) or not isinstance(leaf_index, int) or leaf_index < 0:
+        raise ValueError("leaf_index must be non-negative integer")
+    count = require_positive_int(leaf_count, field="leaf_count")
+    if count > MAX_BATCH_LEAVES:
+        raise ValueError("leaf_count too large")
+    if leaf_index >= count:
+        raise ValueError("leaf_index out of range")
+    if not isinstance(path, list):
+        raise ValueError("merkle path must be list")
+    node = merkle_leaf(payload_hash)
+    index, width, used = leaf_index, count, 0
+    while width > 1:
+        if index ^ 1 < width:
+            if used >= len(path):
+                raise ValueError("merkle path too short")
+            sibling = bytes.fromhex(require_hash(path[used], field="merkle path entry"))
+            used += 1
+            node = _node(sibling, node) if index & 1 else _node(node, sibling)
+        index >>= 1
+        width = (width + 1) >> 1
+    if used != len(path):
+        raise ValueError("merkle path too long")
+    return node.hex()
+
+
+def sign_verdict_batch(unsigned_payloads: Sequence[dict[str, Any]], *, sign_root: HashSigner) -> list[dict[str, Any]]:
+    """Sign many unsigned payloads with one root signature per algorithm.
+
+    `sign_root` receives the batch root hash and returns signature entries, e.g.::
+
+        lambda digest: [
+            build_signature_entry_with_real_backend(
+                algorithm=algorithm, domain_tag=COMPONENT_VERDICT_DOMAIN, signed_payload_hash=digest,
+                key_id=..., key_version=..., private_key_reference=..., backend=backend,
+            )
+            for algorithm in (CLASSICAL_ED25519, ML_DSA)
+        ]
+    """
+    for payload in unsigned_payloads:
+        if set(payload.keys()) != REQUIRED_UNSIGNED_VERDICT_FIELDS:
+            raise ValueError("unsigned ADN v4 verdict payload fields must match required schema")
+    payload_hashes = [signed_payload_hash(payload=payload) for payload in unsigned_payloads]
+    root, paths = merkle_tree_proofs(payload_hashes)
+    count = len(payload_hashes)
+    bundle = build_signature_bundle(signatures=sign_root(merkle_batch_root_hash(root=root, leaf_count=count)))
+    return [
+        {
+            **payload,
+            "signed_payload_hash": payload_hash,
+            "signature_bundle": bundle,
+            "merkle_proof": {
+                "schema_version": MERKLE_PROOF_SCHEMA_VERSION,
+                "root": root,
+                "leaf_index": index,
+                "leaf_count": count,
+                "path": path,
+            },
+        }
+        for index, (payload, payload_hash, path) in enumerate(zip(unsigned_payloads, payload_hashes, paths, strict=True))
+    ]
+
+
+class VerifiedRootCache:
+    """
+    Remembers root signatures that already verified, so a batch's expensive
+    signature checks run once instead of once per verdict.
+
+    Only successful checks are stored, keyed by the verifier, the complete
+    signature entry and the trusted key it was checked against. Trust
+    profile lookups, key validity windows and the policy checks in
+    `verify_signature_bundle` still run for every verdict. The cache is
+    reset when it reaches `max_entries`.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._verified: set[tuple[Any, ...]] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._verified)
+
+    def wrap(self, verifier: SignatureVerifier) -> SignatureVerifier:
+        def cached(entry: dict[str, Any], key: dict[str, Any]) -> bool:
+            cache_key = (
+                verifier,
+                entry["algorithm"],
+                entry["key_id"],
+                entry["key_version"],
+                entry["signed_payload_hash"],
+                entry["domain_tag"],
+                entry["signature"],
+                key["public_key"],
+            )
+            if cache_key in self._verified:
+                self.hits += 1
+                return True
+            self.misses += 1
+            if not verifier(entry, key):
+                return False
+            if len(self._verified) >= self.max_entries:
+                self._verified.clear()
+            self._verified.add(cache_key)
+            return True
+
+        return cached
+
+    def clear(self) -> None:
+        self._verified.clear()
+        self.hits = self.misses = 0
+
+
+def validate_batched_crypto_verdict_envelope(
+    verdict: dict[str, Any],
+    *,
+    expected_context_hash: str,
+    trust_profile: TrustProfile,
+    verification_time: str,
+    verifier: SignatureVerifier,
+    root_cache: VerifiedRootCache | None = None,
+    replay_guard: ReplayGuard | None = None,
+    metadata_limits: MetadataLimits = DEFAULT_METADATA_LIMITS,
+) -> dict[str, Any]:
+    if not isinstance(verdict, dict):
+        raise ValueError("ADN v4 verdict must be dict")
+    if set(verdict.keys()) != REQUIRED_BATCHED_VERDICT_FIELDS:
+        raise ValueError("ADN v4 batched verdict fields must match required schema")
+    unsigned_payload = unsigned_payload_from_envelope(
+        verdict,
+        expected_context_hash=expected_context_hash,
+        metadata_limits=metadata_limits,
+    )
+    expected_payload_hash = signed_payload_hash(payload=unsigned_payload)
+    if require_hash(verdict["signed_payload_hash"], field="signed_payload_hash") != expected_payload_hash:
+        raise ValueError("signed payload hash mismatch")
+    proof = verdict["merkle_proof"]
+    if not isinstance(proof, dict) or set(proof.keys()) != MERKLE_PROOF_FIELDS:
+        raise ValueError("merkle proof fields must match required schema")
+    if proof["schema_version"] != MERKLE_PROOF_SCHEMA_VERSION:
+        raise ValueError("merkle proof schema mismatch")
+    root = merkle_root_from_proof(
+        payload_hash=expected_payload_hash,
+        leaf_index=proof["leaf_index"],
+        leaf_count=proof["leaf_count"],
+        path=proof["path"],
+    )
+    if require_hash(proof["root"], field="merkle root") != root:
+        raise ValueError("merkle root mismatch")
+    verification = verify_signature_bundle(
+        verdict["signature_bundle"],
+        expected_signed_payload_hash=merkle_batch_root_hash(root=root, leaf_count=proof["leaf_count"]),
+        trust_profile=trust_profile,
+        verification_time=verification_time,
+        artifact_not_before=verdict["not_before"],
+        artifact_not_after=verdict["not_after"],
+        verifier=verifier if root_cache is None else root_cache.wrap(verifier),
+    )
+    if replay_guard is not None:
+        replay_guard.check_and_record(
+            freshness_nonce=unsigned_payload["freshness_nonce"],
+            not_after=unsigned_payload["not_after"],
+            verification_time=verification_time,
+        )
+    return {**verdict, "verification_summary": verification}
@@ -29,7 +29,7 @@ class OqsMlDsaBackend:
     only; it does not sign transactions and does not broadcast.
     """
 
-    supported_algorithms = (OQS_ML_DSA_ALGORITHM,)
+    supported_algorithms: tuple[str, ...] = (OQS_ML_DSA_ALGORITHM,)
 
     def __init__(
         self,
@@ -0,0 +1,281 @@
+"""
+End-to-end evaluate-and-sign pipeline: Shield v3 request → signed ADN v4 envelope.
+
+    pipeline = VerdictPipeline(signer=sign_hash, key_registry_version=1, evaluate_workers=4, sign_workers=8)
+    for result in pipeline.run(requests):
+        ...
+
+Per request the pipeline runs ``ADNv3.evaluate``, maps the response onto a
+v3.2 lock verdict (``build_verdict``, the one validation), extends it with the
+v4 freshness fields, canonicalizes and hashes it once (``signed_payload_hash``)
+and asks `signer` for one signature entry per algorithm over that hash. The
+envelope is assembled directly from those pieces; nothing is re-validated or
+re-hashed on the way.
+
+Evaluation and hashing are CPU-bound and run inline or, with
+``evaluate_workers > 1``, in a process pool. Signing runs in a thread pool
+(backends are typically native code or remote HSMs and may hold handles that
+cannot be pickled), so chunk N+1 is evaluated while chunk N is being signed.
+Results come back in input order. Freshness nonce and window are stamped in
+the calling process when a request is dispatched.
+
+A request whose response cannot be turned into a verdict, or whose signing
+fails, yields a result with ``envelope=None`` and the error; the rest of the
+batch continues.
+
+Response → v3.2 / v4 verdict mapping:
+
+    ALLOW → ALLOW    ADN_OK_COORDINATION_ALLOW
+    WARN  → ESCALATE ADN_ESCALATE_POLICY_REVIEW
+    BLOCK → DENY     ADN_DENY_DEFENSE_TRIGGERED
+    ERROR → ERROR    ADN_ERROR_INVALID_VERDICT
+"""
+
+from __future__ import annotations
+
+import secrets
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from adn_v3.contracts.v3_2_lock import build_verdict, canonical_sha256
+from adn_v3.core import ADNv3
+from adn_v3.v4 import CANONICALIZATION_PROFILE, CONTRACT_VERSION, POLICY_VERSION, VERDICT_SCHEMA_VERSION
+from adn_v3.v4.crypto_verdict import validate_metadata
+from adn_v3.v4.signing import HashSigner, build_signature_bundle, signed_payload_hash
+from adn_v3.v4.trust_profile import require_non_empty_str, require_positive_int, validate_freshness_window
+
+V3_DECISION_MAP: dict[str, tuple[str, str]] = {
+    "ALLOW": ("ALLOW", "ADN_OK_COORDINATION_ALLOW"),
+    "WARN": ("ESCALATE", "ADN_ESCALATE_POLICY_REVIEW"),
+    "BLOCK": ("DENY", "ADN_DENY_DEFENSE_TRIGGERED"),
+    "ERROR": ("ERROR", "ADN_ERROR_INVALID_VERDICT"),
+}
+_LOCKDOWN_STATES = frozenset({"PARTIAL", "FULL"})
+
+# (request, freshness_nonce, not_before, not_after)
+Stamped = tuple[Any, str, str, str]
+# (v3 response, unsigned v4 payload or None, signed_payload_hash or error)
+Prepared = tuple[dict[str, Any], dict[str, Any] | None, str]
+
+
+@dataclass(frozen=True)
+class SignedVerdictResult:
+    request_id: str
+    response: dict[str, Any]
+    envelope: dict[str, Any] | None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.envelope is not None
+
+
+def lock_verdict_from_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Map an ``ADNv3.evaluate`` response onto a validated v3.2 lock verdict."""
+    mapped = V3_DECISION_MAP.get(response["decision"])
+    if mapped is None:
+        raise ValueError(f"unsupported ADN v3 decision: {response['decision']}")
+    decision, reason_id = mapped
+    families = ["defense_signal", "policy_context"]
+    if response["risk"]["lockdown_state"] in _LOCKDOWN_STATES:
+        families.append("coordination_state")
+    evidence_hash = canonical_sha256(
+        {
+            "risk": response["risk"],
+            "actions": response["actions"],
+            "reason_codes": response["reason_codes"],
+            "evidence": response["evidence"],
+        }
+    )
+    return build_verdict(
+        request_id=response["request_id"],
+        context_hash=response["context_hash"],
+        decision=decision,
+        reason_ids=[reason_id],
+        evidence_hash=evidence_hash,
+        evidence_families=families,
+        metadata={
+            "v3_decision": response["decision"],
+            "v3_reason_codes": list(response["reason_codes"]),
+            "risk_level": response["risk"]["level"],
+        },
+    )
+
+
+def unsigned_payload_from_lock_verdict(
+    verdict: dict[str, Any],
+    *,
+    freshness_nonce: str,
+    not_before: str,
+    not_after: str,
+    key_registry_version: int,
+) -> dict[str, Any]:
+    """Extend a ``build_verdict`` result with the v4 fields.
+
+    Only the v4 additions are checked here: `verdict` must come straight from
+    ``build_verdict`` / ``validate_verdict``, whose decision, reason and
+    evidence registries are the ones v4 uses. The result equals what
+    ``build_unsigned_crypto_verdict_payload`` returns for the same values.
+    """
+    validate_metadata(verdict["metadata"])
+    checked_not_before, checked_not_after = validate_freshness_window(not_before=not_before, not_after=not_after)
+    return {
+        **verdict,
+        "contract_version": CONTRACT_VERSION,
+        "schema_version": VERDICT_SCHEMA_VERSION,
+        "freshness_nonce": require_non_empty_str(freshness_nonce, field="freshness_nonce"),
+        "not_before": checked_not_before,
+        "not_after": checked_not_after,
+        "canonicalization_profile": CANONICALIZATION_PROFILE,
+        "signature_policy": POLICY_VERSION,
+        "key_registry_version": require_positive_int(key_registry_version, field="key_registry_version"),
+    }
+
+
+def _prepare_chunk(engine: ADNv3, stamped: list[Stamped], key_registry_version: int) -> list[Prepared]:
+    prepared: list[Prepared] = []
+    for request, nonce, not_before, not_after in stamped:
+        response = engine.evaluate(request)
+        try:
+            payload = unsigned_payload_from_lock_verdict(
+                lock_verdict_from_response(response),
+                freshness_nonce=nonce,
+                not_before=not_before,
+                not_after=not_after,
+                key_registry_version=key_registry_version,
+            )
+            prepared.append((response, payload, signed_payload_hash(payload=payload)))
+        except ValueError as exc:
+            prepared.append((response, None, str(exc)))
+    return prepared
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _new_nonce() -> str:
+    return secrets.token_hex(16)
+
+
+class VerdictPipeline:
+    """
+    Batch Shield v3 requests through evaluation and v4 signing.
+
+    Parameters:
+    - signer: HashSigner called with each signed_payload_hash
+    - key_registry_version: key registry version written into every payload
+    - engine: ADNv3 instance (default config when omitted); pickled to
+      evaluation workers when evaluate_workers > 1
+    - evaluate_workers: processes for evaluation + hashing (1 = inline)
+    - sign_workers: threads calling `signer`
+    - chunk_size: requests per evaluation task
+    - validity: not_after - not_before for every verdict
+    - clock / nonce_factory: sources for not_before and freshness_nonce
+    """
+
+    def __init__(
+        self,
+        *,
+        signer: HashSigner,
+        key_registry_version: int,
+        engine: ADNv3 | None = None,
+        evaluate_workers: int = 1,
+        sign_workers: int = 4,
+        chunk_size: int = 64,
+        validity: timedelta = timedelta(minutes=5),
+        clock: Callable[[], datetime] = _utc_now,
+        nonce_factory: Callable[[], str] = _new_nonce,
+    ) -> None:
+        if evaluate_workers < 1 or sign_workers < 1 or chunk_size < 1:
+            raise ValueError("evaluate_workers, sign_workers and chunk_size must be positive")
+        if validity <= timedelta(0):
+            raise ValueError("validity must be positive")
+        self.signer = signer
+        self.key_registry_version = require_positive_int(key_registry_version, field="key_registry_version")
+        self.engine = engine or ADNv3()
+        self.evaluate_workers = evaluate_workers
+        self.sign_workers = sign_workers
+        self.chunk_size = chunk_size
+        self.validity = validity
+        self.clock = clock
+        self.nonce_factory = nonce_factory
+
+    def sign_request(self, request: Any) -> SignedVerdictResult:
+        return self.sign_batch([request])[0]
+
+    def sign_batch(self, requests: Iterable[Any]) -> list[SignedVerdictResult]:
+        return list(self.run(requests))
+
+    def run(self, requests: Iterable[Any]) -> Iterator[SignedVerdictResult]:
+        """Evaluate and sign `requests`, yielding one result per request in input order."""
+        window = 2 * max(self.evaluate_workers, self.sign_workers)
+        evaluating: deque[Future[list[Prepared]]] = deque()
+        signing: deque[Future[SignedVerdictResult]] = deque()
+        evaluate_pool = ProcessPoolExecutor(max_workers=self.evaluate_workers) if self.evaluate_workers > 1 else None
+        try:
+            with ThreadPoolExecutor(max_workers=self.sign_workers) as sign_pool:
+                for chunk in self._stamped_chunks(requests):
+                    if evaluate_pool is None:
+                        prepared = _prepare_chunk(self.engine, chunk, self.key_registry_version)
+                        signing.extend(sign_pool.submit(self._sign, item) for item in prepared)
+                    else:
+                        evaluating.append(
+                            evaluate_pool.submit(_prepare_chunk, self.engine, chunk, self.key_registry_version)
+                        )
+                        if len(evaluating) >= window:
+                            signing.extend(sign_pool.submit(self._sign, item) for item in evaluating.popleft().result())
+                    while len(signing) > window * self.chunk_size:
+                        yield signing.popleft().result()
+                while evaluating:
+                    signing.extend(sign_pool.submit(self._sign, item) for item in evaluating.popleft().result())
+                while signing:
+                    yield signing.popleft().result()
+        finally:
+            if evaluate_pool is not None:
+                evaluate_pool.shutdown(cancel_futures=True)
+
+    def _stamped_chunks(self, requests: Iterable[Any]) -> Iterator[list[Stamped]]:
+        chunk: list[Stamped] = []
+        for request in requests:
+            start = self.clock().astimezone(timezone.utc).replace(microsecond=0)
+            chunk.append(
+                (request, self.nonce_factory(), _rfc3339(start), _rfc3339(start + self.validity))
+            )
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _sign(self, item: Prepared) -> SignedVerdictResult:
+        response, payload, digest = item
+        request_id = str(response["request_id"])
+        if payload is None:
+            return SignedVerdictResult(request_id=request_id, response=response, envelope=None, error=digest)
+        try:
+            signatures = self.signer(digest)
+            if not isinstance(signatures, list) or not signatures:
+                raise ValueError("signer must return a non-empty list of signature entries")
+            for entry in signatures:
+                if not isinstance(entry, dict) or entry.get("signed_payload_hash") != digest:
+                    raise ValueError("signer returned an entry for a different signed_payload_hash")
+        except Exception as exc:
+            # Fail closed: no envelope without signatures over this exact payload.
+            return SignedVerdictResult(
+                request_id=request_id, response=response, envelope=None, error=f"{type(exc).__name__}: {exc}"
+            )
+        envelope = {
+            **payload,
+            "signed_payload_hash": digest,
+            "signature_bundle": build_signature_bundle(signatures=signatures),
+        }
+        return SignedVerdictResult(request_id=request_id, response=response, envelope=envelope)
+
+
+def _rfc3339(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
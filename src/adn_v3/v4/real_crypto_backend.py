@@ -39,9 +39,14 @@ class AdnV4RealCryptoBackend(Protocol):
     """
 
     backend_name: str
-    backend_version: str
     supported_algorithms: tuple[str, ...]
 
+    # Read-only: a plain attribute satisfies it, and so does a property that
+    # asks the underlying library (as OqsMlDsaBackend does).
+    @property
+    def backend_version(self) -> str:
+        """Version string of the backend and its crypto library."""
+
     def sign_message(self, *, algorithm: str, private_key_reference: str, message: bytes) -> str:
         """Return a real signature encoding for the supplied message."""
 
@@ -0,0 +1,164 @@
+"""
+Replay protection for ADN v4 ``freshness_nonce`` values.
+
+A verdict may be accepted once, and only while its freshness window is
+open. ReplayGuard makes that check in O(1) with bounded memory:
+
+- exact set     – the most recent ``max_exact`` nonces (insertion-ordered
+                  dict, oldest evicted first); a hit is a certain replay
+- Bloom filters – two generations, each covering ``horizon`` seconds of
+                  verification time. Every accepted nonce goes into the
+                  current generation; lookups consult both; on rotation the
+                  older generation is dropped. An entry therefore survives
+                  at least ``horizon`` seconds, which is at least as long as
+                  its ``not_after`` is in the future (see below).
+
+Verdicts are rejected when already expired (``verification_time`` past
+``not_after``) or when ``not_after`` lies more than ``horizon`` ahead, so no
+nonce ever needs remembering beyond the two live generations. The guard's
+clock is the latest ``verification_time`` it has seen: an earlier time is
+judged (and rotates) at that mark, so stepping time back cannot revive a
+nonce whose generation has already been dropped. A Bloom hit
+that misses the exact set is treated as a replay (fail closed) – with the
+default sizing the false-positive rate is about 1e-6 per check while a
+generation holds at most ``capacity`` nonces.
+
+Bloom positions come from keyed BLAKE2b (random per-guard key), so callers
+cannot craft nonces that collide on purpose. Nonces are recorded only after
+the rest of the verdict (signatures included) has verified; see the
+``replay_guard`` parameter of ``validate_crypto_verdict_envelope``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import threading
+from typing import Any
+
+from adn_v3.v4.trust_profile import parse_utc_timestamp, require_non_empty_str
+
+
+class _BloomFilter:
+    __slots__ = ("bits", "size", "hashes", "count")
+
+    def __init__(self, size: int, hashes: int) -> None:
+        self.bits = bytearray((size + 7) // 8)
+        self.size = size
+        self.hashes = hashes
+        self.count = 0
+
+    def positions(self, digest: bytes) -> list[int]:
+        # Kirsch–Mitzenmacher double hashing over one 128-bit keyed digest
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def might_contain(self, positions: list[int]) -> bool:
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def add(self, positions: list[int]) -> None:
+        bits = self.bits
+        for p in positions:
+            bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+
+class ReplayGuard:
+    """
+    Thread-safe accept-once check for verdict freshness nonces.
+
+    Parameters:
+    - horizon: maximum seconds between verification_time and not_after, and
+      the length of one Bloom generation
+    - capacity: nonces per generation the Bloom filters are sized for
+    - false_positive_rate: Bloom false-positive target at `capacity`
+    - max_exact: nonces kept in the exact recent set
+    - key: 16-byte Bloom hashing key; random per guard unless given (tests)
+    """
+
+    def __init__(
+        self,
+        *,
+        horizon: int = 3600,
+        capacity: int = 1_000_000,
+        false_positive_rate: float = 1e-6,
+        max_exact: int = 100_000,
+        key: bytes | None = None,
+    ) -> None:
+        if horizon < 1 or capacity < 1 or max_exact < 1:
+            raise ValueError("horizon, capacity and max_exact must be positive")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate must be within (0, 1)")
+        if key is not None and (not isinstance(key, bytes) or len(key) != 16):
+            raise ValueError("key must be 16 bytes")
+        self.horizon = horizon
+        self.capacity = capacity
+        self.max_exact = max_exact
+        self.bloom_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.bloom_hashes = max(1, round(self.bloom_bits / capacity * math.log(2)))
+        self._key = os.urandom(16) if key is None else key
+        self._lock = threading.Lock()
+        self._exact: dict[str, int] = {}
+        self._current = _BloomFilter(self.bloom_bits, self.bloom_hashes)
+        self._previous = _BloomFilter(self.bloom_bits, self.bloom_hashes)
+        self._generation: int | None = None
+        self._clock = 0  # latest verification_time seen (epoch seconds)
+        self.accepted = 0
+        self.rejected = 0
+
+    def check_and_record(self, *, freshness_nonce: str, not_after: str, verification_time: str) -> None:
+        """Accept `freshness_nonce` once; raise ValueError for replays and expired or over-long windows."""
+        nonce = require_non_empty_str(freshness_nonce, field="freshness_nonce")
+        expires = int(parse_utc_timestamp(not_after, field="not_after").timestamp())
+        now = int(parse_utc_timestamp(verification_time, field="verification_time").timestamp())
+        digest = hashlib.blake2b(nonce.encode("utf-8"), digest_size=16, key=self._key).digest()
+        with self._lock:
+            try:
+                clock = max(now, self._clock)
+                if clock > expires:
+                    raise ValueError("verdict expired")
+                if expires - now > self.horizon:
+                    raise ValueError("freshness window exceeds replay guard horizon")
+                self._rotate(clock)
+                positions = self._current.positions(digest)
+                if nonce in self._exact or self._current.might_contain(positions) or self._previous.might_contain(positions):
+                    raise ValueError("freshness_nonce replayed")
+            except ValueError:
+                self.rejected += 1
+                raise
+            self._current.add(positions)
+            if len(self._exact) >= self.max_exact:
+                del self._exact[next(iter(self._exact))]
+            self._exact[nonce] = expires
+            self.accepted += 1
+
+    def _rotate(self, now: int) -> None:
+        self._clock = now
+        generation = now // self.horizon
+        if self._generation is None:
+            self._generation = generation
+        elif generation > self._generation:
+            if generation == self._generation + 1:
+                self._previous = self._current
+            else:
+                self._previous = _BloomFilter(self.bloom_bits, self.bloom_hashes)
+            self._current = _BloomFilter(self.bloom_bits, self.bloom_hashes)
+            self._generation = generation
+            now_expired = [nonce for nonce, expires in self._exact.items() if expires < now]
+            for nonce in now_expired:
+                del self._exact[nonce]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "accepted": self.accepted,
+                "rejected": self.rejected,
+                "exact_entries": len(self._exact),
+                "current_generation_entries": self._current.count,
+                "previous_generation_entries": self._previous.count,
+                "bloom_bytes": 2 * len(self._current.bits),
+                "saturated": self._current.count > self.capacity,
+            }
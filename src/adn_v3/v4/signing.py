@@ -6,10 +6,12 @@ import unicodedata
 from collections.abc import Callable, Iterable
 from typing import Any, TypeAlias
 
+from adn_v2 import metrics
 from adn_v3.v4 import COMPONENT_ROLE, POLICY_VERSION, SIGNATURE_BUNDLE_SCHEMA_VERSION, VERDICT_SCHEMA_VERSION
 from adn_v3.v4.trust_profile import (
     REQUIRED_ALGORITHMS,
     SUPPORTED_ALGORITHMS,
+    TrustProfile,
     find_trusted_key,
     require_non_empty_str,
     require_positive_int,
@@ -19,6 +21,8 @@ from adn_v3.v4.trust_profile import (
 SIGNED_PAYLOAD_HASH_PREFIX = "DGB-SHIELD-V4-SIGNED-PAYLOAD"
 COMPONENT_VERDICT_DOMAIN = f"DGB-SHIELD-V4-COMPONENT-VERDICT:{VERDICT_SCHEMA_VERSION}:{POLICY_VERSION}"
 SignatureVerifier: TypeAlias = Callable[[dict[str, Any], dict[str, Any]], bool]
+# Signs one signed_payload_hash; returns one signature entry per algorithm.
+HashSigner: TypeAlias = Callable[[str], list[dict[str, Any]]]
 
 
 def normalise_for_signing(value: Any, *, path: str) -> Any:
@@ -60,7 +64,8 @@ def to_canonical_json(payload: dict[str, Any]) -> str:
 def reject_duplicate_json_keys(pairs: Iterable[tuple[str, Any]]) -> dict[str, Any]:
     result: dict[str, Any] = {}
     for key, value in pairs:
-        clean_key = unicodedata.normalize("NFC", key)
+        # ASCII is NFC-invariant; only non-ASCII keys pay for normalization
+        clean_key = key if key.isascii() else unicodedata.normalize("NFC", key)
         if clean_key in result:
             raise ValueError("json contains duplicate key")
         result[clean_key] = value
@@ -126,7 +131,34 @@ def verify_signature_bundle(
     bundle: dict[str, Any],
     *,
     expected_signed_payload_hash: str,
-    trust_profile: dict[str, Any],
+    trust_profile: TrustProfile,
+    verification_time: str,
+    artifact_not_before: str,
+    artifact_not_after: str,
+    verifier: SignatureVerifier,
+) -> dict[str, Any]:
+    try:
+        summary = _verify_signature_bundle(
+            bundle,
+            expected_signed_payload_hash=expected_signed_payload_hash,
+            trust_profile=trust_profile,
+            verification_time=verification_time,
+            artifact_not_before=artifact_not_before,
+            artifact_not_after=artifact_not_after,
+            verifier=verifier,
+        )
+    except ValueError:
+        metrics.V4_VERIFICATIONS.inc(labels=("failed",))
+        raise
+    metrics.V4_VERIFICATIONS.inc(labels=("ok",))
+    return summary
+
+
+def _verify_signature_bundle(
+    bundle: dict[str, Any],
+    *,
+    expected_signed_payload_hash: str,
+    trust_profile: TrustProfile,
     verification_time: str,
     artifact_not_before: str,
     artifact_not_after: str,
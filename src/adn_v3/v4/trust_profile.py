@@ -117,8 +117,40 @@ def validate_trust_profile(profile: dict[str, Any]) -> dict[str, Any]:
     return {"schema_version": KEY_REGISTRY_SCHEMA_VERSION, "registry_version": registry_version, "entries": checked_entries}
 
 
+class CompiledTrustProfile:
+    """Trust profile validated once and indexed for repeated key lookups.
+
+    ``find_trusted_key`` re-validates a plain profile dict on every call; bulk
+    verifiers pass a ``CompiledTrustProfile`` instead so the registry is checked
+    once and each lookup is a dict hit plus the time-window checks.
+    """
+
+    __slots__ = ("profile", "_keys")
+
+    def __init__(self, profile: dict[str, Any]) -> None:
+        self.profile = validate_trust_profile(profile)
+        self._keys: dict[tuple[str, int, str], tuple[dict[str, Any], datetime, datetime]] = {}
+        for entry in self.profile["entries"]:
+            if entry["role"] == COMPONENT_ROLE:
+                self._keys[(entry["key_id"], entry["key_version"], entry["algorithm"])] = (
+                    entry,
+                    parse_utc_timestamp(entry["not_before"], field="key_not_before"),
+                    parse_utc_timestamp(entry["not_after"], field="key_not_after"),
+                )
+
+    def lookup(self, key_id: str, key_version: int, algorithm: str) -> tuple[dict[str, Any], datetime, datetime] | None:
+        return self._keys.get((key_id, key_version, algorithm))
+
+
+TrustProfile = dict[str, Any] | CompiledTrustProfile
+
+
+def compile_trust_profile(profile: TrustProfile) -> CompiledTrustProfile:
+    return profile if isinstance(profile, CompiledTrustProfile) else CompiledTrustProfile(profile)
+
+
 def find_trusted_key(
-    profile: dict[str, Any],
+    profile: TrustProfile,
     *,
     key_id: str,
     key_version: int,
@@ -127,7 +159,11 @@ def find_trusted_key(
     artifact_not_before: str,
     artifact_not_after: str,
 ) -> dict[str, Any]:
-    checked_profile = validate_trust_profile(profile)
+    compiled: CompiledTrustProfile | None
+    if isinstance(profile, CompiledTrustProfile):
+        compiled, checked_profile = profile, profile.profile
+    else:
+        compiled, checked_profile = None, validate_trust_profile(profile)
     verification_dt = parse_utc_timestamp(verification_time, field="verification_time")
     artifact_start = parse_utc_timestamp(artifact_not_before, field="artifact_not_before")
     artifact_end = parse_utc_timestamp(artifact_not_after, field="artifact_not_after")
@@ -136,6 +172,12 @@ def find_trusted_key(
     clean_key_id = require_non_empty_str(key_id, field="key_id")
     clean_key_version = require_positive_int(key_version, field="key_version")
     clean_algorithm = require_supported_algorithm(algorithm)
+    if compiled is not None:
+        found = compiled.lookup(clean_key_id, clean_key_version, clean_algorithm)
+        if found is None:
+            raise ValueError("trusted ADN key not found")
+        entry, key_start, key_end = found
+        return _check_key_validity(entry, key_start, key_end, verification_dt, artifact_start, artifact_end)
     for entry in checked_profile["entries"]:
         if (
             entry["role"] == COMPONENT_ROLE
@@ -143,13 +185,24 @@ def find_trusted_key(
             and entry["key_version"] == clean_key_version
             and entry["algorithm"] == clean_algorithm
         ):
-            if entry["status"] != ACTIVE:
-                raise ValueError("key is revoked")
             key_start = parse_utc_timestamp(entry["not_before"], field="key_not_before")
             key_end = parse_utc_timestamp(entry["not_after"], field="key_not_after")
-            if not (key_start <= verification_dt <= key_end):
-                raise ValueError("key is not valid at verification time")
-            if not (key_start <= artifact_start <= key_end and key_start <= artifact_end <= key_end):
-                raise ValueError("artifact was produced outside key validity window")
-            return entry
+            return _check_key_validity(entry, key_start, key_end, verification_dt, artifact_start, artifact_end)
     raise ValueError("trusted ADN key not found")
+
+
+def _check_key_validity(
+    entry: dict[str, Any],
+    key_start: datetime,
+    key_end: datetime,
+    verification_dt: datetime,
+    artifact_start: datetime,
+    artifact_end: datetime,
+) -> dict[str, Any]:
+    if entry["status"] != ACTIVE:
+        raise ValueError("key is revoked")
+    if not (key_start <= verification_dt <= key_end):
+        raise ValueError("key is not valid at verification time")
+    if not (key_start <= artifact_start <= key_end and key_start <= artifact_end <= key_end):
+        raise ValueError("artifact was produced outside key validity window")
+    return entry
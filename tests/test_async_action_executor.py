@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from adn_v2.actions import AsyncActionExecutor
+from adn_v2.models import DefenseAction, PolicyDecision, RiskLevel
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _blocked_executor(**kwargs):
+    gate = threading.Event()
+    handled = []
+
+    def handler(request):
+        gate.wait(5)
+        handled.append((request.key, request.payload))
+
+    return AsyncActionExecutor("node-a", handler, workers=1, **kwargs), gate, handled
+
+
+def test_execute_is_non_blocking_and_updates_state():
+    executor, gate, handled = _blocked_executor()
+    decision = PolicyDecision(level=RiskLevel.CRITICAL, score=0.95, reason="r", actions=["lockdown_trigger"])
+    context = {"node_state": {}}
+
+    executor.execute(decision, context)
+    assert context["node_state"] == {"hardened": True}
+    assert handled == []
+
+    gate.set()
+    assert executor.flush(timeout=5)
+    assert handled == [("node-a:lockdown_trigger", {"level": "critical", "reason": "r"})]
+    assert executor.stats["dispatched"] == 1
+    executor.close()
+
+
+def test_pending_requests_coalesce_and_debounce_suppresses_repeats():
+    clock = _Clock()
+    executor, gate, handled = _blocked_executor(debounce={"ENTER_FULL_LOCKDOWN": 30.0}, clock=clock)
+
+    assert executor.submit("warmup") is True  # occupies the single worker
+    assert executor.submit("THROTTLE_RPC", {"n": 1}) is True
+    assert executor.submit("THROTTLE_RPC", {"n": 2}) is False  # coalesced while queued
+    gate.set()
+    executor.flush(timeout=5)
+    assert ("node-a:THROTTLE_RPC", {"n": 2}) in handled
+
+    flap = [DefenseAction(action_type="ENTER_FULL_LOCKDOWN", reason="x")]
+    executor.dispatch_defense_actions(flap)
+    executor.flush(timeout=5)
+    clock.now += 10
+    executor.dispatch_defense_actions(flap)
+    clock.now += 25
+    executor.dispatch_defense_actions(flap)
+    executor.flush(timeout=5)
+
+    assert [k for k, _ in handled].count("node-a:ENTER_FULL_LOCKDOWN") == 2
+    assert executor.stats["debounced"] == 1
+    assert executor.stats["coalesced"] == 1
+    # Explicit idempotency keys separate otherwise identical actions.
+    assert executor.submit("ENTER_FULL_LOCKDOWN", idempotency_key="incident-7") is True
+    executor.close()
+    with pytest.raises(RuntimeError):
+        executor.submit("late")
+
+
+def test_full_queue_drops_and_handler_errors_are_contained():
+    executor, gate, handled = _blocked_executor(max_queue=1)
+    executor.submit("a")
+    # wait for the worker to pick up "a" so the queue slot frees up
+    for _ in range(500):
+        if not executor._pending:
+            break
+        threading.Event().wait(0.01)
+    assert executor.submit("b") is True
+    assert executor.submit("c") is False
+    assert executor.stats["dropped"] == 1
+    gate.set()
+    executor.flush(timeout=5)
+
+    def boom(request):
+        raise RuntimeError("gateway down")
+
+    failing = AsyncActionExecutor("node-b", boom)
+    failing.submit("x")
+    assert failing.flush(timeout=5)
+    assert failing.stats["failed"] == 1
+    failing.close()
+    failing.close()
+    executor.close()
+
+    with pytest.raises(ValueError):
+        AsyncActionExecutor("n", workers=0)
+
+
+def test_flush_times_out_while_handler_is_blocked():
+    executor, gate, _ = _blocked_executor()
+    executor.submit("slow")
+    assert executor.flush(timeout=0.05) is False
+    gate.set()
+    assert executor.flush(timeout=5) is True
+    executor.close(timeout=5)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_lockdown_actions_run_in_order_and_latest_repeat_runs_last(workers):
+    gate = threading.Event()
+    lock = threading.Lock()
+    order, active, peak = [], [0], [0]
+
+    def handler(request):
+        with lock:
+            order.append(request.action_type)
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        if request.payload.get("block"):
+            gate.wait(5)
+        with lock:
+            active[0] -= 1
+
+    executor = AsyncActionExecutor("node-a", handler, workers=workers)
+    executor.submit("lockdown_trigger", {"block": True})
+    assert executor.submit("ENTER_FULL_LOCKDOWN") is True
+    assert executor.submit("LIFT_LOCKDOWN") is True
+    assert executor.submit("ENTER_FULL_LOCKDOWN") is False  # coalesced: moves behind the LIFT
+    threading.Event().wait(0.05)
+    gate.set()
+    assert executor.flush(timeout=5)
+
+    assert order == ["lockdown_trigger", "LIFT_LOCKDOWN", "ENTER_FULL_LOCKDOWN"]
+    assert peak[0] == 1
+    assert (executor.stats["dispatched"], executor.stats["coalesced"]) == (3, 1)
+    executor.close()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parents[1] / "benchmarks"
+
+
+def _bench_run():
+    if str(BENCH_DIR) not in sys.path:
+        sys.path.insert(0, str(BENCH_DIR))
+    return importlib.import_module("run")
+
+
+def test_benchmark_compare_flags_only_regressions_over_threshold():
+    run = _bench_run()
+    baseline = {"results": {"a": {"ns_per_op_median": 100.0}, "b": {"ns_per_op_median": 100.0}, "c": {"skipped": True}}}
+    current = {"results": {"a": {"ns_per_op_median": 120.0}, "b": {"ns_per_op_median": 140.0}, "c": {"skipped": True}}}
+
+    regressions = run.compare(current, baseline, threshold=0.25)
+
+    assert [r["name"] for r in regressions] == ["b"]
+    assert regressions[0]["ratio"] == 1.4
+
+
+def test_benchmark_suite_runs_a_case_and_emits_json_shape():
+    run = _bench_run()
+    result = run.run_suite(repeat=1, scale=0.01, only="v3_canonical_sha256")
+
+    assert result["schema"] == run.SCHEMA
+    assert set(result["results"]) == {"v3_canonical_sha256_typical"}
+    assert result["results"]["v3_canonical_sha256_typical"]["ns_per_op_median"] > 0
+    assert len({case.name for case in run.BENCHMARKS}) == len(run.BENCHMARKS)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+import pytest
+
+from adn_v2.adaptive_bridge import BufferedAdaptiveSink, build_adaptive_event_from_adn, emit_adaptive_event
+
+FIXED = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(i):
+    return build_adaptive_event_from_adn(
+        event_id=f"e{i}", decision="WARN", severity=0.5, fingerprint="fp", node_id="n", created_at=FIXED
+    )
+
+
+def test_fast_to_dict_matches_asdict_output():
+    event = _event(1)
+    expected = asdict(event)
+    expected["created_at"] = FIXED.isoformat()
+    assert event.to_dict() == expected
+    assert list(event.to_dict()) == list(expected)
+    assert event.to_dict()["metadata"] is not event.metadata
+    nested = build_adaptive_event_from_adn(
+        event_id="e", decision="WARN", severity=0.5, fingerprint="fp", extra_meta={"peers": ["a"]}, created_at=FIXED
+    )
+    assert nested.to_dict()["metadata"]["peers"] is not nested.metadata["peers"]
+
+
+def test_sink_batches_by_size_and_flushes_on_close():
+    batches = []
+    sink = BufferedAdaptiveSink(batches.append, batch_size=3, max_age=60.0)
+
+    for i in range(7):
+        emit_adaptive_event(sink, event_id=f"e{i}", decision="ALLOW", severity=0.1, fingerprint="fp", created_at=FIXED)
+    assert sink.flush(timeout=5)
+    assert [len(b) for b in batches][:2] == [3, 3]
+    assert [e["event_id"] for b in batches for e in b] == [f"e{i}" for i in range(7)]
+
+    sink(_event(99))
+    sink.close(timeout=5)
+    assert batches[-1][-1]["event_id"] == "e99"
+    assert sink.stats["flushed"] == 8 and sink.stats["dropped"] == 0
+    with pytest.raises(RuntimeError):
+        sink(_event(100))
+
+
+def test_sink_forwards_the_event_as_it_was_when_emitted():
+    batches = []
+    sink = BufferedAdaptiveSink(batches.append, batch_size=100, max_age=60.0)
+    event = build_adaptive_event_from_adn(
+        event_id="e1", decision="WARN", severity=0.5, fingerprint="fp", extra_meta={"peers": ["a"]}, created_at=FIXED
+    )
+    sink(event)
+    event.metadata["peers"].append("b")
+    for i in range(1000):
+        event.metadata[f"k{i}"] = i
+    sink.close(timeout=5)
+
+    assert sink.stats["failed"] == 0
+    assert batches == [[{**event.to_dict(), "metadata": {"peers": ["a"]}}]]
+
+
+def test_sink_flushes_by_age():
+    done = threading.Event()
+    sink = BufferedAdaptiveSink(lambda batch: done.set(), batch_size=100, max_age=0.05)
+    sink(_event(1))
+    assert done.wait(5)
+    sink.close(timeout=5)
+
+
+def test_full_ring_drops_oldest_and_failures_are_counted():
+    gate = threading.Event()
+    seen = []
+
+    def slow(batch):
+        gate.wait(5)
+        seen.extend(e["event_id"] for e in batch)
+        raise ConnectionError("adaptive core down")
+
+    sink = BufferedAdaptiveSink(slow, capacity=4, batch_size=1, max_age=60.0)
+    sink(_event(0))
+    # Wait until the worker is blocked inside flush_batch with event 0.
+    for _ in range(500):
+        if not len(sink):
+            break
+        threading.Event().wait(0.01)
+    for i in range(1, 7):
+        sink(_event(i))
+    assert len(sink) == 4
+    assert sink.stats["dropped"] == 2
+    assert sink.flush(timeout=0.05) is False
+
+    gate.set()
+    assert sink.flush(timeout=5)
+    assert seen == ["e0", "e3", "e4", "e5", "e6"]
+    assert sink.stats["failed"] == 5 and sink.stats["accepted"] == 7
+    sink.close(timeout=5)
+
+    with pytest.raises(ValueError):
+        BufferedAdaptiveSink(seen.append, capacity=0)
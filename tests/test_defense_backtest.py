@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from adn_v2.backtest import batch_events, config_grid, main, replay, run_backtest, severity_series
+from adn_v2.engine import evaluate_defense
+from adn_v2.models import DefenseEvent, NodeDefenseConfig, NodeDefenseState
+
+
+def _events(count=600, seed=11):
+    rng = random.Random(seed)
+    events = []
+    level = 0.3
+    for i in range(count):
+        if i % 50 == 0:
+            level = rng.choice((0.1, 0.4, 0.6, 0.9))
+        events.append(DefenseEvent("alert", round(min(1.0, max(0.0, rng.gauss(level, 0.1))), 3), "sentinel", timestamp=1_000 + 10 * i))
+    return events
+
+
+def _direct(batches, config):
+    state = NodeDefenseState()
+    counts = {"ENTER_FULL_LOCKDOWN": 0, "ENTER_PARTIAL_LOCKDOWN": 0, "LIFT_LOCKDOWN": 0}
+    for batch in batches:
+        evaluate_defense(batch, config=config, state=state)
+        for action in state.last_actions:
+            counts[action.action_type] += 1
+    return state.lockdown_state.value, counts
+
+
+def test_replay_matches_evaluate_defense_for_every_config():
+    batches = list(batch_events(_events(), size=7))
+    configs = config_grid([0.3, 0.4, 0.5, 0.75], [0.2, 0.3, 0.35, 0.5])
+    results = run_backtest(batches, configs)
+
+    assert [(r.lockdown_threshold, r.partial_lock_threshold) for r in results] == [
+        (c.lockdown_threshold, c.partial_lock_threshold) for c in configs
+    ]
+    for config, result in zip(configs, results, strict=True):
+        final, counts = _direct(batches, config)
+        assert result.final_state == final
+        assert (result.enter_full, result.enter_partial, result.lifts) == (
+            counts["ENTER_FULL_LOCKDOWN"], counts["ENTER_PARTIAL_LOCKDOWN"], counts["LIFT_LOCKDOWN"]
+        )
+        assert result.transitions == sum(counts.values())
+        assert result.batches == len(batches)
+    assert any(r.transitions for r in results)
+
+    assert run_backtest(batches, configs, workers=3) == results
+
+
+def test_time_and_flap_accounting():
+    series = [(0, 0.1), (10, 0.8), (20, 0.6), (30, 0.1), (1000, 0.6), (2000, 0.6), (2500, 0.1)]
+    result = replay(series, NodeDefenseConfig(lockdown_threshold=0.75, partial_lock_threshold=0.5), flap_window=100)
+
+    assert (result.full_seconds, result.partial_seconds, result.lockdown_seconds) == (20, 1500, 1520)
+    assert (result.full_batches, result.partial_batches) == (2, 2)
+    assert (result.episodes, result.flaps, result.lifts) == (2, 1, 2)
+    assert result.to_dict()["lockdown_seconds"] == 1520
+    assert result.final_state == "NONE"
+
+
+def test_batching_helpers():
+    events = _events(count=10)
+    assert [len(b) for b in batch_events(events, size=4)] == [4, 4, 2]
+    assert [len(b) for b in batch_events(events)] == [1] * 10
+    assert [len(b) for b in batch_events(events, window_seconds=30)] == [2, 3, 3, 2]
+    with pytest.raises(ValueError):
+        list(batch_events(events, size=0))
+    with pytest.raises(ValueError):
+        list(batch_events(events, window_seconds=0))
+    with pytest.raises(ValueError):
+        run_backtest([], [], workers=0)
+    assert severity_series([[], events[:2]]) == [(1010, (events[0].severity + events[1].severity) / 2)]
+    assert config_grid([0.5], [0.4, 0.6]) == [NodeDefenseConfig(lockdown_threshold=0.5, partial_lock_threshold=0.4)]
+
+
+def test_cli_prints_one_result_per_config(tmp_path, capsys):
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        "\n".join(json.dumps({"event_type": e.event_type, "severity": e.severity, "timestamp": e.timestamp}) for e in _events(100))
+        + "\n\n",
+        encoding="utf-8",
+    )
+    assert main([str(path), "--lockdown", "0.7", "0.8", "--partial", "0.4", "--window", "60"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["lockdown_threshold"] for row in rows] == [0.7, 0.8]
+    assert all(row["batches"] > 0 for row in rows)
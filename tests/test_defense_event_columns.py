@@ -0,0 +1,90 @@
+from adn_v2.engine import evaluate_defense
+from adn_v2.models import DefenseEvent, EventColumns, NodeDefenseState
+
+
+def _events():
+    return [
+        DefenseEvent(event_type="rpc_abuse", severity=0.6, source="local"),
+        DefenseEvent(event_type="sentinel_alert", severity=0.2, source="sentinel", metadata={"k": 1}),
+        DefenseEvent(event_type="rpc_abuse", severity=0.8, source="local", timestamp=1_700_000_000),
+    ]
+
+
+def test_event_columns_round_trip_and_interning():
+    store = EventColumns(_events())
+
+    assert len(store) == 3
+    assert list(store) == _events()
+    assert store == _events()
+    assert store[-1].timestamp == 1_700_000_000
+    assert store[1:] == _events()[1:]
+    assert store.event_type_names == ["rpc_abuse", "sentinel_alert"]
+    assert store.source_names == ["local", "sentinel"]
+    assert list(store.source_codes) == [0, 1, 0]
+    # metadata side table only holds non-empty rows
+    assert store.metadata == {1: {"k": 1}}
+
+
+def test_event_columns_copy_metadata_in_and_out():
+    event = DefenseEvent(event_type="x", severity=0.1, source="s", metadata={"k": 1})
+    store = EventColumns([event])
+
+    event.metadata["k"] = 2
+    assert store[0].metadata == {"k": 1}
+
+    store[0].metadata["k"] = 3
+    next(iter(store)).metadata.clear()
+    assert store[0].metadata == {"k": 1}
+    assert store[0].metadata is not store[0].metadata
+
+
+def test_event_columns_average_severity_by_source():
+    store = EventColumns(_events())
+    by_source = store.average_severity_by_source()
+
+    assert by_source["local"] == (0.6 + 0.8) / 2
+    assert by_source["sentinel"] == 0.2
+    # running total, no walk of the buffer
+    assert store.severity_sum() == 0.6 + 0.2 + 0.8 == sum(store.severities)
+
+    store.clear()
+    assert len(store) == 0
+    assert store.average_severity_by_source() == {}
+    assert store.severity_sum() == 0.0
+    store.extend(_events()[:1])
+    assert store.severity_sum() == 0.6
+
+
+def test_node_defense_state_accepts_plain_list_and_engine_extends_store():
+    state = NodeDefenseState(active_events=[DefenseEvent(event_type="x", severity=0.1, source="s")])
+    assert isinstance(state.active_events, EventColumns)
+
+    state = evaluate_defense(_events(), state=state)
+    assert len(state.active_events) == 4
+    assert state.active_events[0].event_type == "x"
+
+
+def test_evaluate_defense_maintains_incremental_aggregates():
+    state = evaluate_defense(_events())
+    local = state.source_aggregates["local"]
+    assert (local.count, local.severity_max, local.last_seen) == (2, 0.8, 1_700_000_000)
+    assert local.severity_avg == (0.6 + 0.8) / 2
+    assert state.event_type_aggregates["sentinel_alert"].count == 1
+
+    state = evaluate_defense(
+        [DefenseEvent(event_type="dqsn_critical", severity=0.9, source="dqsn", timestamp=5)],
+        state=state,
+    )
+    assert state.source_aggregates["dqsn"].severity_sum == 0.9
+    assert state.source_aggregates["local"].count == 2
+    assert set(state.event_type_aggregates) == {"rpc_abuse", "sentinel_alert", "dqsn_critical"}
+
+    # empty batch leaves the breakdown untouched
+    before = dict(state.source_aggregates)
+    assert evaluate_defense([], state=state).source_aggregates == before
+
+
+def test_state_seeded_from_list_builds_aggregates_once():
+    state = NodeDefenseState(active_events=_events())
+    assert state.source_aggregates["local"].count == 2
+    assert state.event_type_aggregates["rpc_abuse"].severity_max == 0.8
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+from adn_v2.engine import ADNEngine
+from adn_v2.models import PolicyDecision, RiskLevel, TelemetryPacket
+
+_ORDER = list(RiskLevel)
+
+
+class _MaxLevelPolicy:
+    def decide(self, signals):
+        top = max(signals, key=lambda s: _ORDER.index(s.level))
+        level = RiskLevel.CRITICAL if top.level is RiskLevel.HIGH else top.level
+        return PolicyDecision(level=level, score=top.score, reason=top.details["reason"], actions=[])
+
+
+def _engine() -> ADNEngine:
+    return ADNEngine(node_id="stream-node", policy_engine=_MaxLevelPolicy())
+
+
+def _feed():
+    return [
+        {"peer_count": 8, "mempool_size": 10},
+        {"peer_count": 1, "mempool_size": 10},
+        TelemetryPacket(node_id="stream-node", height=5, mempool_size=30_000, peer_count=8, timestamp=1.0),
+        {"peer_count": 8, "mempool_size": 10},
+    ]
+
+
+def test_process_stream_matches_process_packet_semantics():
+    single = _engine()
+    expected = []
+    for item in _feed():
+        if isinstance(item, TelemetryPacket):
+            expected.append(single.process_packet(item))
+        else:
+            expected.append(single.process_raw_telemetry(item))
+
+    streamed = _engine()
+    decisions = list(streamed.process_stream(_feed()))
+
+    assert decisions == expected
+    assert [d.reason for d in decisions] == ["baseline_telemetry", "low_peer_count", "mempool_spike", "baseline_telemetry"]
+    assert streamed.state.hardened_mode is True
+    assert streamed.state.last_decision == expected[-1]
+
+
+def test_process_stream_is_lazy_over_unbounded_feeds():
+    engine = _engine()
+    endless = itertools.cycle([{"peer_count": 8}])
+    first = list(itertools.islice(engine.process_stream(endless), 1000))
+
+    assert len(first) == 1000
+    assert engine.state.hardened_mode is False
+
+
+def test_process_stream_async_yields_in_order():
+    async def source():
+        for item in _feed():
+            await asyncio.sleep(0)
+            yield item
+
+    async def collect():
+        return [d.reason async for d in _engine().process_stream_async(source())]
+
+    assert asyncio.run(collect()) == ["baseline_telemetry", "low_peer_count", "mempool_spike", "baseline_telemetry"]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from adn_v2.models import DefenseEvent
+from adn_v3.contracts.v3_2_lock import build_verdict
+from adn_v3.evidence import (
+    EMPTY_EVIDENCE_HASH,
+    EvidenceAccumulator,
+    evidence_hash,
+    evidence_leaf_hash,
+    verify_evidence_inclusion,
+)
+
+
+def _event(i: int) -> dict:
+    return {"event_type": "rpc_abuse", "severity": (i % 10) / 10, "source": "local", "metadata": {"seq": i}}
+
+
+def _mth(leaves: list[bytes]) -> bytes:
+    # RFC 9162 2.1.1 Merkle Tree Hash, straight from the definition.
+    if len(leaves) == 1:
+        return leaves[0]
+    k = 1
+    while k * 2 < len(leaves):
+        k *= 2
+    return hashlib.sha256(b"\x01" + _mth(leaves[:k]) + _mth(leaves[k:])).digest()
+
+
+def test_accumulator_root_is_the_rfc_merkle_tree_hash_at_every_size() -> None:
+    acc = EvidenceAccumulator()
+    assert acc.evidence_hash == EMPTY_EVIDENCE_HASH == hashlib.sha256(b"").hexdigest()
+    leaves = []
+    for i in range(33):
+        assert acc.append(_event(i)) == i
+        leaves.append(evidence_leaf_hash(_event(i)))
+        assert acc.evidence_hash == _mth(leaves).hex()
+    assert len(acc) == 33
+    assert [acc.evidence_hash_at(size) for size in range(34)] == [evidence_hash(_event(i) for i in range(size)) for size in range(34)]
+
+
+def test_leaves_are_canonical_json_and_accept_dataclass_events() -> None:
+    event = DefenseEvent(event_type="rpc_abuse", severity=0.5, source="local", metadata={"b": 1, "a": "é"}, timestamp=7)
+    as_dict = {"timestamp": 7, "source": "local", "severity": 0.5, "metadata": {"a": "é", "b": 1}, "event_type": "rpc_abuse"}
+    encoded = json.dumps(as_dict, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    assert evidence_leaf_hash(event) == evidence_leaf_hash(as_dict) == hashlib.sha256(b"\x00" + encoded).digest()
+    verdict = build_verdict(
+        request_id="r",
+        context_hash="a" * 64,
+        decision="ALLOW",
+        reason_ids=["ADN_OK_COORDINATION_ALLOW"],
+        evidence_hash=EvidenceAccumulator([event]).evidence_hash,
+        evidence_families=["defense_signal"],
+    )
+    assert verdict["evidence_hash"] == evidence_leaf_hash(event).hex()
+
+
+@pytest.mark.parametrize("total", [1, 2, 3, 6, 7, 8, 13])
+def test_every_inclusion_proof_verifies_at_every_tree_size(total: int) -> None:
+    acc = EvidenceAccumulator(_event(i) for i in range(total))
+    for size in range(1, total + 1):
+        root = acc.evidence_hash_at(size)
+        for index in range(size):
+            proof = acc.inclusion_proof(index, size)
+            assert verify_evidence_inclusion(_event(index), proof, evidence_hash=root)
+            assert not verify_evidence_inclusion(_event(index + 1), proof, evidence_hash=root)
+    assert acc.inclusion_proof(0)["tree_size"] == total
+
+
+def test_tampered_proofs_do_not_verify() -> None:
+    acc = EvidenceAccumulator(_event(i) for i in range(11))
+    root = acc.evidence_hash
+    proof = acc.inclusion_proof(9)
+
+    assert not verify_evidence_inclusion(_event(9), {**proof, "leaf_index": 8}, evidence_hash=root)
+    assert not verify_evidence_inclusion(_event(9), {**proof, "tree_size": 10}, evidence_hash=root)
+    assert not verify_evidence_inclusion(_event(9), {**proof, "path": proof["path"] + ["00" * 32]}, evidence_hash=root)
+    assert not verify_evidence_inclusion(_event(9), {**proof, "path": proof["path"][:-1]}, evidence_hash=root)
+    assert not verify_evidence_inclusion(_event(9), proof, evidence_hash=EMPTY_EVIDENCE_HASH)
+
+
+@pytest.mark.parametrize(
+    ("proof", "message"),
+    [
+        ([], "fields must match"),
+        ({"leaf_index": 0, "tree_size": 1}, "fields must match"),
+        ({"leaf_index": -1, "tree_size": 1, "path": []}, "leaf_index must be non-negative"),
+        ({"leaf_index": 0, "tree_size": True, "path": []}, "tree_size must be non-negative"),
+        ({"leaf_index": 1, "tree_size": 1, "path": []}, "leaf_index out of range"),
+        ({"leaf_index": 0, "tree_size": 2, "path": "ab"}, "path must be list"),
+        ({"leaf_index": 0, "tree_size": 2, "path": ["zz"]}, "entries must be hex"),
+        ({"leaf_index": 0, "tree_size": 2, "path": [None]}, "entries must be hex"),
+    ],
+)
+def test_malformed_proofs_fail_closed(proof, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        verify_evidence_inclusion(_event(0), proof, evidence_hash=EMPTY_EVIDENCE_HASH)
+
+
+def test_accumulator_input_checks() -> None:
+    acc = EvidenceAccumulator([_event(0), _event(1)])
+    with pytest.raises(ValueError, match="must be dict or dataclass"):
+        acc.append(["not", "an", "event"])
+    with pytest.raises(ValueError, match="must be dict or dataclass"):
+        acc.append(DefenseEvent)
+    with pytest.raises(ValueError, match="32-byte"):
+        acc.append_leaf(b"short")
+    with pytest.raises(ValueError, match="tree_size out of range"):
+        acc.evidence_hash_at(3)
+    with pytest.raises(ValueError, match="tree_size out of range"):
+        acc.inclusion_proof(0, -1)
+    with pytest.raises(ValueError, match="leaf_index out of range"):
+        acc.inclusion_proof(2)
+    with pytest.raises(ValueError, match="leaf_index out of range"):
+        acc.inclusion_proof(True)
+    with pytest.raises(ValueError):
+        evidence_hash([{"severity": float("nan")}])
+    for value in ({"a", "b"}, b"raw", object()):
+        with pytest.raises(ValueError, match="not JSON-serializable"):
+            evidence_leaf_hash({"metadata": {"tags": value}})
+    with pytest.raises(ValueError, match="not JSON-serializable"):
+        acc.append(DefenseEvent(event_type="x", severity=0.1, source="s", metadata={"tags": {"a"}}))
+    assert len(acc) == 2
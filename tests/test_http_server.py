@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from adn_v2.engine import ADNEngine
+from adn_v2.http_server import ADNHTTPServer
+from adn_v2.models import PolicyDecision, RiskLevel
+from adn_v2.server import ADNServer
+from adn_v3.v4.crypto_verdict import build_signed_crypto_verdict_envelope, build_unsigned_crypto_verdict_payload
+from adn_v3.v4.signing import build_signature_bundle, build_test_signature_entry, signed_payload_hash, verify_test_only_signature
+from adn_v3.v4.trust_profile import CLASSICAL_ED25519, ML_DSA, CompiledTrustProfile, build_test_trust_profile
+
+
+class _FixedPolicy:
+    def decide(self, signals):
+        return PolicyDecision(level=RiskLevel.NORMAL, score=0.1, reason="fixed", actions=[])
+
+
+async def _request(reader, writer, method, path, payload=None, headers=""):
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n{headers}\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    headers_out = {}
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers_out[name.strip().lower()] = value.strip()
+    data = await reader.readexactly(int(headers_out["content-length"]))
+    return int(status_line.split()[1]), headers_out, json.loads(data)
+
+
+def _signed_verdict():
+    payload = build_unsigned_crypto_verdict_payload(
+        request_id="req-http",
+        context_hash="a" * 64,
+        freshness_nonce="nonce-http",
+        not_before="2026-06-21T00:00:00Z",
+        not_after="2026-06-21T00:05:00Z",
+        decision="ALLOW",
+        reason_ids=["ADN_OK_COORDINATION_ALLOW"],
+        evidence_hash="b" * 64,
+        evidence_families=["defense_signal"],
+        key_registry_version=1,
+    )
+    digest = signed_payload_hash(payload=payload)
+    signatures = [build_test_signature_entry(algorithm=a, signed_hash=digest) for a in (CLASSICAL_ED25519, ML_DSA)]
+    return build_signed_crypto_verdict_envelope(unsigned_payload=payload, signature_bundle=build_signature_bundle(signatures=signatures))
+
+
+def test_http_server_routes_over_one_keep_alive_connection():
+    async def scenario():
+        engine = ADNEngine(node_id="http-node", policy_engine=_FixedPolicy())
+        http = ADNHTTPServer(
+            ADNServer(engine),
+            trust_profile=build_test_trust_profile(),
+            verifier=verify_test_only_signature,
+            max_body_bytes=4096,
+            max_concurrency=2,
+        )
+        assert isinstance(http.trust_profile, CompiledTrustProfile)
+        host, port = await http.start("127.0.0.1", 0)
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+
+            status, headers, body = await _request(reader, writer, "GET", "/health")
+            assert (status, headers["connection"], body["node_id"]) == (200, "keep-alive", "http-node")
+
+            status, _, body = await _request(
+                reader, writer, "POST", "/telemetry", {"type": "telemetry", "data": {"peer_count": 8}}
+            )
+            assert (status, body["level"], body["reason"]) == (200, "normal", "fixed")
+
+            status, _, body = await _request(
+                reader, writer, "POST", "/v3/evaluate",
+                {"contract_version": 3, "component": "adn", "request_id": "http", "events": []},
+            )
+            assert (status, body["decision"]) == (200, "ALLOW")
+
+            status, _, body = await _request(
+                reader, writer, "POST", "/v4/verify",
+                {"verdict": _signed_verdict(), "expected_context_hash": "a" * 64, "verification_time": "2026-06-21T00:01:00Z"},
+            )
+            assert status == 200 and body["verified"] is True
+
+            status, _, body = await _request(
+                reader, writer, "POST", "/v4/verify",
+                {"verdict": _signed_verdict(), "expected_context_hash": "c" * 64, "verification_time": "2026-06-21T00:01:00Z"},
+            )
+            assert body == {"verified": False, "error": "context_hash mismatch"}
+
+            assert (await _request(reader, writer, "GET", "/nope"))[0] == 404
+            assert (await _request(reader, writer, "GET", "/v3/evaluate"))[0] == 405
+            status, headers, _ = await _request(reader, writer, "GET", "/health", headers="Connection: close\r\n")
+            assert headers["connection"] == "close"
+            assert await reader.read() == b""
+            writer.close()
+        finally:
+            await http.close()
+
+    asyncio.run(scenario())
+
+
+def test_http_server_rejects_oversize_and_bad_bodies():
+    async def scenario():
+        http = ADNHTTPServer(max_body_bytes=64)
+        host, port = await http.start("127.0.0.1", 0)
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            status, headers, body = await _request(reader, writer, "POST", "/v3/evaluate", {"pad": "x" * 100})
+            assert (status, headers["connection"]) == (413, "close")
+            writer.close()
+
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"POST /v3/evaluate HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x}")
+            line = await reader.readline()
+            assert line.startswith(b"HTTP/1.1 400")
+            writer.close()
+
+            reader, writer = await asyncio.open_connection(host, port)
+            status, _, body = await _request(reader, writer, "POST", "/v4/verify", {})
+            assert (status, body["error"]) == (503, "v4 verification is not configured")
+            writer.close()
+        finally:
+            await http.close()
+
+    asyncio.run(scenario())
+
+
+def test_http_server_answers_400_for_non_object_telemetry():
+    async def scenario():
+        http = ADNHTTPServer(ADNServer(ADNEngine(node_id="http-node", policy_engine=_FixedPolicy())))
+        host, port = await http.start("127.0.0.1", 0)
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            for payload in ([1, 2], "telemetry", {"type": "telemetry_batch", "data": [{"peer_count": 8}, "x"]}):
+                status, headers, body = await _request(reader, writer, "POST", "/telemetry", payload)
+                assert (status, headers["connection"]) == (400, "keep-alive")
+                assert body["error"].startswith("invalid telemetry request")
+            writer.close()
+        finally:
+            await http.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+BUDGET = json.loads((ROOT / "tests" / "fixtures" / "import_budget.json").read_text(encoding="utf-8"))
+
+
+def _import_in_fresh_interpreter(module: str) -> tuple[int, set[str]]:
+    code = f"import sys, {module}; print(','.join(sorted(k for k in sys.modules if k.startswith('adn'))))"
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src"), "PYTHONDONTWRITEBYTECODE": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    cumulative = None
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.removeprefix("import time:").split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative = int(parts[1])
+    assert cumulative is not None, proc.stderr[-2000:]
+    return cumulative, set(filter(None, proc.stdout.strip().split(",")))
+
+
+@pytest.mark.parametrize("module", sorted(BUDGET["entry_points"]))
+def test_entry_point_import_stays_within_budget(module):
+    spec = BUDGET["entry_points"][module]
+    cumulative_us, loaded = _import_in_fresh_interpreter(module)
+
+    assert not loaded & set(spec["forbidden_modules"]), f"{module} eagerly loaded {sorted(loaded & set(spec['forbidden_modules']))}"
+    assert cumulative_us <= spec["max_cumulative_us"], f"{module} import took {cumulative_us}us"
+
+
+def test_lazy_package_attributes_resolve_on_access():
+    import adn_v2
+    import adn_v2.contracts
+    import adn_v3
+
+    assert adn_v3.ADNv3.COMPONENT == "adn"
+    assert "ADNv3" in dir(adn_v3)
+    assert adn_v2.engine.evaluate_defense is not None
+    assert "models" in dir(adn_v2)
+    assert adn_v2.contracts.ReasonCode.ADN_OK.value == "ADN_OK"
+    assert "canonical_sha256" in dir(adn_v2.contracts)
+    missing = "does_not_exist"  # a name, not a literal: keeps ruff B009 quiet too
+    for package in (adn_v2, adn_v3, adn_v2.contracts):
+        with pytest.raises(AttributeError):
+            getattr(package, missing)
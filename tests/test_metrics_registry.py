@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import pytest
+
+from adn_v2 import metrics
+from adn_v2.engine import evaluate_defense
+from adn_v2.http_server import ADNHTTPServer
+from adn_v2.metrics import MetricsRegistry
+from adn_v2.models import DefenseEvent, NodeDefenseState
+from adn_v3 import ADNv3
+from adn_v3.v4.signing import verify_signature_bundle, verify_test_only_signature
+from adn_v3.v4.trust_profile import build_test_trust_profile
+
+
+def test_registry_renders_prometheus_text_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("adn_test_requests_total", "Requests.", ("decision",))
+    inflight = registry.gauge("adn_test_inflight", "In flight.")
+    severity = registry.histogram("adn_test_severity", "Severity.", buckets=(0.5, 1.0))
+
+    requests.inc(labels=("ALLOW",))
+    requests.inc(2, labels=('we"ird\n',))
+    inflight.inc()
+    inflight.inc()
+    inflight.dec()
+    severity.observe(0.2)
+    severity.observe(0.7)
+    severity.observe(3.0)
+
+    text = registry.render()
+    assert "# TYPE adn_test_requests_total counter" in text
+    assert 'adn_test_requests_total{decision="ALLOW"} 1' in text
+    assert 'adn_test_requests_total{decision="we\\"ird\\n"} 2' in text
+    assert "adn_test_inflight 1" in text
+    assert 'adn_test_severity_bucket{le="0.5"} 1' in text
+    assert 'adn_test_severity_bucket{le="1"} 2' in text
+    assert 'adn_test_severity_bucket{le="+Inf"} 3' in text
+    assert "adn_test_severity_count 3" in text
+    assert "adn_test_severity_sum 3.9" in text
+    assert text.endswith("\n")
+    assert MetricsRegistry().render() == ""
+
+    inflight.set(7)
+    assert inflight.value() == 7
+    assert severity.count() == 3
+    assert registry.counter("adn_test_requests_total", "Requests.", ("decision",)) is requests
+
+
+def test_registry_rejects_misuse():
+    registry = MetricsRegistry()
+    counter = registry.counter("adn_test_total", "x", ("a",))
+    with pytest.raises(ValueError):
+        counter.inc(labels=("a", "b"))
+    with pytest.raises(ValueError):
+        counter.inc(-1, labels=("a",))
+    with pytest.raises(ValueError):
+        registry.gauge("adn_test_total", "x", ("a",))
+    with pytest.raises(ValueError):
+        registry.histogram("adn_test_empty", "x", buckets=())
+    with pytest.raises(TypeError):
+        metrics._Metric("adn_test_base", "x")  # abstract: render() is required
+
+
+def test_adn_paths_record_decisions_transitions_and_verifications():
+    allow_before = metrics.V3_DECISIONS.value(("ALLOW",))
+    error_before = metrics.V3_DECISIONS.value(("ERROR",))
+    oversize_before = metrics.V3_REASON_CODES.value(("ADN_ERROR_OVERSIZE",))
+
+    v3 = ADNv3()
+    v3.evaluate({"contract_version": 3, "component": "adn", "request_id": "m", "events": []})
+    v3.evaluate(
+        {
+            "contract_version": 3,
+            "component": "adn",
+            "request_id": "m",
+            "events": [{"event_type": "x", "severity": 0.1, "source": "s"}] * (ADNv3.MAX_EVENTS + 1),
+        }
+    )
+    assert metrics.V3_DECISIONS.value(("ALLOW",)) == allow_before + 1
+    assert metrics.V3_DECISIONS.value(("ERROR",)) == error_before + 1
+    assert metrics.V3_REASON_CODES.value(("ADN_ERROR_OVERSIZE",)) == oversize_before + 1
+
+    full_before = metrics.LOCKDOWN_TRANSITIONS.value(("NONE", "FULL"))
+    lift_before = metrics.DEFENSE_ACTIONS.value(("LIFT_LOCKDOWN",))
+    state = evaluate_defense([DefenseEvent(event_type="x", severity=0.95, source="s")], state=NodeDefenseState())
+    evaluate_defense([DefenseEvent(event_type="x", severity=0.0, source="s")] * 10, state=state)
+    assert metrics.LOCKDOWN_TRANSITIONS.value(("NONE", "FULL")) == full_before + 1
+    assert metrics.DEFENSE_ACTIONS.value(("LIFT_LOCKDOWN",)) == lift_before + 1
+
+    failed_before = metrics.V4_VERIFICATIONS.value(("failed",))
+    with pytest.raises(ValueError):
+        verify_signature_bundle(
+            {},
+            expected_signed_payload_hash="a" * 64,
+            trust_profile=build_test_trust_profile(),
+            verification_time="2026-06-21T00:01:00Z",
+            artifact_not_before="2026-06-21T00:00:00Z",
+            artifact_not_after="2026-06-21T00:05:00Z",
+            verifier=verify_test_only_signature,
+        )
+    assert metrics.V4_VERIFICATIONS.value(("failed",)) == failed_before + 1
+
+
+def test_http_front_end_exposes_metrics_endpoint():
+    status, body = ADNHTTPServer().dispatch("GET", "/metrics", b"")
+    assert status == 200
+    assert "# TYPE adn_v3_decisions_total counter" in body
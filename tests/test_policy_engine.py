@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+
+from adn_v2.engine import ADNEngine
+from adn_v2.models import PolicyDecision, RiskLevel, RiskSignal
+from adn_v2.policy import PolicyEngine, score_bucket
+
+
+def _signal(level, score, reason, source="telemetry"):
+    return RiskSignal(source=source, level=level, score=score, details={"reason": reason})
+
+
+def test_decide_uses_max_level_and_joins_reasons():
+    engine = PolicyEngine()
+
+    decision = engine.decide([_signal(RiskLevel.NORMAL, 0.1, "baseline_telemetry")])
+    assert decision == PolicyDecision(level=RiskLevel.NORMAL, score=0.1, reason="baseline_telemetry", actions=[])
+
+    decision = engine.decide(
+        [_signal(RiskLevel.ELEVATED, 0.6, "low_peer_count"), _signal(RiskLevel.HIGH, 0.8, "mempool_spike")]
+    )
+    assert decision.level is RiskLevel.HIGH
+    assert decision.score == pytest.approx(0.7)
+    assert decision.reason == "low_peer_count | mempool_spike"
+    assert decision.actions == ["enable_logging", "enter_cooldown"]
+
+    empty = engine.decide([])
+    assert (empty.level, empty.score, empty.reason) == (RiskLevel.NORMAL, 0.0, "no_signals")
+
+
+def test_corroboration_and_critical_score_escalate():
+    engine = PolicyEngine()
+
+    corroborated = engine.decide(
+        [_signal(RiskLevel.HIGH, 0.8, "mempool_spike"), _signal(RiskLevel.HIGH, 0.7, "deep_reorg", source="sentinel")]
+    )
+    assert corroborated.level is RiskLevel.CRITICAL
+    assert "lockdown_trigger" in corroborated.actions
+
+    # Two NORMAL sources never escalate.
+    calm = engine.decide([_signal(RiskLevel.NORMAL, 0.1, "a"), _signal(RiskLevel.NORMAL, 0.1, "b", source="dqsn")])
+    assert calm.level is RiskLevel.NORMAL
+
+    assert engine.decide([_signal(RiskLevel.ELEVATED, 0.95, "x")]).level is RiskLevel.CRITICAL
+    assert engine.table[(RiskLevel.ELEVATED, False, 9)][0] is RiskLevel.CRITICAL
+
+
+def test_critical_score_inside_a_bucket_compares_the_exact_mean():
+    engine = PolicyEngine(critical_score=0.95)
+    assert engine.decide([_signal(RiskLevel.ELEVATED, 0.90, "x")]).level is RiskLevel.ELEVATED
+    assert engine.decide([_signal(RiskLevel.HIGH, 0.94, "x")]).level is RiskLevel.HIGH
+    assert engine.decide([_signal(RiskLevel.ELEVATED, 0.95, "x")]).level is RiskLevel.CRITICAL
+    assert engine.table[(RiskLevel.ELEVATED, False, 9)][0] is RiskLevel.ELEVATED
+
+    # Buckets wholly above the threshold are escalated in the table.
+    engine = PolicyEngine(critical_score=0.75)
+    assert engine.decide([_signal(RiskLevel.NORMAL, 0.74, "x")]).level is RiskLevel.NORMAL
+    assert engine.decide([_signal(RiskLevel.NORMAL, 0.75, "x")]).level is RiskLevel.CRITICAL
+    assert engine.table[(RiskLevel.NORMAL, False, 8)][0] is RiskLevel.CRITICAL
+
+
+def test_outcomes_are_memoized_but_decisions_are_fresh():
+    engine = PolicyEngine(memo_size=2)
+    signals = [_signal(RiskLevel.ELEVATED, 0.6, "low_peer_count")]
+
+    first = engine.decide(signals)
+    first.actions.append("mutated")
+    second = engine.decide(iter(signals))
+    assert second.actions == ["enable_logging"]
+    assert (engine.memo_hits, engine.memo_misses) == (1, 1)
+
+    engine.decide([_signal(RiskLevel.HIGH, 0.8, "a")])
+    engine.decide([_signal(RiskLevel.HIGH, 0.8, "b")])
+    assert len(engine._memo) == 1  # reset when full
+
+    unhashable = RiskSignal(source="s", level=RiskLevel.HIGH, score=0.8, details={"reason": ["list"]})
+    assert engine.decide([unhashable]).reason == "['list']"
+
+    engine.clear_cache()
+    assert (engine.memo_hits, engine.memo_misses, len(engine._memo)) == (0, 0, 0)
+
+
+def test_custom_actions_and_validation():
+    engine = PolicyEngine(actions={RiskLevel.ELEVATED: ["page_operator"]})
+    assert engine.decide([_signal(RiskLevel.ELEVATED, 0.5, "x")]).actions == ["page_operator"]
+    with pytest.raises(ValueError):
+        PolicyEngine(corroboration_sources=1)
+    assert [score_bucket(s) for s in (-1.0, 0.0, 0.05, 0.5, 0.99, 1.0, 7.0)] == [0, 0, 0, 5, 9, 9, 9]
+
+
+def test_default_pipeline_runs_end_to_end():
+    engine = ADNEngine(node_id="node-a")
+
+    calm = engine.process_raw_telemetry({"height": 1, "mempool_size": 500, "peer_count": 8})
+    assert calm.level is RiskLevel.NORMAL
+
+    decisions = list(engine.process_stream([{"height": 2, "mempool_size": 30_000, "peer_count": 1}]))
+    assert decisions[0].reason == "low_peer_count | mempool_spike"
+    assert decisions[0].level is RiskLevel.HIGH
+    assert engine.state.last_decision is decisions[0]
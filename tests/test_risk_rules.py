@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from adn_v2.models import RiskLevel, TelemetryPacket
+from adn_v2.rules import RiskRule, compile_rules, default_rules
+from adn_v2.validator import RiskValidator
+
+
+def _packet(**overrides):
+    fields = {"node_id": "n", "height": 1, "mempool_size": 100, "peer_count": 8, "timestamp": 0.0, "extra": {}}
+    fields.update(overrides)
+    return TelemetryPacket(**fields)
+
+
+def _reasons(signals):
+    return [s.details["reason"] for s in signals]
+
+
+def test_default_rules_match_reference_heuristics():
+    validator = RiskValidator()
+
+    assert _reasons(validator.derive_signals(_packet())) == ["baseline_telemetry"]
+    assert _reasons(validator.derive_signals(_packet(peer_count=1))) == ["low_peer_count"]
+    both = validator.derive_signals(_packet(peer_count=0, mempool_size=20001))
+    assert _reasons(both) == ["low_peer_count", "mempool_spike"]
+    assert [(s.level, s.score) for s in both] == [(RiskLevel.ELEVATED, 0.6), (RiskLevel.HIGH, 0.8)]
+
+
+def test_hardened_rules_read_extra_fields_with_baseline_scores():
+    names = [r["name"] for r in default_rules()]
+    assert names == ["low_peer_count", "mempool_spike", "deep_reorg", "low_peer_score"]
+
+    signals = RiskValidator().derive_signals(_packet(extra={"reorg_depth": 3, "peer_score": 0.5}))
+    assert [(s.details["reason"], s.level, s.score) for s in signals] == [
+        ("deep_reorg", RiskLevel.HIGH, 0.70),
+        ("low_peer_score", RiskLevel.ELEVATED, 0.45),
+    ]
+    # Non-numeric extras are ignored rather than raising.
+    assert _reasons(RiskValidator().derive_signals(_packet(extra={"reorg_depth": "9", "peer_score": True}))) == [
+        "baseline_telemetry"
+    ]
+
+
+def test_chained_thresholds_short_circuit_but_keep_every_match():
+    rules = [
+        {"name": "m50k", "field": "mempool_size", "op": ">", "threshold": 50_000, "level": "critical"},
+        {"name": "m20k", "field": "mempool_size", "op": ">=", "threshold": 20_000, "level": "high"},
+        {"name": "m10k", "field": "mempool_size", "op": ">", "threshold": 10_000, "level": "elevated"},
+        {"name": "p1", "field": "peer_count", "op": "<=", "threshold": 1, "level": "high"},
+        {"name": "p4", "field": "peer_count", "op": "<", "threshold": 4, "level": "elevated"},
+        {"name": "h0", "field": "height", "op": "==", "threshold": 0, "level": "elevated", "score": 0.5},
+    ]
+    plan = compile_rules(rules)
+    assert len(plan) == 6
+    mempool_step = plan.steps[0]
+    assert [check[4] for check in mempool_step[2][0]] == ["m10k", "m20k", "m50k"]
+
+    assert _reasons(plan.evaluate(_packet(mempool_size=30_000, peer_count=1, height=0))) == [
+        "m10k", "m20k", "p4", "p1", "h0"
+    ]
+    assert plan.evaluate(_packet(mempool_size=5, peer_count=9)) == []
+
+
+def test_invalid_rules_are_rejected():
+    base = {"name": "r", "field": "peer_count", "op": "<", "threshold": 2, "level": "elevated"}
+    with pytest.raises(ValueError, match="missing key"):
+        RiskRule.from_dict({k: v for k, v in base.items() if k != "op"})
+    with pytest.raises(ValueError, match="unsupported op"):
+        RiskRule.from_dict({**base, "op": "~"})
+    with pytest.raises(ValueError, match="numeric"):
+        RiskRule.from_dict({**base, "threshold": "2"})
+    with pytest.raises(ValueError):
+        RiskRule.from_dict({**base, "level": "severe"})
+
+    rule = RiskRule.from_dict(base, thresholds={"elevated": 0.5})
+    assert rule.score == 0.5
+    assert compile_rules([rule]).rules == (rule,)
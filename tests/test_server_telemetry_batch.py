@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from adn_v2.engine import ADNEngine
+from adn_v2.models import PolicyDecision, RiskLevel
+from adn_v2.server import ADNServer
+
+
+class _LevelFromPeers:
+    def decide(self, signals):
+        level = max((s.level for s in signals), key=list(RiskLevel).index)
+        return PolicyDecision(level=level, score=max(s.score for s in signals), reason="stub", actions=[])
+
+
+def _server() -> ADNServer:
+    return ADNServer(ADNEngine(node_id="batch-node", policy_engine=_LevelFromPeers()))
+
+
+def test_telemetry_batch_returns_decisions_in_input_order():
+    body = json.dumps(
+        {
+            "type": "telemetry_batch",
+            "data": [{"peer_count": 8}, {"peer_count": 1}, {"peer_count": 8, "mempool_size": 50_000}],
+        }
+    )
+    response = json.loads(_server().handle_raw_request(body))
+
+    assert response["node_id"] == "batch-node"
+    assert response["count"] == 3
+    assert [d["level"] for d in response["decisions"]] == ["normal", "elevated", "high"]
+
+
+def test_telemetry_batch_matches_single_requests():
+    single = _server()
+    expected = [single.handle_telemetry({"peer_count": p}) for p in (0, 5)]
+    batch = _server().handle_telemetry_batch([{"peer_count": p} for p in (0, 5)])
+
+    assert [{k: v for k, v in e.items() if k != "node_id"} for e in expected] == batch["decisions"]
+
+
+def test_telemetry_batch_rejects_bad_data():
+    server = _server()
+    with pytest.raises(ValueError):
+        server.handle_telemetry_batch({"peer_count": 1})  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        server.handle_telemetry_batch([{}] * (ADNServer.MAX_BATCH_ITEMS + 1))
+    with pytest.raises(ValueError, match="items must be objects"):
+        server.handle_telemetry_batch([{"peer_count": 8}, 1])
+    assert server.engine.state.last_decision is None
+
+
+def test_raw_request_body_must_be_an_object():
+    server = _server()
+    for body in ("[1]", '"telemetry"', "null"):
+        with pytest.raises(ValueError, match="JSON object"):
+            server.handle_raw_request(body)
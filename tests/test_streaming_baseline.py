@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from adn_v2.baseline import BaselineTracker, EWMAStat, P2Quantile
+from adn_v2.models import RiskLevel, TelemetryPacket
+from adn_v2.validator import RiskValidator
+
+
+def _packet(node_id="n", mempool_size=1000, peer_count=8, **extra):
+    return TelemetryPacket(
+        node_id=node_id, height=1, mempool_size=mempool_size, peer_count=peer_count, timestamp=0.0, extra=extra
+    )
+
+
+def test_ewma_tracks_mean_and_variance():
+    stat = EWMAStat(alpha=0.1)
+    for value in [10.0] * 200:
+        stat.update(value)
+    assert stat.mean == pytest.approx(10.0)
+    assert stat.std == pytest.approx(0.0)
+    for value in [9.0, 11.0] * 500:
+        stat.update(value)
+    assert stat.mean == pytest.approx(10.0, abs=0.1)
+    assert stat.std == pytest.approx(1.0, abs=0.1)
+    with pytest.raises(ValueError):
+        EWMAStat(alpha=0.0)
+
+
+def test_p2_quantile_approximates_exact_quantiles():
+    rng = random.Random(7)
+    values = [rng.gauss(100.0, 15.0) for _ in range(20_000)]
+    ordered = sorted(values)
+    for q in (0.01, 0.5, 0.99):
+        sketch = P2Quantile(q)
+        for value in values:
+            sketch.add(value)
+        assert sketch.value() == pytest.approx(ordered[int(q * len(ordered))], abs=1.5)
+
+    small = P2Quantile(0.5)
+    assert small.value() is None
+    for value in (5.0, 1.0, 3.0):
+        small.add(value)
+    assert small.value() == 3.0
+    with pytest.raises(ValueError):
+        P2Quantile(1.0)
+
+
+def test_tracker_learns_each_node_separately():
+    rng = random.Random(3)
+    tracker = BaselineTracker(warmup=50)
+    for _ in range(500):
+        tracker.observe(_packet("big", mempool_size=rng.randint(40_000, 42_000)))
+        tracker.observe(_packet("small", mempool_size=rng.randint(900, 1_100)))
+
+    # 41k is normal for "big" but far outside "small"'s baseline.
+    assert [s.details["metric"] for s in tracker.observe(_packet("big", mempool_size=41_000))] == []
+    signals = tracker.observe(_packet("small", mempool_size=41_000))
+    assert [(s.source, s.level, s.details["reason"], s.details["metric"]) for s in signals] == [
+        ("baseline", RiskLevel.HIGH, "baseline_zscore", "mempool_size")
+    ]
+    assert tracker.baseline("small", "mempool_size").count == 501
+    assert tracker.baseline("missing", "mempool_size") is None
+
+
+def test_tracker_quantile_breach_warmup_and_extra_fields():
+    tracker = BaselineTracker(warmup=20, z_threshold=50.0, z_high=60.0, max_metrics=3)
+    for i in range(200):
+        signals = tracker.observe(_packet(mempool_size=1000 + (i % 10), rpc_rps=10 + i % 3, flag=True, label="x", ignored=1))
+        if i < 20:
+            assert signals == []
+
+    # Outside every value seen so far, but well under the (huge) z threshold.
+    signals = tracker.observe(_packet(mempool_size=1005, rpc_rps=14))
+    assert [(s.level, s.details["reason"], s.details["metric"]) for s in signals] == [
+        (RiskLevel.ELEVATED, "baseline_quantile", "rpc_rps")
+    ]
+    # max_metrics caps tracked metrics per node (mempool, peers, rpc_rps).
+    assert set(tracker.nodes["n"]) == {"mempool_size", "peer_count", "rpc_rps"}
+
+
+def test_tracker_stays_quiet_on_steady_discrete_metrics():
+    rng = random.Random(5)
+    tracker = BaselineTracker()
+    signals = []
+    for i in range(4000):
+        packet = _packet(mempool_size=1000 + i % 5, peer_count=rng.choice((7, 8, 8, 8, 9)), rps=i % 2)
+        signals.extend(tracker.observe(packet))
+    assert signals == []
+    # A real excursion still breaches the band.
+    assert [s.details["metric"] for s in tracker.observe(_packet(peer_count=12))] == ["peer_count"]
+
+
+def test_tracker_skips_non_finite_values():
+    tracker = BaselineTracker(warmup=5)
+    for _ in range(20):
+        tracker.observe(_packet(rpc_rps=10.0))
+    for value in (float("nan"), float("inf"), float("-inf")):
+        assert tracker.observe(_packet(mempool_size=value, rpc_rps=value)) == []
+    for metric in ("mempool_size", "rpc_rps"):
+        baseline = tracker.baseline("n", metric)
+        assert baseline.count == 20
+        assert math.isfinite(baseline.ewma.mean) and math.isfinite(baseline.ewma.std)
+    assert tracker.observe(_packet(rpc_rps=10.0)) == []
+
+
+def test_tracker_rejects_bad_configuration():
+    with pytest.raises(ValueError):
+        BaselineTracker(quantiles=(0.9, 0.1))
+    with pytest.raises(ValueError):
+        BaselineTracker(z_threshold=5.0, z_high=1.0)
+    with pytest.raises(ValueError):
+        BaselineTracker(alpha=2.0)
+
+
+def test_validator_appends_baseline_signals():
+    validator = RiskValidator(baseline=BaselineTracker(warmup=10))
+    for _ in range(50):
+        assert [s.details["reason"] for s in validator.derive_signals(_packet())] == ["baseline_telemetry"]
+    reasons = [s.details["reason"] for s in validator.derive_signals(_packet(mempool_size=25_000))]
+    assert reasons == ["mempool_spike", "baseline_zscore"]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from adn_v2.telemetry import (
+    JSONLStats,
+    JSONLTelemetryReader,
+    TelemetryAdapter,
+    jsonl_chunk_offsets,
+    read_jsonl_parallel,
+)
+
+
+class _TaggingAdapter(TelemetryAdapter):
+    def parse(self, raw, node_id="unknown"):
+        packet = super().parse(raw, node_id=node_id)
+        packet.extra["adapter"] = "tagging"
+        return packet
+
+
+def _write_archive(path, count=50):
+    lines = []
+    for i in range(count):
+        lines.append(json.dumps({"height": i, "mempool_size": i * 10, "peer_count": 8, "timestamp": 1000 + i, "tag": "é"}))
+        if i % 10 == 3:
+            lines.append("{not json")
+        if i % 10 == 7:
+            lines.append("")
+        if i % 25 == 5:
+            lines.append("[1, 2]")
+    path.write_bytes(("\n".join(lines) + "\n").encode("utf-8") + b"\xff\xfe\n")
+    return count
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_reader_streams_packets_and_counts_malformed(tmp_path, use_mmap):
+    archive = tmp_path / "telemetry.jsonl"
+    count = _write_archive(archive)
+
+    reader = JSONLTelemetryReader(archive, node_id="replay", use_mmap=use_mmap)
+    packets = list(reader)
+
+    assert [p.height for p in packets] == list(range(count))
+    assert packets[3].node_id == "replay"
+    assert packets[3].extra == {"tag": "é"}
+    assert reader.stats == JSONLStats(lines=count + 5 + 5 + 2 + 1, packets=count, blank=5, malformed=5 + 2 + 1)
+
+
+def test_byte_ranges_partition_lines_exactly(tmp_path):
+    archive = tmp_path / "telemetry.jsonl"
+    count = _write_archive(archive)
+
+    for chunks in (1, 2, 3, 7, 64, 10_000):
+        heights = []
+        for start, end in jsonl_chunk_offsets(archive, chunks):
+            heights += [p.height for p in JSONLTelemetryReader(archive, start=start, end=end)]
+        assert heights == list(range(count)), chunks
+
+
+def test_parallel_reader_preserves_order_and_merges_stats(tmp_path):
+    archive = tmp_path / "telemetry.jsonl"
+    count = _write_archive(archive, count=200)
+    stats = JSONLStats()
+
+    packets = list(read_jsonl_parallel(archive, node_id="p", workers=2, chunk_bytes=1024, stats=stats))
+
+    assert [p.height for p in packets] == list(range(count))
+    assert stats.packets == count
+    assert stats.malformed > 0
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_parallel_reader_uses_the_callers_adapter_and_mmap_setting(tmp_path, use_mmap):
+    archive = tmp_path / "telemetry.jsonl"
+    count = _write_archive(archive, count=60)
+
+    packets = list(
+        read_jsonl_parallel(archive, adapter=_TaggingAdapter(), use_mmap=use_mmap, workers=2, chunk_bytes=512)
+    )
+    assert [p.height for p in packets] == list(range(count))
+    assert {p.extra["adapter"] for p in packets} == {"tagging"}
+
+
+def test_reader_edge_cases(tmp_path):
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+    assert list(JSONLTelemetryReader(empty)) == []
+    assert list(read_jsonl_parallel(empty, workers=1)) == []
+    assert jsonl_chunk_offsets(empty, 4) == []
+
+    with pytest.raises(ValueError):
+        JSONLTelemetryReader(empty, start=5, end=1)
+    with pytest.raises(ValueError):
+        jsonl_chunk_offsets(empty, 0)
+    with pytest.raises(ValueError):
+        list(read_jsonl_parallel(empty, chunk_bytes=0))
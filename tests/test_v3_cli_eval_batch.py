@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from adn_v3 import ADNv3
+from adn_v3.cli import eval_batch, evaluate_lines, main
+
+
+def _request(i, severity=0.2):
+    return {
+        "contract_version": 3,
+        "component": "adn",
+        "request_id": f"req-{i}",
+        "events": [{"event_type": "rpc_abuse", "severity": severity, "source": "local"}],
+    }
+
+
+def _lines(count):
+    out = [json.dumps(_request(i, severity=(i % 10) / 10)) for i in range(count)]
+    out.insert(3, "")
+    out.insert(5, "{broken")
+    return "\n".join(out) + "\n"
+
+
+def test_eval_batch_preserves_order_and_matches_single_evaluate():
+    sink = io.StringIO()
+    summary = eval_batch(io.StringIO(_lines(20)), sink, chunk_size=3)
+
+    responses = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert summary["requests"] == len(responses) == 21
+    assert responses[4]["decision"] == "ERROR"
+    assert responses[4]["request_id"] == "unknown"
+    good = [r for r in responses if r["request_id"] != "unknown"]
+    assert [r["request_id"] for r in good] == [f"req-{i}" for i in range(20)]
+    assert good[7] == ADNv3().evaluate(_request(7, severity=0.7))
+    assert summary["decisions"]["ERROR"] == 1
+    assert summary["latency_us"]["p50"] <= summary["latency_us"]["max"]
+
+
+def test_parallel_workers_keep_input_order():
+    serial = [line for line, _, _ in evaluate_lines(io.StringIO(_lines(40)), chunk_size=4)]
+    parallel = [line for line, _, _ in evaluate_lines(io.StringIO(_lines(40)), workers=2, chunk_size=4)]
+    assert parallel == serial
+
+
+def test_main_reads_file_and_writes_output(tmp_path, capsys, monkeypatch):
+    src = tmp_path / "requests.jsonl"
+    dst = tmp_path / "responses.jsonl"
+    src.write_text(_lines(5), encoding="utf-8")
+
+    assert main(["eval-batch", str(src), "-o", str(dst), "-j", "1"]) == 0
+    assert len(dst.read_text(encoding="utf-8").splitlines()) == 6
+    assert json.loads(capsys.readouterr().err)["requests"] == 6
+
+    monkeypatch.setattr("sys.stdin", io.StringIO(""))
+    assert main(["eval-batch"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert json.loads(captured.err)["latency_us"]["p99"] == 0.0
+
+    with pytest.raises(ValueError):
+        list(evaluate_lines([], workers=0))
+
+
+@pytest.mark.parametrize("args", [["--workers", "0"], ["-j", "-2"], ["--chunk-size", "0"], ["--workers", "many"]])
+def test_main_rejects_non_positive_options_cleanly(tmp_path, capsys, args):
+    dst = tmp_path / "responses.jsonl"
+    with pytest.raises(SystemExit) as exc:
+        main(["eval-batch", "-o", str(dst), *args])
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "usage: adn-v3" in err and "Traceback" not in err
+    assert not dst.exists()
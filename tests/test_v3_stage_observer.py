@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+
+from adn_v3 import ADNv3
+from adn_v3.observability import STAGES, LatencyHistogram, StageTimer
+
+REQUEST = {
+    "contract_version": 3,
+    "component": "adn",
+    "request_id": "observed",
+    "events": [{"event_type": "rpc_abuse", "severity": 0.9, "source": "local"}],
+}
+
+
+def test_observer_receives_every_stage_and_response_stays_deterministic():
+    seen: list[tuple[str, int]] = []
+    observed = ADNv3(observer=lambda stage, ns: seen.append((stage, ns)))
+
+    assert observed.evaluate(REQUEST) == ADNv3().evaluate(REQUEST)
+    assert observed.evaluate(REQUEST)["meta"]["latency_ms"] == 0
+    assert [stage for stage, _ in seen[:5]] == ["parse_request", "parse_events", "engine", "context_hash", "total"]
+    assert all(isinstance(ns, int) and ns >= 0 for _, ns in seen)
+    assert set(stage for stage, _ in seen) <= set(STAGES)
+    assert ADNv3(observer=seen.append) == ADNv3()
+
+
+@pytest.mark.parametrize(
+    "request_body, expected_stages",
+    [
+        ("not-a-dict", ["error"]),
+        ({**REQUEST, "contract_version": 2}, ["error"]),
+        ({**REQUEST, "events": [{"event_type": "x", "severity": 5, "source": "s"}]}, ["parse_request", "error"]),
+    ],
+)
+def test_error_paths_report_error_stage(request_body, expected_stages):
+    seen: list[str] = []
+    response = ADNv3(observer=lambda stage, ns: seen.append(stage)).evaluate(request_body)
+
+    assert response["decision"] == "ERROR"
+    assert seen == expected_stages
+
+
+def test_failing_observer_cannot_change_outcome():
+    def broken(stage: str, ns: int) -> None:
+        raise RuntimeError("observer down")
+
+    assert ADNv3(observer=broken).evaluate(REQUEST) == ADNv3().evaluate(REQUEST)
+
+
+def test_latency_histogram_collects_percentiles_per_stage():
+    hist = LatencyHistogram()
+    for ns in (100, 200, 300, 5_000, 1_000_000):
+        hist("engine", ns)
+    hist("total", 0)
+
+    assert hist.count("engine") == 5
+    assert hist.count("missing") == 0
+    assert hist.percentile("missing", 50) == 0
+    assert hist.percentile("engine", 50) == 512
+    assert hist.percentile("engine", 100) == 1_000_000
+    assert hist.percentile("total", 99) == 0
+    snap = hist.snapshot()
+    assert snap["engine"]["max_ns"] == 1_000_000
+    assert snap["engine"]["mean_ns"] == (100 + 200 + 300 + 5_000 + 1_000_000) // 5
+    with pytest.raises(ValueError):
+        hist.percentile("engine", 101)
+
+    engine = ADNv3(observer=hist)
+    engine.evaluate(REQUEST)
+    assert hist.count("total") == 2
+
+    hist.reset()
+    assert hist.snapshot() == {}
+
+
+def test_stage_timer_marks_are_relative_and_finish_is_absolute():
+    seen: dict[str, int] = {}
+    timer = StageTimer(lambda stage, ns: seen.__setitem__(stage, ns))
+    timer.mark("a")
+    timer.mark("b")
+    timer.finish("total")
+    assert seen["total"] >= seen["a"] + seen["b"] - 1
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from adn_v3.v4.binary_envelope import BINARY_ENVELOPE_MAGIC, decode_binary_envelope, encode_binary_envelope
+from adn_v3.v4.crypto_verdict import validate_crypto_verdict_envelope
+from adn_v3.v4.merkle_batch import sign_verdict_batch
+from adn_v3.v4.real_crypto_backend import encode_binary_signature_material
+from adn_v3.v4.signing import build_test_signature_entry, verify_test_only_signature
+from adn_v3.v4.trust_profile import CLASSICAL_ED25519, ML_DSA, build_test_trust_profile
+
+from tests.test_v4_crypto_verdict_contract import HASH_A, VERIFY_AT, signed_verdict, unsigned_payload
+
+M = BINARY_ENVELOPE_MAGIC
+
+
+def _real_size_verdict() -> dict:
+    verdict = signed_verdict()
+    rng = random.Random(7)
+    for entry, size in zip(verdict["signature_bundle"]["signatures"], (64, 3309), strict=True):
+        entry["signature"] = encode_binary_signature_material(rng.randbytes(size))
+    return verdict
+
+
+def _json_text(value: dict) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def test_signed_envelope_round_trips_and_still_verifies() -> None:
+    verdict = signed_verdict()
+    data = encode_binary_envelope(verdict)
+    decoded = decode_binary_envelope(data)
+
+    assert decoded == verdict
+    assert _json_text(decoded) == _json_text(verdict)
+    assert encode_binary_envelope(decoded) == data
+    assert encode_binary_envelope(dict(reversed(list(verdict.items())))) == data
+    validate_crypto_verdict_envelope(
+        decoded,
+        expected_context_hash=HASH_A,
+        trust_profile=build_test_trust_profile(),
+        verification_time=VERIFY_AT,
+        verifier=verify_test_only_signature,
+    )
+
+
+def test_batched_and_real_size_envelopes_round_trip_smaller() -> None:
+    batched = sign_verdict_batch(
+        [unsigned_payload(), {**unsigned_payload(), "request_id": "other"}],
+        sign_root=lambda digest: [build_test_signature_entry(algorithm=a, signed_hash=digest) for a in (CLASSICAL_ED25519, ML_DSA)],
+    )[1]
+    assert decode_binary_envelope(encode_binary_envelope(batched)) == batched
+
+    verdict = _real_size_verdict()
+    data = encode_binary_envelope(verdict)
+    assert decode_binary_envelope(data) == verdict
+    assert len(data) < 0.8 * len(_json_text(verdict).encode("utf-8"))
+
+
+def test_only_canonical_hex_and_b64u_strings_become_bytes() -> None:
+    assert encode_binary_envelope({"h": "00ff"}) == M + b"\xa1\x61h\xd7\x42\x00\xff"
+    assert encode_binary_envelope({"s": "b64u:AP8"}) == M + b"\xa1\x61s\xd5\x42\x00\xff"
+    assert encode_binary_envelope({"00ff": 1}) == M + b"\xa1\x6400ff\x01"
+    for text in ("0", "00F", "00FF", "00 ff", "b64u:", "b64u:A", "b64u:AP9", "b64u:AP8=", "b64u:AP+", "é", "n"):
+        data = encode_binary_envelope({"t": text})
+        assert data[len(M) + 3] >> 5 == 3
+        assert decode_binary_envelope(data) == {"t": text}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0, 23, 24, 255, 256, 65535, 65536, 2**32 - 1, 2**32, 2**64 - 1, -1, -24, -25, -(2**64), True, False],
+)
+def test_integers_and_booleans_round_trip(value) -> None:
+    data = encode_binary_envelope({"v": value, "l": [value, (value,)], "n": {"x" * 30: value}})
+    assert decode_binary_envelope(data) == {"v": value, "l": [value, [value]], "n": {"x" * 30: value}}
+
+
+@pytest.mark.parametrize(
+    ("envelope", "message"),
+    [
+        ([], "envelope must be dict"),
+        ({"f": 1.5}, "cannot encode float"),
+        ({"n": None}, "cannot encode NoneType"),
+        ({"i": 2**64}, "64 bits"),
+        ({"i": -(2**64) - 1}, "64 bits"),
+        ({1: "x"}, "keys must be strings"),
+        ({"d": [[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[[]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]]}, "nesting too deep"),
+    ],
+)
+def test_encoder_rejects_what_canonical_json_rejects(envelope, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        encode_binary_envelope(envelope)
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        ("not bytes", "must be bytes"),
+        (b"\xa0", "magic mismatch"),
+        (M + b"\x80", "root must be map"),
+        (M + b"\xa0\x00", "trailing bytes"),
+        (M + b"\xa1\x61a\x18\x05", "shortest form"),
+        (M + b"\xa1\x61a\x19\x00\xff", "shortest form"),
+        (M + b"\xa1\x61a\x1c", "indefinite or reserved"),
+        (M + b"\xbf\x61a\x01\xff", "indefinite or reserved"),
+        (M + b"\xa1\x78\x01a\x01", "shortest form"),
+        (M + b"\xa1\x7f\x61a\xff\x01", "indefinite or reserved"),
+        (M + b"\xa2\x61b\x01\x61a\x01", "unique, sorted"),
+        (M + b"\xa2\x61a\x01\x61a\x02", "unique, sorted"),
+        (M + b"\xa1\x01\x01", "keys must be strings"),
+        (M + b"\xa1\x61a\x42\x00\xff", "byte strings must be tagged"),
+        (M + b"\xa1\x61a\x6400ff", "must use its byte tag"),
+        (M + b"\xa1\x61a\x68b64u:AP8", "must use its byte tag"),
+        (M + b"\xa1\x61a\xd7\x40", "non-empty bytes"),
+        (M + b"\xa1\x61a\xd7\x61a", "unsupported item"),
+        (M + b"\xa1\x61a\xd8\x18\x41\x00", "unsupported item"),
+        (M + b"\xa1\x61a\xd7", "unsupported item"),
+        (M + b"\xa1\x61a\xf6", "unsupported item"),
+        (M + b"\xa1\x61a\xfa\x00\x00\x00\x00", "unsupported item"),
+        (M + b"\xa1\x61a\x61\xff", "UTF-8"),
+        (M + b"\xa1\x61\xff\x01", "UTF-8"),
+        (M + b"\xa1\x61a\x9a\xff\xff\xff\xff", "truncated"),
+        (M + b"\xa1\x61a\x65abc", "truncated"),
+        (M + b"\xa1\x61a\xd7\x45\x00", "truncated"),
+        (M + b"\xa1\x78\x20ab", "truncated"),
+        (M + b"\xa1\x65ab", "complete"),
+        (M + b"\xa1\x61a\x1a\x00\x01", "truncated"),
+        (M + b"\xa1\x61a" + b"\x81" * 40, "nesting too deep"),
+    ],
+)
+def test_decoder_accepts_only_the_canonical_encoding(data, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        decode_binary_envelope(data)
+
+
+def test_damaged_data_fails_closed_or_decodes_canonically() -> None:
+    data = encode_binary_envelope(_real_size_verdict())
+    for end in range(len(data)):
+        with pytest.raises(ValueError):
+            decode_binary_envelope(data[:end])
+
+    rng = random.Random(11)
+    for _ in range(2000):
+        damaged = bytearray(data)
+        damaged[rng.randrange(len(M), len(damaged))] = rng.randrange(256)
+        try:
+            decoded = decode_binary_envelope(bytes(damaged))
+        except ValueError:
+            continue
+        # anything accepted is itself in canonical form
+        assert encode_binary_envelope(decoded) == bytes(damaged)
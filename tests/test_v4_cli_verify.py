@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from adn_v3.v4.cli import iter_records, main, resolve_verifier, verify_records
+from adn_v3.v4.signing import verify_test_only_signature
+from adn_v3.v4.trust_profile import (
+    CLASSICAL_ED25519,
+    COMPONENT_ROLE,
+    REVOKED,
+    CompiledTrustProfile,
+    build_test_trust_profile,
+    compile_trust_profile,
+    find_trusted_key,
+)
+
+from tests.test_v4_crypto_verdict_contract import HASH_B, NOT_AFTER, NOT_BEFORE, VERIFY_AT, signed_verdict
+
+KEY_ID = f"test-{COMPONENT_ROLE}-{CLASSICAL_ED25519}-v1"
+WINDOW = {"verification_time": VERIFY_AT, "artifact_not_before": NOT_BEFORE, "artifact_not_after": NOT_AFTER}
+
+
+class _RejectingBackend:
+    supported_algorithms = ()
+
+    def verify_signature(self, **kwargs):  # pragma: no cover - never reached
+        return True
+
+
+REJECTING_BACKEND = _RejectingBackend()
+NOT_A_VERIFIER = 42
+
+
+def _exploding_verifier(entry, key):
+    raise RuntimeError("hsm offline")
+
+
+def _lookup(profile, **overrides):
+    args = {"key_id": KEY_ID, "key_version": 1, "algorithm": CLASSICAL_ED25519, **WINDOW, **overrides}
+    return find_trusted_key(profile, **args)
+
+
+def test_compiled_trust_profile_matches_dict_lookups():
+    profile = build_test_trust_profile()
+    compiled = compile_trust_profile(profile)
+    assert compile_trust_profile(compiled) is compiled
+    assert _lookup(compiled) == _lookup(profile)
+
+    for overrides, match in (
+        ({"key_id": "missing"}, "trusted ADN key not found"),
+        ({"verification_time": "2031-01-01T00:00:00Z"}, "verification time"),
+        ({"artifact_not_before": "2025-01-01T00:00:00Z"}, "outside key validity"),
+    ):
+        for candidate in (profile, compiled):
+            with pytest.raises(ValueError, match=match):
+                _lookup(candidate, **overrides)
+
+    profile["entries"][0]["status"] = REVOKED
+    with pytest.raises(ValueError, match="revoked"):
+        _lookup(CompiledTrustProfile(profile))
+
+
+def _lines():
+    good = signed_verdict()
+    tampered = signed_verdict()
+    tampered["signature_bundle"]["signatures"][0]["signature"] = "0" * 64
+    return [
+        json.dumps(good),
+        json.dumps({"verdict": good, "expected_context_hash": good["context_hash"], "verification_time": VERIFY_AT}),
+        json.dumps(tampered),
+        json.dumps({"verdict": good, "expected_context_hash": HASH_B, "verification_time": VERIFY_AT}),
+        json.dumps({"verdict": [1]}),
+        "{broken",
+    ]
+
+
+def _errors(outcomes):
+    return [error for _, _, error in outcomes]
+
+
+def test_verify_records_reports_each_failure_in_order():
+    records = [(f"r{i}", line) for i, line in enumerate(_lines())]
+    outcomes = list(verify_records(records, trust_profile=build_test_trust_profile(), chunk_size=2))
+
+    assert [label for label, _, _ in outcomes] == [f"r{i}" for i in range(6)]
+    errors = _errors(outcomes)
+    assert errors[:2] == [None, None]
+    assert errors[2] == "signature verification failed"
+    assert errors[3] == "context_hash mismatch"
+    assert errors[4] == "ADN v4 verdict must be dict"
+    assert errors[5]
+    assert outcomes[2][1] == signed_verdict()["request_id"]
+
+    late = list(verify_records(records[:1], trust_profile=build_test_trust_profile(), at="2031-01-01T00:00:00Z"))
+    assert _errors(late) == ["key is not valid at verification time"]
+
+    parallel = list(verify_records(records, trust_profile=build_test_trust_profile(), workers=2, chunk_size=1))
+    assert parallel == outcomes
+
+    with pytest.raises(ValueError):
+        list(verify_records([], trust_profile=build_test_trust_profile(), workers=0))
+
+
+def test_backends_are_pluggable():
+    assert resolve_verifier("test") is verify_test_only_signature
+    assert resolve_verifier("adn_v3.v4.signing:verify_test_only_signature") is verify_test_only_signature
+    record = [("r", json.dumps(signed_verdict()))]
+    profile = build_test_trust_profile()
+
+    rejected = _errors(verify_records(record, trust_profile=profile, backend="tests.test_v4_cli_verify:REJECTING_BACKEND"))
+    assert rejected == ["key_id must not contain test-only material"]
+    exploded = _errors(verify_records(record, trust_profile=profile, backend="tests.test_v4_cli_verify:_exploding_verifier"))
+    assert exploded == ["RuntimeError: hsm offline"]
+    # Test-only key material is never accepted by the production OQS path.
+    assert _errors(verify_records(record, trust_profile=profile, backend="oqs")) != [None]
+
+    with pytest.raises(ValueError, match="module:attr"):
+        resolve_verifier("nope")
+    with pytest.raises(ValueError, match="verifier callable"):
+        resolve_verifier("tests.test_v4_cli_verify:NOT_A_VERIFIER")
+    with pytest.raises(ValueError, match="private keys"):
+        from adn_v3.v4.cli import _no_private_keys
+
+        _no_private_keys("ref")
+
+
+def test_main_walks_files_directories_and_stdin(tmp_path, capsys, monkeypatch):
+    profile_path = tmp_path / "profile.json"
+    profile_path.write_text(json.dumps(build_test_trust_profile()), encoding="utf-8")
+    archive = tmp_path / "archive"
+    (archive / "day1").mkdir(parents=True)
+    (archive / "day1" / "a.json").write_text(json.dumps(signed_verdict()), encoding="utf-8")
+    (archive / "day1" / "notes.txt").write_text("ignored", encoding="utf-8")
+    lines = _lines()
+    (archive / "b.jsonl").write_text("\n".join(lines[:2]) + "\n\n", encoding="utf-8")
+
+    assert main(["verify", "--trust-profile", str(profile_path), str(archive)]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert json.loads(captured.err)["verified"] == 3
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines) + "\n"))
+    assert main(["verify", "--trust-profile", str(profile_path), "-"]) == 1
+    captured = capsys.readouterr()
+    failures = [json.loads(line) for line in captured.out.splitlines()]
+    assert [f["source"] for f in failures] == ["<stdin>:3", "<stdin>:4", "<stdin>:5", "<stdin>:6"]
+    summary = json.loads(captured.err)
+    assert (summary["total"], summary["failed"], summary["reasons"]["context_hash mismatch"]) == (6, 4, 1)
+
+    assert [label for label, _ in iter_records([str(archive / "b.jsonl")])] == [f"{archive / 'b.jsonl'}:1", f"{archive / 'b.jsonl'}:2"]
+
+    assert main(["verify", "--trust-profile", str(tmp_path / "missing.json"), "-"]) == 2
+    assert main(["verify", "--trust-profile", str(profile_path), "--backend", "nope", "-"]) == 2
+    assert "adn-v4 verify" in capsys.readouterr().err
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+
+import pytest
+
+from adn_v3.v4.crypto_verdict import validate_crypto_verdict_envelope
+from adn_v3.v4.merkle_batch import (
+    MAX_BATCH_LEAVES,
+    VerifiedRootCache,
+    merkle_batch_root_hash,
+    merkle_leaf,
+    merkle_root_from_proof,
+    merkle_tree_proofs,
+    sign_verdict_batch,
+    validate_batched_crypto_verdict_envelope,
+)
+from adn_v3.v4.signing import build_test_signature_entry, signed_payload_hash, verify_test_only_signature
+from adn_v3.v4.trust_profile import CLASSICAL_ED25519, ML_DSA, build_test_trust_profile, compile_trust_profile
+
+from tests.test_v4_crypto_verdict_contract import HASH_A, VERIFY_AT, unsigned_payload
+
+
+def _payloads(count: int) -> list[dict]:
+    payloads = []
+    for index in range(count):
+        payload = unsigned_payload()
+        payload["request_id"] = f"req-batch-{index}"
+        payload["freshness_nonce"] = f"nonce-batch-{index}"
+        payloads.append(payload)
+    return payloads
+
+
+def _test_root_signer(calls: list[str]):
+    def sign_root(digest: str) -> list[dict]:
+        calls.append(digest)
+        return [build_test_signature_entry(algorithm=algorithm, signed_hash=digest) for algorithm in (CLASSICAL_ED25519, ML_DSA)]
+
+    return sign_root
+
+
+def _validate(verdict: dict, **kwargs) -> dict:
+    return validate_batched_crypto_verdict_envelope(
+        verdict,
+        expected_context_hash=HASH_A,
+        trust_profile=kwargs.pop("trust_profile", build_test_trust_profile()),
+        verification_time=VERIFY_AT,
+        verifier=kwargs.pop("verifier", verify_test_only_signature),
+        **kwargs,
+    )
+
+
+def _hashes(count: int) -> list[str]:
+    return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(count)]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13])
+def test_every_proof_recomputes_the_root(count: int) -> None:
+    hashes = _hashes(count)
+    root, paths = merkle_tree_proofs(hashes)
+    for index, (digest, path) in enumerate(zip(hashes, paths, strict=True)):
+        assert len(path) <= max(1, (count - 1).bit_length())
+        assert merkle_root_from_proof(payload_hash=digest, leaf_index=index, leaf_count=count, path=path) == root
+
+
+def test_tree_uses_domain_separated_leaves_and_carries_unpaired_nodes() -> None:
+    hashes = _hashes(3)
+    leaves = [merkle_leaf(digest) for digest in hashes]
+    node = lambda left, right: hashlib.sha256(b"\x01" + left + right).digest()  # noqa: E731
+
+    root, paths = merkle_tree_proofs(hashes)
+
+    assert leaves[0] == hashlib.sha256(b"\x00" + bytes.fromhex(hashes[0])).digest()
+    assert root == node(node(leaves[0], leaves[1]), leaves[2]).hex()
+    assert paths[2] == [node(leaves[0], leaves[1]).hex()]
+    assert merkle_tree_proofs(hashes[:1]) == (leaves[0].hex(), [[]])
+
+
+def test_batch_signs_the_root_once_and_every_verdict_validates() -> None:
+    calls: list[str] = []
+    verdicts = sign_verdict_batch(_payloads(5), sign_root=_test_root_signer(calls))
+
+    assert len(calls) == 1
+    proof = verdicts[3]["merkle_proof"]
+    assert calls[0] == merkle_batch_root_hash(root=proof["root"], leaf_count=5)
+    assert proof["leaf_index"] == 3 and proof["schema_version"] == "shield.merkle_proof.v1"
+    assert verdicts[3]["signed_payload_hash"] == signed_payload_hash(payload=_payloads(5)[3])
+    for verdict in verdicts:
+        checked = _validate(verdict, trust_profile=compile_trust_profile(build_test_trust_profile()))
+        assert checked["verification_summary"]["verified_algorithms"] == [CLASSICAL_ED25519, ML_DSA]
+
+
+def test_root_cache_runs_each_root_signature_once_per_key() -> None:
+    verified: list[str] = []
+
+    def counting_verifier(entry: dict, key: dict) -> bool:
+        verified.append(entry["algorithm"])
+        return verify_test_only_signature(entry, key)
+
+    cache = VerifiedRootCache()
+    for verdict in sign_verdict_batch(_payloads(8), sign_root=_test_root_signer([])):
+        _validate(verdict, verifier=counting_verifier, root_cache=cache)
+
+    assert verified == [CLASSICAL_ED25519, ML_DSA]
+    assert (cache.hits, cache.misses, len(cache)) == (14, 2, 2)
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_root_cache_never_stores_failures_and_resets_when_full() -> None:
+    cache = VerifiedRootCache(max_entries=1)
+    verdict = sign_verdict_batch(_payloads(2), sign_root=_test_root_signer([]))[0]
+
+    with pytest.raises(ValueError, match="signature verification failed"):
+        _validate(verdict, verifier=lambda entry, key: False, root_cache=cache)
+    assert len(cache) == 0
+
+    _validate(verdict, root_cache=cache)
+    assert len(cache) == 1 and cache.misses == 3
+    with pytest.raises(ValueError, match="max_entries must be positive"):
+        VerifiedRootCache(max_entries=0)
+
+
+def test_batched_envelopes_are_not_plain_envelopes() -> None:
+    verdict = sign_verdict_batch(_payloads(2), sign_root=_test_root_signer([]))[0]
+    with pytest.raises(ValueError, match="fields must match required schema"):
+        validate_crypto_verdict_envelope(
+            verdict,
+            expected_context_hash=HASH_A,
+            trust_profile=build_test_trust_profile(),
+            verification_time=VERIFY_AT,
+            verifier=verify_test_only_signature,
+        )
+    plain = {key: value for key, value in verdict.items() if key != "merkle_proof"}
+    with pytest.raises(ValueError, match="batched verdict fields must match required schema"):
+        _validate(plain)
+    with pytest.raises(ValueError, match="must be dict"):
+        _validate([])  # type: ignore[arg-type]
+
+
+def _tampered(mutate) -> dict:
+    verdict = copy.deepcopy(sign_verdict_batch(_payloads(5), sign_root=_test_root_signer([]))[2])
+    mutate(verdict)
+    return verdict
+
+
+@pytest.mark.parametrize(
+    ("mutate", "message"),
+    [
+        (lambda v: v.update(decision="DENY"), "signed payload hash mismatch"),
+        (lambda v: v.update(merkle_proof=[]), "merkle proof fields"),
+        (lambda v: v["merkle_proof"].pop("root"), "merkle proof fields"),
+        (lambda v: v["merkle_proof"].update(schema_version="x"), "merkle proof schema mismatch"),
+        (lambda v: v["merkle_proof"].update(leaf_index=3), "merkle root mismatch"),
+        (lambda v: v["merkle_proof"].update(leaf_index=-1), "leaf_index must be non-negative"),
+        (lambda v: v["merkle_proof"].update(leaf_index=True), "leaf_index must be non-negative"),
+        (lambda v: v["merkle_proof"].update(leaf_index=5), "leaf_index out of range"),
+        (lambda v: v["merkle_proof"].update(leaf_count=0), "leaf_count must be positive"),
+        (lambda v: v["merkle_proof"].update(leaf_count=MAX_BATCH_LEAVES + 1), "leaf_count too large"),
+        # Same path shape, so the root recomputes; the signed root hash binds leaf_count.
+        (lambda v: v["merkle_proof"].update(leaf_count=6), "signature signed_payload_hash mismatch"),
+        (lambda v: v["merkle_proof"].update(path="ab"), "merkle path must be list"),
+        (lambda v: v["merkle_proof"]["path"].pop(), "merkle path too short"),
+        (lambda v: v["merkle_proof"]["path"].append("c" * 64), "merkle path too long"),
+        (lambda v: v["merkle_proof"]["path"].__setitem__(0, "XYZ"), "merkle path entry"),
+        (lambda v: v["merkle_proof"]["path"].__setitem__(0, "c" * 64), "merkle root mismatch"),
+        (lambda v: v["merkle_proof"].update(root="c" * 64), "merkle root mismatch"),
+    ],
+)
+def test_tampered_proofs_fail_closed(mutate, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        _validate(_tampered(mutate))
+
+
+def test_consistent_forged_root_is_rejected_by_the_root_signature() -> None:
+    # A self-consistent proof into a different tree: only the root signature can catch it.
+    forged = _tampered(lambda v: None)
+    root, paths = merkle_tree_proofs([forged["signed_payload_hash"]] + _hashes(4))
+    forged["merkle_proof"].update(root=root, leaf_index=0, path=paths[0])
+
+    with pytest.raises(ValueError, match="signature signed_payload_hash mismatch"):
+        _validate(forged)
+
+
+def test_batch_input_is_checked() -> None:
+    with pytest.raises(ValueError, match="merkle batch must not be empty"):
+        sign_verdict_batch([], sign_root=_test_root_signer([]))
+    with pytest.raises(ValueError, match="payload fields must match required schema"):
+        sign_verdict_batch([{"request_id": "x"}], sign_root=_test_root_signer([]))
+    with pytest.raises(ValueError, match="merkle batch too large"):
+        merkle_tree_proofs(["a" * 64] * (MAX_BATCH_LEAVES + 1))
+    with pytest.raises(ValueError, match="merkle root must be 64-character"):
+        merkle_batch_root_hash(root="abc", leaf_count=1)
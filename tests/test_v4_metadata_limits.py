@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from adn_v3.v4.crypto_verdict import (
+    DEFAULT_METADATA_LIMITS,
+    MetadataLimits,
+    build_unsigned_crypto_verdict_payload,
+    contains_forbidden_metadata_authority,
+    validate_crypto_verdict_envelope,
+    validate_metadata,
+)
+from adn_v3.v4.merkle_batch import sign_verdict_batch, validate_batched_crypto_verdict_envelope
+from adn_v3.v4.signing import build_test_signature_entry, verify_test_only_signature
+from adn_v3.v4.trust_profile import CLASSICAL_ED25519, ML_DSA, build_test_trust_profile
+
+from tests.test_v4_crypto_verdict_contract import HASH_A, VERIFY_AT, signed_verdict, unsigned_payload
+
+METADATA = {
+    "pilot": "adn-v4",
+    "nested": {"safe": True, "off": False, "empty": {}, "list": [1, -20, 300, []]},
+    "codes": ["a", "bb"],
+    "big": 2**64,
+}
+
+
+def _deep(depth: int) -> dict:
+    value: dict = {}
+    for _ in range(depth - 1):
+        value = {"n": value}
+    return value
+
+
+def _compact_size(value: dict) -> int:
+    return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def _payload_kwargs() -> dict:
+    payload = unsigned_payload()
+    return {
+        field: payload[field]
+        for field in (
+            "request_id",
+            "context_hash",
+            "freshness_nonce",
+            "not_before",
+            "not_after",
+            "decision",
+            "reason_ids",
+            "evidence_hash",
+            "evidence_families",
+            "metadata",
+            "key_registry_version",
+        )
+    }
+
+
+def test_byte_budget_is_the_compact_json_size() -> None:
+    size = _compact_size(METADATA)
+    assert validate_metadata(METADATA, limits=MetadataLimits(max_bytes=size)) is METADATA
+    with pytest.raises(ValueError, match="metadata exceeds max_bytes"):
+        validate_metadata(METADATA, limits=MetadataLimits(max_bytes=size - 1))
+
+    unicode_metadata = {"é": "ĳ" * 10}
+    size = _compact_size(unicode_metadata)
+    validate_metadata(unicode_metadata, limits=MetadataLimits(max_bytes=size))
+    with pytest.raises(ValueError, match="metadata exceeds max_bytes"):
+        validate_metadata(unicode_metadata, limits=MetadataLimits(max_bytes=size - 1))
+
+
+@pytest.mark.parametrize(
+    ("metadata", "limits", "message"),
+    [
+        (_deep(16), DEFAULT_METADATA_LIMITS, None),
+        (_deep(17), DEFAULT_METADATA_LIMITS, "max_depth"),
+        ({"list": [[[]]]}, MetadataLimits(max_depth=3), "max_depth"),
+        ({"k": list(range(1023))}, DEFAULT_METADATA_LIMITS, "max_nodes"),
+        ({f"k{i}": i for i in range(1023)}, MetadataLimits(max_bytes=10**6), None),
+        ({f"k{i}": i for i in range(1024)}, MetadataLimits(max_bytes=10**6), "max_nodes"),
+        ({"k": "x" * 4096}, DEFAULT_METADATA_LIMITS, None),
+        ({"k": "x" * 4097}, DEFAULT_METADATA_LIMITS, "max_string_length"),
+        ({"x" * 4097: 1}, DEFAULT_METADATA_LIMITS, "max_string_length"),
+        ({"k": None, "f": 1.5}, DEFAULT_METADATA_LIMITS, None),
+        ({1: "x"}, DEFAULT_METADATA_LIMITS, "keys must be strings"),
+        ({"outer": [{"safe": {"override": True}}]}, DEFAULT_METADATA_LIMITS, "forbidden authority"),
+        ([], DEFAULT_METADATA_LIMITS, "metadata must be dict"),
+    ],
+)
+def test_each_budget_fails_closed(metadata, limits: MetadataLimits, message: str | None) -> None:
+    if message is None:
+        assert validate_metadata(metadata, limits=limits) is metadata
+    else:
+        with pytest.raises(ValueError, match=message):
+            validate_metadata(metadata, limits=limits)
+
+
+def test_hostile_metadata_is_rejected_before_it_is_walked() -> None:
+    # Far past the recursion limit and far beyond any budget: no RecursionError, no full walk.
+    with pytest.raises(ValueError, match="max_depth"):
+        validate_metadata(_deep(200_000))
+    with pytest.raises(ValueError, match="max_nodes"):
+        validate_metadata({"k": [0] * 1_000_000})
+    with pytest.raises(ValueError, match="max_bytes"):
+        validate_metadata({f"{i:0>4000}": 0 for i in range(1000)})
+
+
+def test_single_pass_agrees_with_the_authority_scan() -> None:
+    for metadata in ({"outer": [{"safe": True}]}, {"outer": [{"safe": {"override": True}}]}, {"decision": "ALLOW"}):
+        try:
+            validate_metadata(metadata)
+            rejected = False
+        except ValueError:
+            rejected = True
+        assert rejected is contains_forbidden_metadata_authority(metadata)
+
+
+def test_limits_must_be_positive_integers() -> None:
+    with pytest.raises(ValueError, match="max_depth"):
+        MetadataLimits(max_depth=0)
+    with pytest.raises(ValueError, match="max_bytes"):
+        MetadataLimits(max_bytes=True)
+
+
+def test_builders_and_validators_take_custom_limits() -> None:
+    tight = MetadataLimits(max_nodes=2)
+    with pytest.raises(ValueError, match="max_nodes"):
+        build_unsigned_crypto_verdict_payload(**{**_payload_kwargs(), "metadata_limits": tight})
+
+    kwargs = {
+        "expected_context_hash": HASH_A,
+        "trust_profile": build_test_trust_profile(),
+        "verification_time": VERIFY_AT,
+        "verifier": verify_test_only_signature,
+    }
+    verdict = signed_verdict()
+    validate_crypto_verdict_envelope(verdict, **kwargs)
+    with pytest.raises(ValueError, match="max_nodes"):
+        validate_crypto_verdict_envelope(verdict, metadata_limits=tight, **kwargs)
+
+    batched = sign_verdict_batch(
+        [unsigned_payload()],
+        sign_root=lambda digest: [build_test_signature_entry(algorithm=a, signed_hash=digest) for a in (CLASSICAL_ED25519, ML_DSA)],
+    )[0]
+    validate_batched_crypto_verdict_envelope(batched, **kwargs)
+    with pytest.raises(ValueError, match="max_nodes"):
+        validate_batched_crypto_verdict_envelope(batched, metadata_limits=tight, **kwargs)
+
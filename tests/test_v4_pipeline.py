@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from itertools import count
+
+import pytest
+
+from adn_v3 import ADNv3
+from adn_v3.contracts.v3_2_lock import build_verdict
+from adn_v3.v4.crypto_verdict import (
+    build_signed_crypto_verdict_envelope,
+    build_unsigned_crypto_verdict_payload,
+    validate_crypto_verdict_envelope,
+)
+from adn_v3.v4.pipeline import VerdictPipeline, lock_verdict_from_response, unsigned_payload_from_lock_verdict
+from adn_v3.v4.signing import build_signature_bundle, build_test_signature_entry, verify_test_only_signature
+from adn_v3.v4.trust_profile import CLASSICAL_ED25519, ML_DSA, build_test_trust_profile
+
+from tests.test_v4_crypto_verdict_contract import HASH_A, HASH_B
+
+START = datetime(2026, 6, 21, tzinfo=timezone.utc)
+
+
+def _request(i: int, severity: float = 0.0) -> dict:
+    return {
+        "contract_version": 3,
+        "component": "adn",
+        "request_id": f"req-{i}",
+        "events": [{"event_type": "rpc_abuse", "severity": severity, "source": "local"}],
+    }
+
+
+def _sign(digest: str) -> list[dict]:
+    return [build_test_signature_entry(algorithm=algorithm, signed_hash=digest) for algorithm in (CLASSICAL_ED25519, ML_DSA)]
+
+
+def _pipeline(**kwargs) -> VerdictPipeline:
+    nonces = count()
+    kwargs.setdefault("signer", _sign)
+    return VerdictPipeline(
+        key_registry_version=1,
+        clock=lambda: START,
+        nonce_factory=lambda: f"nonce-{next(nonces)}",
+        **kwargs,
+    )
+
+
+def _validate(envelope: dict) -> dict:
+    return validate_crypto_verdict_envelope(
+        envelope,
+        expected_context_hash=envelope["context_hash"],
+        trust_profile=build_test_trust_profile(),
+        verification_time="2026-06-21T00:01:00Z",
+        verifier=verify_test_only_signature,
+    )
+
+
+@pytest.mark.parametrize(
+    ("severity", "decision", "reason_id", "families"),
+    [
+        (0.0, "ALLOW", "ADN_OK_COORDINATION_ALLOW", ["defense_signal", "policy_context"]),
+        (0.5, "ESCALATE", "ADN_ESCALATE_POLICY_REVIEW", ["coordination_state", "defense_signal", "policy_context"]),
+        (0.95, "DENY", "ADN_DENY_DEFENSE_TRIGGERED", ["coordination_state", "defense_signal", "policy_context"]),
+    ],
+)
+def test_pipeline_envelope_matches_the_stage_by_stage_chain(severity, decision, reason_id, families) -> None:
+    result = _pipeline().sign_request(_request(1, severity))
+
+    response = ADNv3().evaluate(_request(1, severity))
+    lock = lock_verdict_from_response(response)
+    payload = build_unsigned_crypto_verdict_payload(
+        request_id=lock["request_id"],
+        context_hash=lock["context_hash"],
+        freshness_nonce="nonce-0",
+        not_before="2026-06-21T00:00:00Z",
+        not_after="2026-06-21T00:05:00Z",
+        decision=lock["decision"],
+        reason_ids=lock["reason_ids"],
+        evidence_hash=lock["evidence_hash"],
+        evidence_families=lock["evidence_families"],
+        metadata=lock["metadata"],
+        key_registry_version=1,
+    )
+    expected = build_signed_crypto_verdict_envelope(unsigned_payload=payload, signature_bundle=build_signature_bundle(signatures=[]))
+
+    assert result.ok and result.error is None and result.response == response
+    assert {**result.envelope, "signature_bundle": None} == {**expected, "signature_bundle": None}
+    assert (payload["decision"], payload["reason_ids"], payload["evidence_families"]) == (decision, [reason_id], families)
+    assert payload["context_hash"] == response["context_hash"]
+    assert _validate(result.envelope)["verification_summary"]["verified_algorithms"] == [CLASSICAL_ED25519, ML_DSA]
+
+
+def test_error_responses_are_signed_as_error_verdicts() -> None:
+    result = _pipeline().sign_request({"request_id": "bad"})
+
+    assert result.response["decision"] == "ERROR"
+    assert result.envelope["decision"] == "ERROR"
+    assert result.envelope["reason_ids"] == ["ADN_ERROR_INVALID_VERDICT"]
+    _validate(result.envelope)
+
+
+@pytest.mark.parametrize(
+    ("options", "total"),
+    [
+        ({"sign_workers": 1, "chunk_size": 1}, 7),
+        ({"evaluate_workers": 2, "sign_workers": 3, "chunk_size": 2}, 25),
+    ],
+)
+def test_batches_keep_input_order_inline_and_across_processes(options, total) -> None:
+    requests = [_request(i, (i % 10) / 10) for i in range(total)]
+
+    results = _pipeline(**options).sign_batch(requests)
+
+    assert [r.request_id for r in results] == [f"req-{i}" for i in range(total)]
+    assert [r.envelope["freshness_nonce"] for r in results] == [f"nonce-{i}" for i in range(total)]
+    assert results[-1].response == ADNv3().evaluate(requests[-1])
+    for result in results:
+        _validate(result.envelope)
+
+
+def test_per_request_failures_fail_closed_without_stopping_the_batch() -> None:
+    def flaky(digest: str) -> list[dict]:
+        if flaky.calls == 1:
+            flaky.calls += 1
+            raise RuntimeError("hsm offline")
+        flaky.calls += 1
+        return _sign(digest) if flaky.calls != 3 else _sign("c" * 64)
+
+    flaky.calls = 0
+    requests = [_request(0), _request(1), _request(2), {"request_id": " "}, _request(4)]
+    results = _pipeline(signer=flaky, sign_workers=1).sign_batch(requests)
+
+    assert [r.ok for r in results] == [True, False, False, False, True]
+    assert results[1].error == "RuntimeError: hsm offline"
+    assert "different signed_payload_hash" in results[2].error
+    assert results[3].error == "request_id must be non-empty str"
+
+
+@pytest.mark.parametrize("returned", [[], None, ["not-a-dict"]])
+def test_signer_output_is_checked(returned) -> None:
+    result = _pipeline(signer=lambda digest: returned).sign_request(_request(0))
+    assert result.envelope is None and result.error.startswith("ValueError: signer")
+
+
+def test_default_clock_and_nonce_stamp_a_current_window() -> None:
+    before = datetime.now(timezone.utc).replace(microsecond=0)
+    envelope = VerdictPipeline(signer=_sign, key_registry_version=2).sign_request(_request(0)).envelope
+
+    not_before = datetime.fromisoformat(envelope["not_before"][:-1] + "+00:00")
+    assert before <= not_before <= datetime.now(timezone.utc)
+    assert envelope["not_after"] == (not_before + timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert len(envelope["freshness_nonce"]) == 32
+    assert envelope["key_registry_version"] == 2
+
+
+def test_mapping_and_configuration_fail_closed() -> None:
+    response = ADNv3().evaluate(_request(0))
+    with pytest.raises(ValueError, match="unsupported ADN v3 decision"):
+        lock_verdict_from_response({**response, "decision": "MAYBE"})
+
+    lock = build_verdict(
+        request_id="r",
+        context_hash=HASH_A,
+        decision="ALLOW",
+        reason_ids=["ADN_OK_COORDINATION_ALLOW"],
+        evidence_hash=HASH_B,
+        evidence_families=["defense_signal"],
+        metadata={"nested": {"override": True}},
+    )
+    window = {"not_before": "2026-06-21T00:00:00Z", "not_after": "2026-06-21T00:05:00Z"}
+    with pytest.raises(ValueError, match="forbidden authority field"):
+        unsigned_payload_from_lock_verdict(lock, freshness_nonce="n", key_registry_version=1, **window)
+
+    with pytest.raises(ValueError, match="must be positive"):
+        VerdictPipeline(signer=_sign, key_registry_version=1, sign_workers=0)
+    with pytest.raises(ValueError, match="validity must be positive"):
+        VerdictPipeline(signer=_sign, key_registry_version=1, validity=timedelta(0))
+    with pytest.raises(ValueError, match="key_registry_version"):
+        VerdictPipeline(signer=_sign, key_registry_version=0)
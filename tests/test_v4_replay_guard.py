@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from adn_v3.v4.crypto_verdict import validate_crypto_verdict_envelope
+from adn_v3.v4.merkle_batch import sign_verdict_batch, validate_batched_crypto_verdict_envelope
+from adn_v3.v4.replay import ReplayGuard
+from adn_v3.v4.signing import build_test_signature_entry, verify_test_only_signature
+from adn_v3.v4.trust_profile import CLASSICAL_ED25519, ML_DSA, build_test_trust_profile
+
+from tests.test_v4_crypto_verdict_contract import HASH_A, NOT_AFTER, VERIFY_AT, signed_verdict, unsigned_payload
+
+
+def _check(guard: ReplayGuard, nonce: str, *, at: str = "2026-06-21T00:01:00Z", not_after: str = NOT_AFTER) -> None:
+    guard.check_and_record(freshness_nonce=nonce, not_after=not_after, verification_time=at)
+
+
+def _small_guard(**kwargs) -> ReplayGuard:
+    kwargs.setdefault("capacity", 1000)
+    kwargs.setdefault("key", bytes(16))
+    return ReplayGuard(**kwargs)
+
+
+def test_nonce_is_accepted_once() -> None:
+    guard = _small_guard()
+    _check(guard, "n-1")
+    _check(guard, "n-2")
+    with pytest.raises(ValueError, match="freshness_nonce replayed"):
+        _check(guard, "n-1")
+    assert guard.stats() == {
+        "accepted": 2,
+        "rejected": 1,
+        "exact_entries": 2,
+        "current_generation_entries": 2,
+        "previous_generation_entries": 0,
+        "bloom_bytes": 2 * len(guard._current.bits),
+        "saturated": False,
+    }
+
+
+def test_bloom_filter_catches_replays_evicted_from_the_exact_set() -> None:
+    guard = _small_guard(max_exact=1)
+    _check(guard, "n-1")
+    _check(guard, "n-2")
+    assert guard.stats()["exact_entries"] == 1
+    with pytest.raises(ValueError, match="freshness_nonce replayed"):
+        _check(guard, "n-1")
+
+
+def test_expired_and_over_long_windows_are_rejected() -> None:
+    guard = _small_guard(horizon=600)
+    with pytest.raises(ValueError, match="verdict expired"):
+        _check(guard, "late", at="2026-06-21T00:05:01Z")
+    with pytest.raises(ValueError, match="exceeds replay guard horizon"):
+        _check(guard, "long", not_after="2026-06-21T00:11:01Z")
+    _check(guard, "edge", at=NOT_AFTER)
+    assert guard.stats()["rejected"] == 2
+
+
+def test_generations_rotate_and_forget_only_expired_nonces() -> None:
+    guard = _small_guard(horizon=600)
+    _check(guard, "a", at="2026-06-21T00:09:00Z", not_after="2026-06-21T00:19:00Z")
+
+    # next generation: "a" is still unexpired and still remembered (previous filter)
+    _check(guard, "b", at="2026-06-21T00:10:30Z", not_after="2026-06-21T00:12:00Z")
+    with pytest.raises(ValueError, match="replayed"):
+        _check(guard, "a", at="2026-06-21T00:18:00Z", not_after="2026-06-21T00:19:00Z")
+    # clock going backwards does not rotate; the window is judged at the mark
+    with pytest.raises(ValueError, match="verdict expired"):
+        _check(guard, "c", at="2026-06-21T00:09:30Z", not_after="2026-06-21T00:12:00Z")
+    _check(guard, "c", at="2026-06-21T00:09:30Z", not_after="2026-06-21T00:19:00Z")
+
+    # two generations after "a": its filter is gone and expired exact entries are purged
+    _check(guard, "d", at="2026-06-21T00:20:00Z", not_after="2026-06-21T00:25:00Z")
+    stats = guard.stats()
+    assert (stats["previous_generation_entries"], stats["current_generation_entries"]) == (2, 1)
+    assert stats["exact_entries"] == 1
+    _check(guard, "a", at="2026-06-21T00:21:00Z", not_after="2026-06-21T00:25:00Z")
+
+    _check(guard, "e", at="2026-06-21T01:00:00Z", not_after="2026-06-21T01:05:00Z")
+    assert guard.stats()["previous_generation_entries"] == 0
+
+
+def test_earlier_verification_time_cannot_revive_a_forgotten_nonce() -> None:
+    guard = _small_guard(horizon=3600)
+    _check(guard, "n1", at="2026-06-21T00:00:00Z", not_after="2026-06-21T00:30:00Z")
+    # both Bloom generations rotate out and the exact entry is purged
+    _check(guard, "n2", at="2026-06-21T05:00:00Z", not_after="2026-06-21T05:30:00Z")
+    assert guard.stats()["exact_entries"] == 1
+    with pytest.raises(ValueError, match="verdict expired"):
+        _check(guard, "n1", at="2026-06-21T00:05:00Z", not_after="2026-06-21T00:30:00Z")
+    # an earlier time is still fine while the window is open at the mark
+    _check(guard, "n3", at="2026-06-21T04:50:00Z", not_after="2026-06-21T05:10:00Z")
+    assert guard.stats()["accepted"] == 3
+
+
+def test_false_positive_rate_stays_near_target() -> None:
+    guard = ReplayGuard(capacity=2000, false_positive_rate=0.01, max_exact=1, key=bytes(16))
+    # every nonce is fresh, so every rejection is a Bloom false positive
+    false_positives = 0
+    for i in range(2000):
+        try:
+            _check(guard, f"fresh-{i}")
+        except ValueError:
+            false_positives += 1
+    assert false_positives < 60
+    assert guard.stats()["saturated"] is False
+
+    # a second accept into a 29-bit filter may itself be a false positive; fill it directly
+    tiny = ReplayGuard(capacity=1, key=bytes(16))
+    _check(tiny, "x")
+    assert tiny.stats()["saturated"] is False
+    tiny._current.add(tiny._current.positions(bytes(16)))
+    assert tiny.stats()["saturated"] is True
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"horizon": 0}, "must be positive"),
+        ({"capacity": 0}, "must be positive"),
+        ({"max_exact": 0}, "must be positive"),
+        ({"false_positive_rate": 1.0}, "false_positive_rate"),
+        ({"key": b"short"}, "key must be 16 bytes"),
+    ],
+)
+def test_guard_configuration_is_checked(kwargs, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        ReplayGuard(**kwargs)
+
+
+def test_guard_input_is_checked() -> None:
+    guard = _small_guard()
+    with pytest.raises(ValueError, match="freshness_nonce must be non-empty"):
+        _check(guard, " ")
+    with pytest.raises(ValueError, match="not_after must be RFC3339"):
+        _check(guard, "n", not_after="2026-06-21T00:05:00")
+
+
+def test_validate_envelope_records_nonce_only_after_signatures_verify() -> None:
+    guard = _small_guard()
+    verdict = signed_verdict()
+    kwargs = {
+        "expected_context_hash": HASH_A,
+        "trust_profile": build_test_trust_profile(),
+        "verification_time": VERIFY_AT,
+        "replay_guard": guard,
+    }
+
+    with pytest.raises(ValueError, match="signature verification failed"):
+        validate_crypto_verdict_envelope(verdict, verifier=lambda entry, key: False, **kwargs)
+    assert guard.stats()["accepted"] == 0
+
+    validate_crypto_verdict_envelope(copy.deepcopy(verdict), verifier=verify_test_only_signature, **kwargs)
+    with pytest.raises(ValueError, match="freshness_nonce replayed"):
+        validate_crypto_verdict_envelope(verdict, verifier=verify_test_only_signature, **kwargs)
+
+
+def test_batched_envelopes_share_the_replay_guard() -> None:
+    payload = unsigned_payload()
+    verdicts = sign_verdict_batch(
+        [payload, {**payload, "request_id": "other"}],
+        sign_root=lambda digest: [build_test_signature_entry(algorithm=a, signed_hash=digest) for a in (CLASSICAL_ED25519, ML_DSA)],
+    )
+    guard = _small_guard()
+    kwargs = {
+        "expected_context_hash": HASH_A,
+        "trust_profile": build_test_trust_profile(),
+        "verification_time": VERIFY_AT,
+        "verifier": verify_test_only_signature,
+        "replay_guard": guard,
+    }
+
+    validate_batched_crypto_verdict_envelope(verdicts[0], **kwargs)
+    with pytest.raises(ValueError, match="freshness_nonce replayed"):
+        validate_batched_crypto_verdict_envelope(verdicts[1], **kwargs)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import unicodedata
+from typing import Any
+
+import pytest
+
+from adn_v3.v4.signing import parse_json_no_duplicate_keys, reject_duplicate_json_keys, to_canonical_json
+
+from tests.test_v4_crypto_verdict_contract import signed_verdict
+
+
+def _reference_hook(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for key, value in pairs:
+        clean_key = unicodedata.normalize("NFC", key)
+        if clean_key in result:
+            raise ValueError("json contains duplicate key")
+        result[clean_key] = value
+    return result
+
+
+def _reference_parse(raw_json: Any) -> dict[str, Any]:
+    parsed = json.loads(raw_json, object_pairs_hook=_reference_hook)
+    if not isinstance(parsed, dict):
+        raise ValueError("json root must be object")
+    return parsed
+
+
+def _outcome(parse, raw_json: Any) -> tuple[str, Any]:
+    try:
+        return "ok", parse(raw_json)
+    except ValueError as exc:
+        return type(exc).__name__, str(exc)
+
+
+CASES = [
+    to_canonical_json(signed_verdict()),
+    json.dumps(signed_verdict(), indent=2),
+    '{"a":1,"a":2}',
+    '{"a":{"b":[{"c":1,"c":1}]}}',
+    '{"a":1,"\\u0061":2}',
+    '{"\\u00e9":1,"e\\u0301":2}',
+    '{"e\\u0301":1}',
+    '{"café":{"x":1}}',
+    '{"a" : "x\\":", "b\\"" :[":", "\\\\"], "c":"\\\\\\":"}',
+    '{"v":"\\":1,\\"v\\":2"}',
+    '["p", ":", {"a":1}]',
+    '{"k":[":",":"],"j":{}}',
+    '{"a":1,"a":2,]',
+    '{"a":1',
+    "null",
+    '"text"',
+    "",
+    b'{"a":1}',
+    b'{"a":1,"a":2}',
+    '{"n":1e400,"m":-0,"t":true,"f":false,"z":null}',
+]
+
+
+@pytest.mark.parametrize("raw_json", CASES)
+def test_results_and_errors_match_the_hook_parser(raw_json: Any) -> None:
+    assert _outcome(parse_json_no_duplicate_keys, raw_json) == _outcome(_reference_parse, raw_json)
+
+
+def test_non_ascii_keys_are_nfc_normalized() -> None:
+    assert list(parse_json_no_duplicate_keys('{"e\\u0301":1}')) == ["é"]
+    with pytest.raises(ValueError, match="duplicate key"):
+        parse_json_no_duplicate_keys('{"é":1,"é":2}')
+
+
+def test_key_order_is_preserved() -> None:
+    raw_json = '{"z":1,"a":{"y":2,"b":3}}'
+    parsed = parse_json_no_duplicate_keys(raw_json)
+    assert list(parsed) == ["z", "a"] and list(parsed["a"]) == ["y", "b"]
+
+
+def test_hook_accepts_any_iterable_of_pairs() -> None:
+    assert reject_duplicate_json_keys(iter([("b", 1), ("e\u0301", 2)])) == {"b": 1, "é": 2}
+    with pytest.raises(ValueError, match="duplicate key"):
+        reject_duplicate_json_keys((("a", 1), ("a", 2)))